@@ -2,17 +2,26 @@
 
 """ Address API  For  Handeling HTTP Endpoints """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
-from app.database.session import get_db
-from app.services.address_service import AddressService
-from app.schemas.address_schema import AddressCreate, AddressUpdate
+from app.database.session import get_db, SessionLocal
+from app.services.address_service import AddressService, address_cache, nearby_cache
+from app.schemas.address_schema import AddressCreate, AddressUpdate, AddressBulkUpdate, AddressBulkDelete
 from app.core.responses import SuccessResponse
-from app.core.responses import PaginatedSuccessResponse, AddressResponse, PaginatedMeta
+from app.core.responses import PaginatedSuccessResponse, PaginatedFieldsResponse, AddressResponse
+from app.core.responses import FastJSONResponse, paginated_envelope, address_data
+from app.core.responses import NearestSuccessResponse, AddressDistanceResponse
 from math import ceil
-from fastapi import Query
+from fastapi import Query, Body
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from app.utils.export import MEDIA_TYPES
+from typing import Any
+from app.core.config import BULK_MAX_ITEMS, IMPORT_CHUNK_SIZE
+from app.core.profiling import ROUTE_CLASS
+from app.utils.etag import make_etag, etag_matches
 
-router = APIRouter(prefix="/addresses", tags=["Addresses"])
+router = APIRouter(prefix="/addresses", tags=["Addresses"], route_class=ROUTE_CLASS)
 
 
 @router.post("/")
@@ -29,7 +38,67 @@ def create_address(data: AddressCreate, db: Session = Depends(get_db)):
     
     """
     result = AddressService.create(db, data)
-    return SuccessResponse(data=result, message="Created successfully").dict()
+    return FastJSONResponse(SuccessResponse(data=address_data(result), message="Created successfully").dict())
+
+
+@router.post("/bulk")
+def bulk_create_addresses(items: list[Any] = Body(..., max_length=BULK_MAX_ITEMS),
+                          db: Session = Depends(get_db)):
+    """
+    Create many addresses in one transaction.
+
+    Every item is validated like `POST /addresses/`; invalid items are
+    reported by index and skipped without aborting the valid ones.
+
+    Args:
+        items (list): Address payloads (AddressCreate fields)
+        db (Session): SQLAlchemy database session
+
+    Returns:
+        SuccessResponse: Created IDs (in payload order) and per-item errors
+    """
+    ids, errors = AddressService.bulk_create(db, items)
+
+    return SuccessResponse(
+        message="Bulk create completed",
+        data={"created": len(ids), "ids": ids, "failed": len(errors), "errors": errors}
+    ).dict()
+
+
+@router.patch("/bulk")
+def bulk_update_addresses(data: AddressBulkUpdate, db: Session = Depends(get_db)):
+    """
+    Apply the same field values to many addresses.
+
+    Addresses are selected by `ids` or by `city` and updated with chunked
+    `UPDATE ... WHERE id IN (...)` statements.
+
+    Args:
+        data (AddressBulkUpdate): Selection and values to set
+        db (Session): SQLAlchemy database session
+
+    Returns:
+        SuccessResponse: Number of updated addresses
+    """
+    updated = AddressService.bulk_update(db, data)
+    return SuccessResponse(message="Bulk update completed", data={"updated": updated}).dict()
+
+
+@router.delete("/bulk")
+def bulk_delete_addresses(data: AddressBulkDelete, db: Session = Depends(get_db)):
+    """
+    Delete many addresses selected by `ids` or by `city`, with chunked
+    `DELETE ... WHERE id IN (...)` statements.
+
+    Args:
+        data (AddressBulkDelete): Selection of addresses to delete
+        db (Session): SQLAlchemy database session
+
+    Returns:
+        SuccessResponse: Number of deleted addresses
+    """
+    deleted = AddressService.bulk_delete(db, data)
+    return SuccessResponse(message="Bulk delete completed", data={"deleted": deleted}).dict()
 
 
 @router.put("/{address_id}",)
@@ -51,49 +120,80 @@ def update_address(address_id: int,
 
     return SuccessResponse(
         message="Address updated successfully",
-        data=result
+        data=AddressResponse.model_validate(result)
     )
 
-@router.get("/list/", response_model=PaginatedSuccessResponse)
+@router.get("/list/", response_model=PaginatedSuccessResponse | PaginatedFieldsResponse)
 def list_addresses(
+    request: Request,
     db: Session = Depends(get_db),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
     search: str = Query(None, description="Search by name or city"),
-    sort_by: str = Query("id", description="Sort by field"),
-    sort_order: str = Query("asc", regex="^(asc|desc)$", description="Sort order")
+    sort_by: str = Query("id", description="Sort by id, name, street, city, latitude or longitude, "
+                                                "or 'relevance' for best search matches first"),
+    sort_order: str = Query("asc", regex="^(asc|desc)$", description="Sort order"),
+    cursor: str = Query(None, description="Cursor from meta.next_cursor; switches to keyset pagination"),
+    include_total: str = Query(None, regex="^(false|approx|exact)$",
+                               description="Total count: false, approx or exact (default exact, false with a cursor); "
+                                           "approx only applies without search"),
+    fields: str = Query(None, description="Comma-separated fields to return, e.g. id,latitude,longitude (default all)")
 ):
     """
     Retrieve a paginated list of addresses with optional search and sorting.
 
+    Without `cursor` pages are addressed by number (OFFSET). Passing the
+    `meta.next_cursor` of a previous response switches to keyset pagination,
+    where every page costs the same regardless of depth and the total count
+    is skipped unless `include_total` asks for it.
+
+    `include_total=approx` serves the total from cached counts or the row
+    count kept with the dataset version instead of running COUNT(*). It
+    only applies to unfiltered listings: with `search` the total is the
+    exact (cached) count.
+
+    Rows are selected as column tuples and encoded once by
+    FastJSONResponse; `response_model` only documents the envelope.
+
+    The response carries an ETag built from the dataset version and the
+    query parameters; a matching If-None-Match is answered with 304 Not
+    Modified without querying the addresses table.
+
     Args:
         db (Session): SQLAlchemy database session
         page (int): Current page number
         page_size (int): Number of items per page
         search (str, optional): Search term to filter addresses by name or city
-        sort_by (str): Field name to sort by
+            (word prefixes when the full-text index is available)
+        sort_by (str): Field name to sort by, or 'relevance'
         sort_order (str): Sorting order: 'asc' or 'desc'
+        cursor (str, optional): Keyset cursor of the page to fetch
+        include_total (str, optional): 'false', 'approx' or 'exact'
+        fields (str, optional): Comma-separated address fields to select and
+            return (PaginatedFieldsResponse), e.g. 'id,latitude,longitude'
 
     Returns:
         PaginatedSuccessResponse: Standardized response with pagination metadata and list of addresses
     """
-    
-    skip = (page - 1) * page_size
 
-    # Fetch paginated + filtered + sorted addresses from service
-    results, total = AddressService.get_all(db,skip=skip,limit=page_size,search=search,sort_by=sort_by,sort_order=sort_order)
+    fields = AddressService.parse_fields(fields)
+    sort_by = AddressService.parse_sort(sort_by)
 
-    total_pages = ceil(total / page_size) if total else 1
+    # page is ignored with a cursor, include_total defaults per mode
+    etag = make_etag(
+        AddressService.dataset_version(db), "list", None if cursor else page, page_size, search,
+        sort_by, sort_order, cursor, include_total or ("false" if cursor else "exact"), fields
+    )
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    results, meta = AddressService.list_page(
+        db, page=page, page_size=page_size, search=search, sort_by=sort_by,
+        sort_order=sort_order, cursor=cursor, include_total=include_total, fields=fields
+    )
 
-    return PaginatedSuccessResponse(
-        message="Addresses fetched successfully",
-        meta=PaginatedMeta(
-            page=page,
-            page_size=page_size,
-            total=total,
-            total_pages=total_pages
-        ),
-        data=[AddressResponse.from_orm(a) for a in results]
+    return FastJSONResponse(
+        paginated_envelope("Addresses fetched successfully", meta, results), headers={"ETag": etag}
     )
 
 @router.delete("/{address_id}")
@@ -112,19 +212,35 @@ def delete_address(address_id: int, db: Session = Depends(get_db)):
     AddressService.delete(db, address_id)
     return SuccessResponse(message="Deleted successfully").dict()
 
-@router.get("/nearby/", response_model=PaginatedSuccessResponse)
+@router.get("/nearby/", response_model=PaginatedSuccessResponse | PaginatedFieldsResponse)
 def nearby_addresses(
+    request: Request,
     lat: float = Query(..., description="Latitude of the center point"),
     lon: float = Query(..., description="Longitude of the center point"),
     distance: float = Query(..., description="Radius in kilometers to search"),
     db: Session = Depends(get_db),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Number of items per page"),
+    fields: str = Query(None, description="Comma-separated fields to return, e.g. id,latitude,longitude (default all)"),
 ):
     """
     Retrieve nearby addresses within a given distance from coordinates
     with pagination.
+
+    The page is read as column tuples and encoded by FastJSONResponse
+    (same envelope as PaginatedSuccessResponse).
+
+    `fields` limits the selected columns and the returned keys, e.g.
+    `fields=id,latitude,longitude` for map clients.
+
+    Conditional requests work as for `list_addresses` (ETag / If-None-Match).
     """
+    fields = AddressService.parse_fields(fields)
+
+    etag = make_etag(AddressService.dataset_version(db), "nearby", lat, lon, distance, page, page_size, fields)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
     skip = (page - 1) * page_size
 
     # Fetch all nearby addresses from service
@@ -134,30 +250,125 @@ def nearby_addresses(
         lon=lon,
         distance=distance,
         skip=skip,
-        limit=page_size
+        limit=page_size,
+        fields=fields
     )
 
     total_pages = ceil(total / page_size) if total else 1
-    
-    if not results:
-        return PaginatedSuccessResponse(
-            message="No nearby addresses found",
-            meta=PaginatedMeta(
-                page=page,
-                page_size=page_size,
-                total=total,
-                total_pages=total_pages
-            ),
-            data=[]
-        )
-
-    return PaginatedSuccessResponse(
-        message="Nearby addresses fetched successfully",
-        meta=PaginatedMeta(
-            page=page,
-            page_size=page_size,
-            total=total,
-            total_pages=total_pages
-        ),
-        data=[AddressResponse.from_orm(a) for a in results]
+
+    return FastJSONResponse(paginated_envelope(
+        "Nearby addresses fetched successfully" if results else "No nearby addresses found",
+        {"page": page, "page_size": page_size, "total": total, "total_pages": total_pages},
+        results
+    ), headers={"ETag": etag})
+
+
+@router.get("/nearest/", response_model=NearestSuccessResponse)
+def nearest_addresses(
+    lat: float = Query(..., ge=-90, le=90, description="Latitude of the center point"),
+    lon: float = Query(..., ge=-180, le=180, description="Longitude of the center point"),
+    k: int = Query(10, ge=1, le=100, description="Number of closest addresses to return"),
+    db: Session = Depends(get_db),
+):
+    """
+    Retrieve the k addresses closest to the given coordinates,
+    ordered by distance (in kilometers).
+    """
+    results = AddressService.nearest(db, lat=lat, lon=lon, k=k)
+
+    return NearestSuccessResponse(
+        message="Nearest addresses fetched successfully" if results else "No addresses found",
+        data=[
+            AddressDistanceResponse(**AddressResponse.model_validate(a).model_dump(), distance_km=round(d, 3))
+            for a, d in results
+        ]
     )
+
+def _export_stream(fmt, search, sort_by, sort_order):
+    # Own session: it must stay open until the last chunk has been sent
+    db = SessionLocal()
+    try:
+        yield from AddressService.export(db, fmt, search=search, sort_by=sort_by, sort_order=sort_order)
+    finally:
+        db.close()
+
+
+@router.get("/export")
+def export_addresses(
+    format: str = Query("ndjson", regex="^(ndjson|csv)$", description="Export format"),
+    search: str = Query(None, description="Search by name or city"),
+    sort_by: str = Query("id", description="Sort by id, name, street, city, latitude or longitude, "
+                                                "or 'relevance' for best search matches first"),
+    sort_order: str = Query("asc", regex="^(asc|desc)$", description="Sort order"),
+):
+    """
+    Stream every address matching the filters as NDJSON or CSV.
+
+    The response is produced from a server-side cursor while it is being
+    sent, so memory use does not depend on the table size.
+    """
+    # validated before the response starts streaming
+    sort_by = AddressService.parse_sort(sort_by)
+
+    return StreamingResponse(
+        _export_stream(format, search, sort_by, sort_order),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f"attachment; filename=addresses.{format}"}
+    )
+
+
+@router.post("/import")
+async def import_addresses(
+    request: Request,
+    format: str = Query("ndjson", regex="^(ndjson|csv)$", description="Upload format"),
+    chunk_size: int = Query(IMPORT_CHUNK_SIZE, ge=1, le=BULK_MAX_ITEMS, description="Rows committed per chunk"),
+    db: Session = Depends(get_db),
+):
+    """
+    Import addresses from an NDJSON or CSV request body.
+
+    The body is parsed while it is being received and committed every
+    `chunk_size` rows; CSV uploads need a header row with the AddressCreate
+    field names. Invalid rows are reported by line number and skipped.
+
+    Args:
+        request (Request): Incoming request whose body is streamed
+        format (str): 'ndjson' or 'csv'
+        chunk_size (int): Rows validated and committed per transaction
+        db (Session): SQLAlchemy database session
+
+    Returns:
+        SuccessResponse: Import report with counts and per-line errors
+    """
+    report = await AddressService.import_stream(
+        request.stream(), format,
+        lambda records: run_in_threadpool(AddressService.import_chunk, db, records),
+        chunk_size=chunk_size
+    )
+    return SuccessResponse(message="Import completed", data=report).dict()
+
+
+@router.get("/cache/stats")
+def cache_stats():
+    """
+    Hit/miss counters of the address, list page and nearby caches.
+    """
+    return SuccessResponse(message="Cache stats fetched successfully", data={**address_cache.stats(), "nearby": nearby_cache.stats()}).dict()
+
+
+@router.get("/{address_id}")
+def get_address(address_id: int, db: Session = Depends(get_db)):
+    """
+    Retrieve an address by its ID.
+
+    Served from the response cache until a write touches the address.
+
+    Args:
+        address_id (int): ID of the address to fetch
+        db: Database session
+
+    Returns:
+        SuccessResponse: Standardized success response with the address
+    """
+    result = AddressService.get(db, address_id)
+    return SuccessResponse(message="Address fetched successfully", data=result).dict()
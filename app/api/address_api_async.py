@@ -0,0 +1,294 @@
+# app/api/address_api_async.py
+
+""" Async Address API For Handeling HTTP Endpoints (DATABASE_MODE 'async') """
+
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database.session import get_async_db, SessionLocal
+from app.services.address_service_async import AsyncAddressService
+from app.services.address_service import AddressService, address_cache, nearby_cache
+from app.schemas.address_schema import AddressCreate, AddressUpdate, AddressBulkUpdate, AddressBulkDelete
+from app.core.responses import SuccessResponse
+from app.core.responses import PaginatedSuccessResponse, PaginatedFieldsResponse, AddressResponse
+from app.core.responses import FastJSONResponse, paginated_envelope, address_data
+from app.core.responses import NearestSuccessResponse, AddressDistanceResponse
+from math import ceil
+from fastapi import Query, Body
+from fastapi.responses import StreamingResponse
+from app.utils.export import MEDIA_TYPES
+from typing import Any
+from app.core.config import BULK_MAX_ITEMS, IMPORT_CHUNK_SIZE
+from app.core.profiling import ROUTE_CLASS
+from app.utils.etag import make_etag, etag_matches
+
+router = APIRouter(prefix="/addresses", tags=["Addresses"], route_class=ROUTE_CLASS)
+
+
+@router.post("/")
+async def create_address(data: AddressCreate, db: AsyncSession = Depends(get_async_db)):
+    """
+    Create a new address.
+
+    Args:
+        data (AddressCreate): Address data payload
+        db (AsyncSession): Async database session
+
+    Returns:
+        SuccessResponse: Standardized success response with created address
+    """
+    result = await AsyncAddressService.create(db, data)
+    return FastJSONResponse(SuccessResponse(data=address_data(result), message="Created successfully").dict())
+
+
+@router.post("/bulk")
+async def bulk_create_addresses(items: list[Any] = Body(..., max_length=BULK_MAX_ITEMS),
+                                db: AsyncSession = Depends(get_async_db)):
+    """
+    Create many addresses in one transaction (see the sync `bulk_create_addresses`).
+    """
+    ids, errors = await db.run_sync(AddressService.bulk_create, items)
+
+    return SuccessResponse(
+        message="Bulk create completed",
+        data={"created": len(ids), "ids": ids, "failed": len(errors), "errors": errors}
+    ).dict()
+
+
+@router.patch("/bulk")
+async def bulk_update_addresses(data: AddressBulkUpdate, db: AsyncSession = Depends(get_async_db)):
+    """
+    Update many addresses with set-based SQL (see the sync `bulk_update_addresses`).
+    """
+    updated = await db.run_sync(AddressService.bulk_update, data)
+    return SuccessResponse(message="Bulk update completed", data={"updated": updated}).dict()
+
+
+@router.delete("/bulk")
+async def bulk_delete_addresses(data: AddressBulkDelete, db: AsyncSession = Depends(get_async_db)):
+    """
+    Delete many addresses with set-based SQL (see the sync `bulk_delete_addresses`).
+    """
+    deleted = await db.run_sync(AddressService.bulk_delete, data)
+    return SuccessResponse(message="Bulk delete completed", data={"deleted": deleted}).dict()
+
+
+@router.put("/{address_id}")
+async def update_address(address_id: int,
+                         data: AddressUpdate,
+                         db: AsyncSession = Depends(get_async_db)):
+    """ Update an existing address by its ID.
+
+    Args:
+        address_id (int): ID of the address to update
+        data (AddressUpdate): Updated address data
+        db (AsyncSession): Async database session
+
+    Returns:
+        SuccessResponse: Standardized success response with updated address
+    """
+    result = await AsyncAddressService.update(db, address_id, data)
+
+    return SuccessResponse(
+        message="Address updated successfully",
+        data=AddressResponse.model_validate(result)
+    )
+
+
+@router.get("/list/", response_model=PaginatedSuccessResponse | PaginatedFieldsResponse)
+async def list_addresses(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+    search: str = Query(None, description="Search by name or city"),
+    sort_by: str = Query("id", description="Sort by id, name, street, city, latitude or longitude, "
+                                                "or 'relevance' for best search matches first"),
+    sort_order: str = Query("asc", regex="^(asc|desc)$", description="Sort order"),
+    cursor: str = Query(None, description="Cursor from meta.next_cursor; switches to keyset pagination"),
+    include_total: str = Query(None, regex="^(false|approx|exact)$",
+                               description="Total count: false, approx or exact (default exact, false with a cursor); "
+                                           "approx only applies without search"),
+    fields: str = Query(None, description="Comma-separated fields to return, e.g. id,latitude,longitude (default all)")
+):
+    """
+    Retrieve a paginated list of addresses with optional search and sorting.
+
+    Same parameters and response as the sync `list_addresses`.
+    """
+    fields = AddressService.parse_fields(fields)
+    sort_by = AddressService.parse_sort(sort_by)
+
+    # page is ignored with a cursor, include_total defaults per mode
+    etag = make_etag(
+        await AsyncAddressService.dataset_version(db), "list", None if cursor else page, page_size, search,
+        sort_by, sort_order, cursor, include_total or ("false" if cursor else "exact"), fields
+    )
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    results, meta = await AsyncAddressService.list_page(
+        db, page=page, page_size=page_size, search=search, sort_by=sort_by,
+        sort_order=sort_order, cursor=cursor, include_total=include_total, fields=fields
+    )
+
+    return FastJSONResponse(
+        paginated_envelope("Addresses fetched successfully", meta, results), headers={"ETag": etag}
+    )
+
+
+@router.delete("/{address_id}")
+async def delete_address(address_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Delete an address by its ID.
+
+    Args:
+        address_id (int): ID of the address to delete
+        db (AsyncSession): Async database session
+
+    Returns:
+        SuccessResponse: Standardized success response confirming deletion
+    """
+    await AsyncAddressService.delete(db, address_id)
+    return SuccessResponse(message="Deleted successfully").dict()
+
+
+@router.get("/nearby/", response_model=PaginatedSuccessResponse | PaginatedFieldsResponse)
+async def nearby_addresses(
+    request: Request,
+    lat: float = Query(..., description="Latitude of the center point"),
+    lon: float = Query(..., description="Longitude of the center point"),
+    distance: float = Query(..., description="Radius in kilometers to search"),
+    db: AsyncSession = Depends(get_async_db),
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(10, ge=1, le=100, description="Number of items per page"),
+    fields: str = Query(None, description="Comma-separated fields to return, e.g. id,latitude,longitude (default all)"),
+):
+    """
+    Retrieve nearby addresses within a given distance from coordinates
+    with pagination.
+    """
+    fields = AddressService.parse_fields(fields)
+
+    etag = make_etag(await AsyncAddressService.dataset_version(db), "nearby", lat, lon, distance, page, page_size, fields)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    skip = (page - 1) * page_size
+
+    results, total = await AsyncAddressService.nearby(
+        db,
+        lat=lat,
+        lon=lon,
+        distance=distance,
+        skip=skip,
+        limit=page_size,
+        fields=fields
+    )
+
+    total_pages = ceil(total / page_size) if total else 1
+
+    return FastJSONResponse(paginated_envelope(
+        "Nearby addresses fetched successfully" if results else "No nearby addresses found",
+        {"page": page, "page_size": page_size, "total": total, "total_pages": total_pages},
+        results
+    ), headers={"ETag": etag})
+
+
+@router.get("/nearest/", response_model=NearestSuccessResponse)
+async def nearest_addresses(
+    lat: float = Query(..., ge=-90, le=90, description="Latitude of the center point"),
+    lon: float = Query(..., ge=-180, le=180, description="Longitude of the center point"),
+    k: int = Query(10, ge=1, le=100, description="Number of closest addresses to return"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieve the k addresses closest to the given coordinates,
+    ordered by distance (in kilometers).
+    """
+    results = await AsyncAddressService.nearest(db, lat=lat, lon=lon, k=k)
+
+    return NearestSuccessResponse(
+        message="Nearest addresses fetched successfully" if results else "No addresses found",
+        data=[
+            AddressDistanceResponse(**AddressResponse.model_validate(a).model_dump(), distance_km=round(d, 3))
+            for a, d in results
+        ]
+    )
+
+def _export_stream(fmt, search, sort_by, sort_order):
+    # The export streams from the sync engine in the threadpool: a
+    # server-side cursor needs its session open for the whole response.
+    db = SessionLocal()
+    try:
+        yield from AddressService.export(db, fmt, search=search, sort_by=sort_by, sort_order=sort_order)
+    finally:
+        db.close()
+
+
+@router.get("/export")
+def export_addresses(
+    format: str = Query("ndjson", regex="^(ndjson|csv)$", description="Export format"),
+    search: str = Query(None, description="Search by name or city"),
+    sort_by: str = Query("id", description="Sort by id, name, street, city, latitude or longitude, "
+                                                "or 'relevance' for best search matches first"),
+    sort_order: str = Query("asc", regex="^(asc|desc)$", description="Sort order"),
+):
+    """
+    Stream every address matching the filters as NDJSON or CSV.
+
+    The response is produced from a server-side cursor while it is being
+    sent, so memory use does not depend on the table size.
+    """
+    # validated before the response starts streaming
+    sort_by = AddressService.parse_sort(sort_by)
+
+    return StreamingResponse(
+        _export_stream(format, search, sort_by, sort_order),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f"attachment; filename=addresses.{format}"}
+    )
+
+
+@router.post("/import")
+async def import_addresses(
+    request: Request,
+    format: str = Query("ndjson", regex="^(ndjson|csv)$", description="Upload format"),
+    chunk_size: int = Query(IMPORT_CHUNK_SIZE, ge=1, le=BULK_MAX_ITEMS, description="Rows committed per chunk"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Import addresses from an NDJSON or CSV request body, committed in
+    chunks (see the sync `import_addresses`).
+    """
+    report = await AddressService.import_stream(
+        request.stream(), format,
+        lambda records: db.run_sync(AddressService.import_chunk, records),
+        chunk_size=chunk_size
+    )
+    return SuccessResponse(message="Import completed", data=report).dict()
+
+
+@router.get("/cache/stats")
+def cache_stats():
+    """
+    Hit/miss counters of the address, list page and nearby caches.
+    """
+    return SuccessResponse(message="Cache stats fetched successfully", data={**address_cache.stats(), "nearby": nearby_cache.stats()}).dict()
+
+
+@router.get("/{address_id}")
+async def get_address(address_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    Retrieve an address by its ID.
+
+    Served from the response cache until a write touches the address.
+
+    Args:
+        address_id (int): ID of the address to fetch
+        db: Database session
+
+    Returns:
+        SuccessResponse: Standardized success response with the address
+    """
+    result = await AsyncAddressService.get(db, address_id)
+    return SuccessResponse(message="Address fetched successfully", data=result).dict()
@@ -0,0 +1,22 @@
+# app/api/metrics_api.py
+
+""" Metrics API Exposing Prometheus Text Format """
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.core.metrics import registry
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """
+    Current application metrics in the Prometheus text exposition format.
+
+    Returns:
+        PlainTextResponse: Request latency histograms, requests in flight,
+            SQL statement counts/durations and hydrated rows per route,
+            and response cache counters
+    """
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,467 @@
+# app/core/cache.py
+
+"""
+Process-Local Caches
+####################
+
+CacheBackend / LRUCache:
+    Key/value store interface behind the response caches, with an
+    in-process LRU + TTL implementation as the default. Another store
+    (e.g. Redis) only has to implement CacheBackend.
+
+AddressCache:
+    Read-through cache of single addresses (by id) and of listing pages.
+    A write drops the entries of the ids it touched and every cached page.
+
+NearbyCache:
+    Candidate id sets of nearby queries, keyed by the query point snapped
+    to a grid and the radius rounded up to a bucket. A write only drops the
+    entries whose area covers the grid cell it touched.
+
+CountCache:
+    Remembers COUNT(*) results of the paginated listing per normalized
+    search filter. The unfiltered total is adjusted in place on
+    create/delete; filtered totals are dropped on every write since a
+    change to name/city may move rows in or out of any filter.
+
+DatasetVersionGuard:
+    Keeps the caches of one worker consistent with the dataset version
+    shared by all workers: a version this process did not write itself
+    means another worker changed the table, and every cache is dropped.
+
+Caches are fed by the repository write notifications
+(see app/repo/address_events.py).
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from app.core.config import NEARBY_CACHE_SNAP_DEGREES, NEARBY_CACHE_RADIUS_GROWTH
+from app.utils.distance import haversine
+from app.utils.geo_grid import GRID_COLS, bounding_box, row_spans, grid_cell
+
+
+class CountCache:
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.generation = 0
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        """
+        Return the cached count for a filter key, or None.
+        """
+        return self._counts.get(key)
+
+    def set(self, key: str, value: int, generation: int):
+        """
+        Store a count computed while the cache was at `generation`.
+
+        Counts computed before a concurrent write committed are discarded.
+        """
+        with self._lock:
+            if generation != self.generation:
+                return
+            if key not in self._counts and len(self._counts) >= self.max_entries:
+                self._counts.pop(next(iter(self._counts)))
+            self._counts[key] = value
+
+    def clear(self):
+        """
+        Drop every cached count.
+        """
+        with self._lock:
+            self.generation += 1
+            self._counts.clear()
+
+    def apply(self, change):
+        """
+        Adjust or drop counts after a committed write (address_events listener).
+        """
+        with self._lock:
+            self.generation += 1
+
+            total = self._counts.get("")
+            self._counts.clear()
+
+            if total is None:
+                return
+            if change.action == "create":
+                self._counts[""] = total + len(change.after)
+            elif change.action == "delete":
+                self._counts[""] = total - len(change.before)
+            else:
+                self._counts[""] = total
+
+
+class CacheBackend:
+    """
+    Interface of a key/value store used by the response caches.
+
+    Implementations count hits and misses on `get` and report them, with
+    any backend-specific figures, from `stats`.
+    """
+
+    def get(self, key):
+        """
+        Return the value stored under `key`, or None when absent or expired.
+        """
+        raise NotImplementedError
+
+    def set(self, key, value):
+        """
+        Store `value` under `key`.
+        """
+        raise NotImplementedError
+
+    def delete(self, key):
+        """
+        Remove `key` if present.
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """
+        Remove every entry.
+        """
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        """
+        Counters of the backend ('hits', 'misses', ...).
+        """
+        raise NotImplementedError
+
+
+class LRUCache(CacheBackend):
+    """
+    In-process LRU cache whose entries also expire after `ttl_seconds`.
+
+    Args:
+        max_entries (int): Entries kept before the least recently used is evicted
+        ttl_seconds (float): Lifetime of an entry; 0 disables expiry
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] and entry[0] < time.monotonic():
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value):
+        expires = time.monotonic() + self.ttl_seconds if self.ttl_seconds else 0
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+        }
+
+
+class AddressCache:
+    """
+    Read-through cache of address responses.
+
+    Values are stored under a `generation`; a value read from the database
+    before a concurrent write committed is not stored.
+
+    Args:
+        items (CacheBackend): Single addresses keyed by id
+        pages (CacheBackend): Listing pages keyed by their query parameters
+    """
+
+    def __init__(self, items: CacheBackend, pages: CacheBackend):
+        self.items = items
+        self.pages = pages
+        self.generation = 0
+        self._lock = threading.Lock()
+
+    def _store(self, backend: CacheBackend, key, value, generation: int):
+        with self._lock:
+            if generation == self.generation:
+                backend.set(key, value)
+
+    def get_item(self, address_id: int):
+        return self.items.get(address_id)
+
+    def set_item(self, address_id: int, value, generation: int):
+        self._store(self.items, address_id, value, generation)
+
+    def get_page(self, key: tuple):
+        return self.pages.get(key)
+
+    def set_page(self, key: tuple, value, generation: int):
+        self._store(self.pages, key, value, generation)
+
+    def apply(self, change):
+        """
+        Drop the entries a committed write made stale (address_events listener).
+        """
+        with self._lock:
+            self.generation += 1
+            for address_id, _, _ in change.before + change.after:
+                self.items.delete(address_id)
+            self.pages.clear()
+
+    def clear(self):
+        """
+        Drop every cached address and page.
+        """
+        with self._lock:
+            self.generation += 1
+            self.items.clear()
+            self.pages.clear()
+
+    def stats(self) -> dict:
+        """
+        Hit/miss counters of both backends.
+        """
+        return {"items": self.items.stats(), "pages": self.pages.stats()}
+
+
+class NearbyCache:
+    """
+    Candidate sets of nearby queries.
+
+    A query (lat, lon, r) maps to the cell of a NEARBY_CACHE_SNAP_DEGREES
+    grid containing the point and to the smallest radius bucket (a power of
+    NEARBY_CACHE_RADIUS_GROWTH) >= r. The cached candidates are every
+    address within `bucket + reach` of the cell center, where `reach` is the
+    distance from the center to the cell's farthest corner, so they include
+    the exact result of any query mapping to the same key.
+
+    Every entry records the spatial-grid cells its area covers; a write
+    drops only the entries covering the cells of the rows it changed.
+
+    Args:
+        max_entries (int): Entries kept before the least recently used is evicted
+        max_candidates (int): Larger candidate sets are not cached
+    """
+
+    def __init__(self, max_entries: int = 1024, max_candidates: int = 50000):
+        self.max_entries = max_entries
+        self.max_candidates = max_candidates
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        # grid row -> {key: [(first_col, last_col), ...]}
+        self._rows = {}
+        # key -> grid rows it is indexed under
+        self._entry_rows = {}
+        # entries whose area is too large to index by grid row
+        self._wide = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def quantize(lat: float, lon: float, radius_km: float):
+        """
+        Cache key and candidate area of a nearby query.
+
+        Args:
+            lat (float): Latitude of the query point
+            lon (float): Longitude of the query point
+            radius_km (float): Query radius in kilometers
+
+        Returns:
+            Tuple[tuple, float, float, float] | None:
+                (key, center_lat, center_lon, candidate_radius_km), None
+                when the query cannot be cached (non-positive radius)
+        """
+        if not radius_km > 0:
+            return None
+
+        step = NEARBY_CACHE_SNAP_DEGREES
+        row, col = math.floor(lat / step), math.floor(lon / step)
+        bucket = math.ceil(math.log(radius_km, NEARBY_CACHE_RADIUS_GROWTH))
+
+        center_lat = min(max((row + 0.5) * step, -90.0), 90.0)
+        center_lon = (col + 0.5) * step
+        reach = max(
+            haversine(center_lat, center_lon, min(max(corner_lat, -90.0), 90.0), center_lon + d_lon)
+            for corner_lat in (row * step, (row + 1) * step)
+            for d_lon in (-step / 2, step / 2)
+        )
+        radius = NEARBY_CACHE_RADIUS_GROWTH ** bucket + reach
+
+        return (row, col, bucket), center_lat, center_lon, radius
+
+    def get(self, key: tuple):
+        """
+        Return the cached candidates of a key, or None.
+        """
+        with self._lock:
+            candidates = self._entries.get(key)
+            if candidates is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return candidates
+
+    def set(self, key: tuple, candidates, lat: float, lon: float, radius_km: float, generation: int):
+        """
+        Store the candidates gathered for a key while the cache was at
+        `generation`, covering the circle (lat, lon, radius_km).
+        """
+        if len(candidates[0]) > self.max_candidates:
+            return
+
+        spans = row_spans(bounding_box(lat, lon, radius_km))
+
+        with self._lock:
+            if generation != self.generation:
+                return
+
+            self._discard(key)
+            self._entries[key] = candidates
+            if spans is None:
+                self._wide.add(key)
+            else:
+                for row, first_col, last_col in spans:
+                    self._rows.setdefault(row, {}).setdefault(key, []).append((first_col, last_col))
+                self._entry_rows[key] = {row for row, _, _ in spans}
+
+            while len(self._entries) > self.max_entries:
+                self._discard(next(iter(self._entries)))
+
+    def _discard(self, key: tuple):
+        if self._entries.pop(key, None) is None:
+            return
+        self._wide.discard(key)
+        for row in self._entry_rows.pop(key, ()):
+            keys = self._rows[row]
+            keys.pop(key, None)
+            if not keys:
+                del self._rows[row]
+
+    def apply(self, change):
+        """
+        Drop the entries covering the cells of a committed write
+        (address_events listener).
+        """
+        cells = {
+            divmod(grid_cell(lat, lon), GRID_COLS)
+            for _, lat, lon in change.before + change.after
+        }
+
+        with self._lock:
+            self.generation += 1
+
+            stale = set(self._wide)
+            for row, col in cells:
+                for key, spans in self._rows.get(row, {}).items():
+                    if any(first <= col <= last for first, last in spans):
+                        stale.add(key)
+
+            for key in stale:
+                self._discard(key)
+            self.invalidations += len(stale)
+
+    def clear(self):
+        """
+        Drop every cached candidate set.
+        """
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._rows.clear()
+            self._entry_rows.clear()
+            self._wide.clear()
+
+    def stats(self) -> dict:
+        """
+        Hit/miss/invalidation counters.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "size": len(self._entries),
+        }
+
+
+class DatasetVersionGuard:
+    """
+    Tracks the dataset version the process-local caches are current at.
+
+    The caches only hear about writes made by this process. Every write
+    bumps the shared dataset version (see app/repo/dataset_version.py) and
+    publishes the new value: when it directly follows the tracked one the
+    caches have already patched themselves; any gap, or a version observed
+    in the database above the tracked one, means another process wrote to
+    the table and `clear` is called.
+
+    Args:
+        clear (callable): Drops every cache the guard protects
+    """
+
+    def __init__(self, clear):
+        self.version = None
+        self.resets = 0
+        self._clear = clear
+        self._lock = threading.Lock()
+
+    def _reset(self, version: int):
+        self._clear()
+        self.version = version
+        self.resets += 1
+
+    def observe(self, version: int):
+        """
+        Record the version just read from the database; drops the caches
+        if it is newer than any write this process knows about.
+        """
+        with self._lock:
+            if self.version is None or version > self.version:
+                self._reset(version)
+
+    def apply(self, change):
+        """
+        Follow the version of a committed write (address_events listener).
+        """
+        if change.version is None:
+            return
+        with self._lock:
+            if self.version is not None and change.version == self.version + 1:
+                self.version = change.version
+            else:
+                self._reset(change.version)
@@ -3,8 +3,124 @@
 Configuration for Address Book API.
     - APP_NAME: Name of the application
     - API_VERSION: Version of the API
+    - GRID_CELL_DEGREES: Size (in degrees) of one spatial grid cell
+    - NEARBY_MAX_GRID_RANGES: Max cell ranges a nearby query may probe
+      before relying on the bounding box alone
+    - GEO_SNAPSHOT_ENABLED: Keep an in-memory coordinate snapshot for nearby,
+      reloaded when another process writes (shared dataset version)
+    - GEO_SNAPSHOT_COMPACT_RATIO: Tombstone share that triggers compaction
+    - NEAREST_INITIAL_RADIUS_KM: First radius tried by the k-nearest search
+    - BULK_MAX_ITEMS: Max items accepted by one bulk request
+    - BULK_INSERT_BATCH_SIZE: Rows per multi-row INSERT statement
+    - BULK_WRITE_CHUNK_SIZE: Rows per UPDATE/DELETE statement and transaction
+    - EXPORT_BATCH_SIZE: Rows fetched per server-side cursor round trip
+    - IMPORT_CHUNK_SIZE: Default rows validated and committed per import chunk
+    - IMPORT_MAX_ERRORS: Max per-row errors listed in an import report
+    - CACHE_MAX_ENTRIES: Entries per response cache (addresses, list pages);
+      0 disables them
+    - CACHE_TTL_SECONDS: Lifetime of a cached response
+    - NEARBY_CACHE_ENABLED: Cache nearby candidate sets per quantized query
+    - NEARBY_CACHE_SNAP_DEGREES: Grid the nearby query point is snapped to
+    - NEARBY_CACHE_RADIUS_GROWTH: Ratio between consecutive radius buckets
+    - NEARBY_CACHE_MAX_ENTRIES: Candidate sets kept in the nearby cache
+    - NEARBY_CACHE_MAX_CANDIDATES: Larger candidate sets are not cached
+    - DATABASE_MODE: 'sync' (threadpool routes, SessionLocal) or 'async'
+      (async routes on AsyncSession); env DATABASE_MODE
+    - DATABASE_URL / ASYNC_DATABASE_URL: Database of the sync / async engine;
+      the async URL defaults to DATABASE_URL with its async driver
+    - DATABASE_PROFILE: Engine tuning profile: 'auto' (by URL dialect),
+      'sqlite', 'postgresql' or 'default' (SQLAlchemy defaults)
+    - SQLITE_PRAGMAS: Pragmas the sqlite profile sets on every connection
+    - DB_POOL_SIZE / DB_MAX_OVERFLOW / DB_POOL_RECYCLE_SECONDS /
+      DB_POOL_PRE_PING: Connection pool of the postgresql profile
+    - LOG_LEVEL: Root log level; env LOG_LEVEL
+    - REQUEST_LOG_LEVEL: Level of the per-request access lines
+    - REQUEST_LOG_SAMPLE_RATE: Share of requests (0..1) that get an access
+      line; 5xx responses, errors and slow requests are always logged
+    - REQUEST_LOG_SLOW_MS: Requests slower than this are always logged
+    - METRICS_ENABLED: Collect request/SQL metrics and serve GET /metrics
+    - PROFILING_ENABLED: Allow per-request profiling (off: no overhead)
+    - PROFILING_HEADER: Request header asking for a profile (e.g. X-Profile: 1)
+    - PROFILING_SAMPLE_RATE: Share of requests (0..1) profiled without the header
+    - PROFILING_DIR: Where request profiles are written
+    - PROFILING_TOP_FUNCTIONS: Functions listed in a profile's text report
 """
 
+import os
+from pathlib import Path
+
 
 APP_NAME = "Address Book API"
 API_VERSION = "1.0.0"
+
+# Spatial grid index
+GRID_CELL_DEGREES = 0.1
+NEARBY_MAX_GRID_RANGES = 256
+
+# In-memory coordinate snapshot
+GEO_SNAPSHOT_ENABLED = True
+GEO_SNAPSHOT_COMPACT_RATIO = 0.25
+
+# k-nearest search
+NEAREST_INITIAL_RADIUS_KM = 5.0
+
+# Database access mode
+DATABASE_MODE = os.getenv("DATABASE_MODE", "sync")
+
+# Database connection and engine profile
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./addresses.db")
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
+DATABASE_PROFILE = os.getenv("DATABASE_PROFILE", "auto")
+
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", 256 * 1024 * 1024)),
+    # negative: size in KiB
+    "cache_size": int(os.getenv("SQLITE_CACHE_SIZE", -64 * 1024)),
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5000)),
+}
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", 1800))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+# Bulk writes
+BULK_MAX_ITEMS = 10000
+BULK_INSERT_BATCH_SIZE = 500
+BULK_WRITE_CHUNK_SIZE = 1000
+
+# Streaming export
+EXPORT_BATCH_SIZE = 1000
+
+# Streaming import
+IMPORT_CHUNK_SIZE = 2000
+IMPORT_MAX_ERRORS = 1000
+
+# Response caches (GET by id, list pages)
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", 10000))
+CACHE_TTL_SECONDS = 60.0
+
+# Nearby candidate cache
+NEARBY_CACHE_ENABLED = os.getenv("NEARBY_CACHE_ENABLED", "true").lower() == "true"
+NEARBY_CACHE_SNAP_DEGREES = 0.01
+NEARBY_CACHE_RADIUS_GROWTH = 1.25
+NEARBY_CACHE_MAX_ENTRIES = 1024
+NEARBY_CACHE_MAX_CANDIDATES = 50000
+
+# Logging
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+REQUEST_LOG_LEVEL = os.getenv("REQUEST_LOG_LEVEL", "INFO").upper()
+REQUEST_LOG_SAMPLE_RATE = float(os.getenv("REQUEST_LOG_SAMPLE_RATE", 1.0))
+REQUEST_LOG_SLOW_MS = float(os.getenv("REQUEST_LOG_SLOW_MS", 1000))
+
+# Metrics
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+# Request profiling
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+PROFILING_HEADER = os.getenv("PROFILING_HEADER", "X-Profile")
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", 0.0))
+PROFILING_DIR = os.getenv("PROFILING_DIR", str(Path(__file__).resolve().parent.parent.parent / "logs" / "profiles"))
+PROFILING_TOP_FUNCTIONS = 40
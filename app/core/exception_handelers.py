@@ -48,7 +48,10 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         field_name = ".".join(str(loc) for loc in err.get("loc", []) if loc != "body")
         error_type = _normalize_error_type(err.get("type"))
         input_value = err.get("ctx", {}).get("given") if "given" in err.get("ctx", {}) else err.get("input")
-        constraints = {k: v for k, v in (err.get("ctx") or {}).items() if k != "given"}
+        constraints = {
+            k: str(v) if isinstance(v, Exception) else v
+            for k, v in (err.get("ctx") or {}).items() if k != "given"
+        }
 
         fields.append({
             "name": field_name,
@@ -41,3 +41,16 @@ class NotFoundException(AppException):
     """
     def __init__(self, message="Resource not found"):
         super().__init__(message, "NOT_FOUND", 404)
+
+
+class BadRequestException(AppException):
+    
+    """
+    Exception for invalid client input not caught by schema validation.
+    
+    Args:
+        message (str): service-layer handled error message
+        code (str): Unique error code
+    """
+    def __init__(self, message="Bad request", code="BAD_REQUEST"):
+        super().__init__(message, code, 400)
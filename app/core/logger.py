@@ -10,17 +10,23 @@ Features:
 - Structured logging format
 - Separate log handlers
 - Console + File logging support
-- Different log levels
+- Different log levels (LOG_LEVEL)
+- Non-blocking: callers only enqueue records (QueueHandler); a
+  QueueListener thread formats them and does the console/file I/O
 - Production-ready configuration
 
 All modules should import logger from here:
     from app.core.logger import logger
 """
 # app/core/logger.py
+import atexit
 import logging
 import logging.config
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from app.core.config import LOG_LEVEL
 
 
 
@@ -90,11 +96,22 @@ LOGGING_CONFIG = {
     # Root Logger
     "root": {
         "handlers": ["console", "file", "error_file"],
-        "level": "INFO",
+        "level": LOG_LEVEL,
     },
 }
 
 
 logging.config.dictConfig(LOGGING_CONFIG)
 
+# Move the configured handlers behind a queue so logging calls on the
+# event loop never wait for console or file I/O
+LOG_QUEUE = queue.SimpleQueue()
+
+_root = logging.getLogger()
+log_listener = QueueListener(LOG_QUEUE, *_root.handlers, respect_handler_level=True)
+_root.handlers = [QueueHandler(LOG_QUEUE)]
+
+log_listener.start()
+atexit.register(log_listener.stop)
+
 logger = logging.getLogger("app")
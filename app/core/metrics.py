@@ -0,0 +1,274 @@
+# app/core/metrics.py
+
+"""
+Application Metrics
+###################
+
+Minimal thread-safe counters, gauges and histograms rendered in the
+Prometheus text exposition format (served by `GET /metrics`).
+
+Per-request figures are collected in a RequestStats bound to a context
+variable by MetricsMiddleware; it follows the request into threadpool and
+`run_sync` workers, so SQL and ORM events can be attributed to the route
+that caused them.
+
+Collected:
+    - http_requests_in_flight: requests currently being served
+    - http_request_duration_seconds: latency per route/method/status
+    - db_queries_total / db_query_duration_seconds: SQL statements per
+      route, timed from SQLAlchemy cursor events
+    - db_rows_hydrated_total: Address objects loaded by the ORM per route
+    - cache_*: counters of the response caches (registered collectors)
+"""
+
+import bisect
+import contextvars
+import threading
+import time
+from sqlalchemy import event
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# route label used for work done outside of a request (startup, scripts)
+NO_ROUTE = "none"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """
+    Base of the metric types: a name, help text and label names, with one
+    value per distinct label value tuple.
+    """
+    kind = "untyped"
+
+    def __init__(self, name: str, description: str, labelnames: tuple = ()):
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}")
+        return lines
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, *labels, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def inc(self, *labels, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels, amount: float = 1):
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, description: str, labelnames: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        super().__init__(name, description, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels):
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                # per-bucket counts (+Inf last), sum
+                state = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][bisect.bisect_left(self.buckets, value)] += 1
+            state[1] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            for labels, (counts, total) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += count
+                    le = f'le="{_number(bound)}"'
+                    lines.append(f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}")
+                lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(total)}")
+                lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Set of metrics plus collectors (callables returning exposition lines)
+    rendered together.
+    """
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def register(self, metric: Metric):
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector):
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+requests_in_flight = registry.register(Gauge(
+    "http_requests_in_flight", "HTTP requests currently being served"
+))
+request_duration = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("route", "method", "status")
+))
+db_queries = registry.register(Counter(
+    "db_queries_total", "SQL statements executed", ("route",)
+))
+db_query_duration = registry.register(Histogram(
+    "db_query_duration_seconds", "SQL statement execution time", ("route",), DB_BUCKETS
+))
+db_rows_hydrated = registry.register(Counter(
+    "db_rows_hydrated_total", "Rows loaded into ORM objects", ("route", "model")
+))
+
+
+class RequestStats:
+    """
+    Figures of the request being served. The route is only known once the
+    request has been routed, so SQL timings are kept here and recorded
+    under the route by `finish`.
+    """
+    __slots__ = ("route", "query_times", "rows")
+
+    def __init__(self):
+        self.route = NO_ROUTE
+        self.query_times = []
+        self.rows = {}
+
+    def finish(self):
+        """
+        Record the collected SQL and hydration figures under the route.
+        """
+        if self.query_times:
+            db_queries.inc(self.route, amount=len(self.query_times))
+            for elapsed in self.query_times:
+                db_query_duration.observe(elapsed, self.route)
+        for model, count in self.rows.items():
+            db_rows_hydrated.inc(self.route, model, amount=count)
+
+
+current_request = contextvars.ContextVar("current_request", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("query_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+
+    stats = current_request.get()
+    if stats is None:
+        db_queries.inc(NO_ROUTE)
+        db_query_duration.observe(elapsed, NO_ROUTE)
+    else:
+        stats.query_times.append(elapsed)
+
+
+def instrument_engine(engine):
+    """
+    Time every SQL statement run on an engine.
+
+    Args:
+        engine (Engine): Sync engine (`async_engine.sync_engine` for async)
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def instrument_model(model):
+    """
+    Count the rows hydrated into instances of an ORM model.
+    """
+    name = model.__name__
+
+    @event.listens_for(model, "load")
+    def count_load(target, context):
+        stats = current_request.get()
+        if stats is None:
+            db_rows_hydrated.inc(NO_ROUTE, name)
+        else:
+            stats.rows[name] = stats.rows.get(name, 0) + 1
+
+
+_cache_stats = {}
+
+
+def register_cache_stats(name: str, stats):
+    """
+    Expose the counters of a cache as `cache_<counter>` series.
+
+    Args:
+        name (str): Value of the `cache` label
+        stats: Callable returning a dict of counters ('hits', 'misses',
+            ...); 'size' is exported as a gauge, the others as counters
+    """
+    _cache_stats[name] = stats
+
+
+def _render_cache_stats():
+    series = {}
+    for name, stats in sorted(_cache_stats.items()):
+        for counter, value in stats().items():
+            series.setdefault(counter, []).append((name, value))
+
+    lines = []
+    for counter, values in sorted(series.items()):
+        kind = "gauge" if counter == "size" else "counter"
+        metric = f"cache_{counter}" if kind == "gauge" else f"cache_{counter}_total"
+        lines.append(f"# HELP {metric} Response cache {counter}")
+        lines.append(f"# TYPE {metric} {kind}")
+        lines.extend(f'{metric}{{cache="{_escape(name)}"}} {value}' for name, value in values)
+    return lines
+
+
+registry.register_collector(_render_cache_stats)
@@ -0,0 +1,226 @@
+# app/core/profiling.py
+
+"""
+On-Demand Request Profiling
+###########################
+
+Opt-in (PROFILING_ENABLED) profiling of single requests, selected by the
+PROFILING_HEADER request header or by PROFILING_SAMPLE_RATE.
+
+A profiled request gets:
+    - a cProfile of the endpoint call, taken on the thread that runs it
+      (the threadpool worker for `def` routes)
+    - a split of the request time into phases:
+        validation     routing, body parsing, validation and dependencies
+        service        endpoint code outside the repository layer and SQL
+        repository     AddressRepository code excluding SQL execution
+        sql            statement execution (cursor events)
+        serialization  from the endpoint's return to the last body chunk
+
+Both are written to PROFILING_DIR as `<request_id>.prof` (pstats, e.g. for
+snakeviz) and `<request_id>.txt` (phases and top functions).
+
+Only one request is profiled at a time. For `async def` routes the
+profile also sees other coroutines running on the event loop meanwhile.
+
+When PROFILING_ENABLED is off none of this is installed: routers keep the
+plain APIRoute and no middleware or SQL listener is added.
+"""
+
+import asyncio
+import contextvars
+import cProfile
+import functools
+import io
+import pstats
+import threading
+import time
+from pathlib import Path
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from app.core.config import PROFILING_ENABLED, PROFILING_DIR, PROFILING_TOP_FUNCTIONS
+from app.core.logger import logger
+
+
+REPOSITORY_DIR = str(Path(__file__).resolve().parent.parent / "repo")
+
+
+class ProfileSession:
+    """
+    Timings and profile of one request.
+    """
+
+    def __init__(self, request_id: str, method: str, path: str):
+        self.request_id = request_id
+        self.method = method
+        self.path = path
+        self.started = time.perf_counter()
+        self.endpoint_started = None
+        self.endpoint_finished = None
+        self.finished = None
+        self.status_code = None
+        self.sql_seconds = 0.0
+        self.sql_count = 0
+        self.profiler = cProfile.Profile()
+
+    def phases(self, stats: pstats.Stats) -> dict:
+        """
+        Split the request time into phases (seconds).
+        """
+        total = self.finished - self.started
+        if self.endpoint_started is None:
+            return {"total": total, "validation": total}
+
+        endpoint = self.endpoint_finished - self.endpoint_started
+        repository = max(_repository_seconds(stats) - self.sql_seconds, 0.0)
+        return {
+            "total": total,
+            "validation": self.endpoint_started - self.started,
+            "service": max(endpoint - repository - self.sql_seconds, 0.0),
+            "repository": repository,
+            "sql": self.sql_seconds,
+            "serialization": self.finished - self.endpoint_finished,
+        }
+
+
+current_profile = contextvars.ContextVar("current_profile", default=None)
+
+# only one request is profiled at a time
+_profiling_lock = threading.Lock()
+
+
+def _repository_seconds(stats: pstats.Stats) -> float:
+    """
+    Cumulative time of the outermost repository calls in a profile.
+    """
+    total = 0.0
+    for (filename, _, _), (_, _, _, cumulative, callers) in stats.stats.items():
+        if not filename.startswith(REPOSITORY_DIR):
+            continue
+        # skip calls made from inside the repository (counted by the caller)
+        if any(caller[0].startswith(REPOSITORY_DIR) for caller in callers):
+            continue
+        total += cumulative
+    return total
+
+
+def start_session(request_id: str, method: str, path: str):
+    """
+    Begin profiling a request, unless another one is being profiled.
+
+    Returns:
+        ProfileSession | None: The session, None when busy
+    """
+    if not _profiling_lock.acquire(blocking=False):
+        return None
+    return ProfileSession(request_id, method, path)
+
+
+def finish_session(session: ProfileSession):
+    """
+    Write the profile and phase split of a finished request to PROFILING_DIR.
+    """
+    try:
+        session.finished = time.perf_counter()
+        stats = pstats.Stats(session.profiler)
+
+        directory = Path(PROFILING_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+        stats.dump_stats(str(directory / f"{session.request_id}.prof"))
+
+        phases = session.phases(stats)
+        report = io.StringIO()
+        report.write(f"{session.method} {session.path} -> {session.status_code}\n")
+        report.write(f"request_id {session.request_id}, {session.sql_count} SQL statements\n\n")
+        for phase, seconds in phases.items():
+            report.write(f"{phase:<14} {seconds * 1000:10.2f} ms\n")
+        report.write("\n")
+        pstats.Stats(session.profiler, stream=report).sort_stats("cumulative").print_stats(PROFILING_TOP_FUNCTIONS)
+        (directory / f"{session.request_id}.txt").write_text(report.getvalue())
+
+        logger.info(
+            "Profiled request: "
+            + ", ".join(f"{phase}={seconds * 1000:.1f}ms" for phase, seconds in phases.items()),
+            extra={"request_id": session.request_id},
+        )
+    except Exception:
+        logger.exception("Writing request profile failed", extra={"request_id": session.request_id})
+    finally:
+        _profiling_lock.release()
+
+
+def _profiled(session: ProfileSession):
+    session.endpoint_started = time.perf_counter()
+    session.profiler.enable()
+
+
+def _unprofiled(session: ProfileSession):
+    session.profiler.disable()
+    session.endpoint_finished = time.perf_counter()
+
+
+def profiled_endpoint(endpoint):
+    """
+    Wrap an endpoint so a request with an active ProfileSession is profiled
+    on the thread running it. The signature seen by FastAPI is unchanged.
+    """
+    if asyncio.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            session = current_profile.get()
+            if session is None:
+                return await endpoint(*args, **kwargs)
+            _profiled(session)
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                _unprofiled(session)
+    else:
+        @functools.wraps(endpoint)
+        def wrapper(*args, **kwargs):
+            session = current_profile.get()
+            if session is None:
+                return endpoint(*args, **kwargs)
+            _profiled(session)
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                _unprofiled(session)
+    return wrapper
+
+
+class ProfiledRoute(APIRoute):
+    """
+    APIRoute whose endpoint can be profiled per request (see profiled_endpoint).
+    """
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        super().__init__(path, profiled_endpoint(endpoint), **kwargs)
+
+
+# route class of the API routers: plain APIRoute unless profiling is enabled
+ROUTE_CLASS = ProfiledRoute if PROFILING_ENABLED else APIRoute
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if current_profile.get() is not None:
+        conn.info["profile_query_start"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    session = current_profile.get()
+    started = conn.info.pop("profile_query_start", None)
+    if session is not None and started is not None:
+        session.sql_seconds += time.perf_counter() - started
+        session.sql_count += 1
+
+
+def instrument_engine(engine):
+    """
+    Attribute SQL execution time to the profiled request.
+
+    Args:
+        engine (Engine): Sync engine (`async_engine.sync_engine` for async)
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
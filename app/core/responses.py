@@ -5,6 +5,11 @@ Custom Response Class For API Endpoints
 
 1. SuccessResponse for Standardized Success Response
 2. PaginatedSuccessResponse for Standardized Paginated Response
+   (PaginatedFieldsResponse for pages limited with `fields=`)
+3. NearestSuccessResponse for Distance-Ordered Address Lists
+4. FastJSONResponse / paginated_envelope for the hot read paths: the
+   envelope of PaginatedSuccessResponse built from plain dicts and encoded
+   once with orjson (when installed), skipping response_model validation
 
     - Maintains Consistent API Response Format
     - Standardizes Success and Error Responses
@@ -16,7 +21,14 @@ Custom Response Class For API Endpoints
 
 from typing import Any, Optional
 from pydantic import BaseModel
-from app.schemas.address_schema import AddressResponse
+from fastapi.responses import JSONResponse
+from app.schemas.address_schema import AddressResponse, AddressDistanceResponse, AddressFieldsResponse
+from app.schemas.address_schema import ADDRESS_RESPONSE_FIELDS
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 class SuccessResponse:
     def __init__(
@@ -41,10 +53,11 @@ class SuccessResponse:
 
 # Pagination metadata
 class PaginatedMeta(BaseModel):
-    page: int
+    page: Optional[int] = None
     page_size: int
-    total: int
-    total_pages: int
+    total: Optional[int] = None
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 # Paginated response
@@ -56,4 +69,61 @@ class PaginatedSuccessResponse(BaseModel):
     
     model_config = {
         "from_attributes": True  
-    }
\ No newline at end of file
+    }
+
+
+# Paginated response of a sparse fieldset (`fields=`): only the requested
+# keys are present in each item
+class PaginatedFieldsResponse(BaseModel):
+    success: bool = True
+    message: str = "Fetched successfully"
+    meta: PaginatedMeta
+    data: list[AddressFieldsResponse]
+
+
+# Distance ordered response
+class NearestSuccessResponse(BaseModel):
+    success: bool = True
+    message: str = "Fetched successfully"
+    data: list[AddressDistanceResponse]
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse encoded with orjson when it is installed. The output is
+    the same compact UTF-8 JSON as the default encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content)
+
+
+def address_data(address) -> dict:
+    """
+    AddressResponse fields of an Address entity as a plain dict.
+    """
+    return {field: getattr(address, field) for field in ADDRESS_RESPONSE_FIELDS}
+
+
+def paginated_envelope(message: str, meta: dict, data: list) -> dict:
+    """
+    Body of a PaginatedSuccessResponse as a plain dict, with the same keys
+    in the same order.
+
+    Args:
+        message (str): Response message
+        meta (dict): PaginatedMeta fields (missing ones are null)
+        data (list): Address dicts (AddressResponse fields, or the
+            requested subset, in field order)
+
+    Returns:
+        dict: Envelope ready for FastJSONResponse
+    """
+    return {
+        "success": True,
+        "message": message,
+        "meta": {field: meta.get(field) for field in PaginatedMeta.model_fields},
+        "data": data,
+    }
@@ -0,0 +1,151 @@
+# app/database/full_text.py
+
+"""
+Full-Text Search Index
+######################
+
+Backs the name/city `search` filter of the address listing with an index
+instead of `ILIKE '%x%'` full scans.
+
+- SQLite: an external-content FTS5 table (`addresses_fts`) over name and
+  city, kept in sync with `addresses` by triggers. Search terms are matched
+  as token prefixes and can be ordered by bm25 relevance.
+- PostgreSQL: pg_trgm GIN indexes on name and city, which serve the
+  existing ILIKE filter directly and provide `similarity()` for relevance.
+
+Other databases (or SQLite builds without FTS5) keep the plain ILIKE scan.
+"""
+
+import re
+from sqlalchemy import column, select, table, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from app.models.address import Address
+
+
+FTS_TABLE = f"{Address.__tablename__}_fts"
+
+fts_hits_table = table(FTS_TABLE, column("rowid"), column("rank"))
+
+_SQLITE_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        name, city,
+        content='{Address.__tablename__}', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {Address.__tablename__} BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, name, city) VALUES (new.id, new.name, new.city);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {Address.__tablename__} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, city) VALUES ('delete', old.id, old.name, old.city);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF name, city ON {Address.__tablename__} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, city) VALUES ('delete', old.id, old.name, old.city);
+        INSERT INTO {FTS_TABLE}(rowid, name, city) VALUES (new.id, new.name, new.city);
+    END
+    """,
+]
+
+_POSTGRES_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"CREATE INDEX IF NOT EXISTS ix_{Address.__tablename__}_name_trgm "
+    f"ON {Address.__tablename__} USING gin (name gin_trgm_ops)",
+    f"CREATE INDEX IF NOT EXISTS ix_{Address.__tablename__}_city_trgm "
+    f"ON {Address.__tablename__} USING gin (city gin_trgm_ops)",
+]
+
+# engine url -> whether the FTS5 table exists
+_fts_available = {}
+
+
+def create_full_text_index(engine: Engine):
+    """
+    Create the search index for the engine's dialect if it does not exist.
+
+    Args:
+        engine (Engine): SQLAlchemy engine bound to the database
+    """
+    dialect = engine.dialect.name
+
+    if dialect == "postgresql":
+        with engine.begin() as conn:
+            for statement in _POSTGRES_DDL:
+                conn.execute(text(statement))
+        return
+
+    if dialect != "sqlite":
+        return
+
+    try:
+        with engine.begin() as conn:
+            existed = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": FTS_TABLE}
+            ).first() is not None
+
+            for statement in _SQLITE_DDL:
+                conn.execute(text(statement))
+
+            # index rows written before the FTS table existed
+            if not existed:
+                conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+    except OperationalError:
+        # SQLite compiled without FTS5
+        _fts_available[str(engine.url)] = False
+        return
+
+    _fts_available[str(engine.url)] = True
+
+
+def fts_enabled(engine: Engine) -> bool:
+    """
+    Whether searches on this engine can go through the FTS5 table.
+    """
+    if engine.dialect.name != "sqlite":
+        return False
+
+    key = str(engine.url)
+    if key not in _fts_available:
+        with engine.connect() as conn:
+            _fts_available[key] = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": FTS_TABLE}
+            ).first() is not None
+    return _fts_available[key]
+
+
+def match_expression(search: str):
+    """
+    Turn free search text into an FTS5 MATCH expression.
+
+    Every word becomes a quoted prefix term and all words must match,
+    e.g. `new kol` -> `"new"* "kol"*`.
+
+    Args:
+        search (str): Raw search text
+
+    Returns:
+        str | None: MATCH expression, None when the text has no words
+    """
+    words = re.findall(r"\w+", search.lower())
+    if not words:
+        return None
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def fts_hits(match: str):
+    """
+    Subquery of (rowid, rank) for the rows matching an FTS5 expression.
+    """
+    return (
+        select(fts_hits_table.c.rowid, fts_hits_table.c.rank)
+        .where(text(f"{FTS_TABLE} MATCH :match").bindparams(match=match))
+        .subquery()
+    )
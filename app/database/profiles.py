@@ -0,0 +1,139 @@
+# app/database/profiles.py
+
+"""
+Database Engine Profiles
+########################
+
+Builds engines tuned for the database behind the URL, selected by
+DATABASE_PROFILE:
+
+- sqlite: WAL journal, synchronous=NORMAL, mmap, a larger page cache and a
+  busy timeout, set on every new connection (SQLITE_PRAGMAS). Readers no
+  longer block the writer and commits skip the per-transaction fsync.
+- postgresql: sized connection pool with pre-ping and recycling
+  (DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_RECYCLE_SECONDS, DB_POOL_PRE_PING).
+- default: SQLAlchemy defaults, kept for comparison.
+- auto: sqlite or postgresql by the URL's dialect, else default.
+"""
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from app.core.config import DATABASE_PROFILE, SQLITE_PRAGMAS
+from app.core.config import DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_RECYCLE_SECONDS, DB_POOL_PRE_PING
+
+
+PROFILES = ("auto", "default", "sqlite", "postgresql")
+
+# async driver used when ASYNC_DATABASE_URL is not set
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+
+def resolve_profile(url: str, profile: str = DATABASE_PROFILE) -> str:
+    """
+    Name of the profile to apply to an engine for `url`.
+
+    Raises:
+        ValueError: If `profile` is not one of PROFILES
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown DATABASE_PROFILE {profile!r}, expected one of {PROFILES}")
+    if profile != "auto":
+        return profile
+
+    backend = make_url(url).get_backend_name()
+    return backend if backend in ("sqlite", "postgresql") else "default"
+
+
+def async_url(url: str) -> str:
+    """
+    The URL with the async driver of its dialect (e.g. sqlite+aiosqlite).
+    """
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        return url
+    return parsed.set(drivername=f"{parsed.get_backend_name()}+{driver}").render_as_string(hide_password=False)
+
+
+def engine_options(url: str, profile: str = DATABASE_PROFILE) -> dict:
+    """
+    Keyword arguments for create_engine / create_async_engine.
+
+    Args:
+        url (str): Database URL
+        profile (str): Profile name (see PROFILES)
+
+    Returns:
+        dict: Engine options
+    """
+    options = {}
+    if make_url(url).get_backend_name() == "sqlite":
+        # sessions are used from the threadpool
+        options["connect_args"] = {"check_same_thread": False}
+
+    if resolve_profile(url, profile) == "postgresql":
+        options.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_recycle=DB_POOL_RECYCLE_SECONDS,
+            pool_pre_ping=DB_POOL_PRE_PING,
+        )
+    return options
+
+
+def install_profile(engine, url: str, profile: str = DATABASE_PROFILE):
+    """
+    Attach the connection-level settings of a profile to an engine.
+
+    Args:
+        engine (Engine): Sync engine (`async_engine.sync_engine` for async)
+        url (str): Database URL of the engine
+        profile (str): Profile name (see PROFILES)
+    """
+    if resolve_profile(url, profile) != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in SQLITE_PRAGMAS.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def make_engine(url: str, profile: str = DATABASE_PROFILE):
+    """
+    Create a sync engine configured by a profile.
+
+    Args:
+        url (str): Database URL
+        profile (str): Profile name (see PROFILES)
+
+    Returns:
+        Engine: Configured engine
+    """
+    engine = create_engine(url, **engine_options(url, profile))
+    install_profile(engine, url, profile)
+    return engine
+
+
+def make_async_engine(url: str, profile: str = DATABASE_PROFILE):
+    """
+    Create an async engine configured by a profile.
+
+    Args:
+        url (str): Async database URL
+        profile (str): Profile name (see PROFILES)
+
+    Returns:
+        AsyncEngine: Configured engine
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    options = engine_options(url, profile)
+    options.pop("connect_args", None)
+    engine = create_async_engine(url, **options)
+    install_profile(engine.sync_engine, url, profile)
+    return engine
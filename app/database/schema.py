@@ -0,0 +1,98 @@
+# app/database/schema.py
+
+"""
+Database Schema Sync
+####################
+
+`Base.metadata.create_all` only creates missing tables, so databases
+created by an older version of the models keep their old layout.
+
+This module brings an existing database up to date:
+- Adds columns introduced after the table was created
+- Backfills derived columns (e.g. the spatial grid cell)
+- Creates indexes declared on the models that do not exist yet
+- Creates the full-text search index and its sync triggers
+- Creates the dataset version table and its addresses row, counting the
+  existing rows once
+"""
+
+from sqlalchemy import inspect, select, insert, update, bindparam, text, func
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from app.models.address import Address
+from app.models.dataset_version import DatasetVersion
+from app.database.full_text import create_full_text_index
+from app.utils.geo_grid import grid_cell
+
+
+def _add_missing_columns(engine: Engine):
+    existing = {column["name"] for column in inspect(engine).get_columns(Address.__tablename__)}
+
+    with engine.begin() as conn:
+        if "grid_cell" not in existing:
+            conn.execute(text(f"ALTER TABLE {Address.__tablename__} ADD COLUMN grid_cell INTEGER"))
+
+
+def _backfill_grid_cells(engine: Engine):
+    with engine.begin() as conn:
+        rows = conn.execute(
+            select(Address.id, Address.latitude, Address.longitude)
+            .where(Address.grid_cell.is_(None))
+        ).all()
+
+        if rows:
+            conn.execute(
+                update(Address.__table__)
+                .where(Address.__table__.c.id == bindparam("row_id"))
+                .values(grid_cell=bindparam("cell")),
+                [{"row_id": row.id, "cell": grid_cell(row.latitude, row.longitude)} for row in rows]
+            )
+
+
+def _ensure_dataset_version(engine: Engine):
+    DatasetVersion.__table__.create(bind=engine, checkfirst=True)
+
+    existing = {column["name"] for column in inspect(engine).get_columns(DatasetVersion.__tablename__)}
+    with engine.begin() as conn:
+        if "row_count" not in existing:
+            conn.execute(text(f"ALTER TABLE {DatasetVersion.__tablename__} ADD COLUMN row_count INTEGER"))
+
+    row_count = select(func.count()).select_from(Address.__table__).scalar_subquery()
+
+    with engine.connect() as conn:
+        exists = conn.execute(
+            select(DatasetVersion.name).where(DatasetVersion.name == Address.__tablename__)
+        ).first()
+        try:
+            if exists:
+                # counted once, then kept up to date by the repositories
+                conn.execute(
+                    update(DatasetVersion.__table__)
+                    .where(DatasetVersion.name == Address.__tablename__, DatasetVersion.row_count.is_(None))
+                    .values(row_count=row_count)
+                )
+            else:
+                conn.execute(insert(DatasetVersion).values(
+                    name=Address.__tablename__, version=0, row_count=row_count
+                ))
+            conn.commit()
+        except IntegrityError:
+            # created meanwhile by another worker
+            conn.rollback()
+
+
+def sync_schema(engine: Engine):
+    """
+    Upgrade an existing database to match the current models.
+
+    Args:
+        engine (Engine): SQLAlchemy engine bound to the database
+    """
+    _add_missing_columns(engine)
+    _backfill_grid_cells(engine)
+
+    for index in Address.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
+
+    create_full_text_index(engine)
+    _ensure_dataset_version(engine)
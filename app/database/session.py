@@ -6,8 +6,9 @@ Database Session Configuration
 Used for:
 
 1. Creating the database engine
-2. Configuring database sessions
+2. Configuring database sessions (engine tuning: app/database/profiles.py)
 3. Providing a database dependency for API routes
+4. The async engine/session used when DATABASE_MODE is 'async'
 
 It ensures:
 - Proper database connection management
@@ -16,15 +17,14 @@ It ensures:
 
 """
 
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from app.core.config import DATABASE_MODE, DATABASE_URL, ASYNC_DATABASE_URL as CONFIGURED_ASYNC_URL
+from app.database.profiles import make_engine, make_async_engine, async_url
 
-DATABASE_URL = "sqlite:///./addresses.db"
+ASYNC_DATABASE_URL = CONFIGURED_ASYNC_URL or async_url(DATABASE_URL)
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False}
-)
+# Tuned per DATABASE_PROFILE (see app/database/profiles.py)
+engine = make_engine(DATABASE_URL)
 
 SessionLocal = sessionmaker(bind=engine)
 
@@ -35,3 +35,19 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Async engine (aiosqlite / asyncpg), only created in async mode
+async_engine = None
+AsyncSessionLocal = None
+
+if DATABASE_MODE == "async":
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    async_engine = make_async_engine(ASYNC_DATABASE_URL)
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,17 +1,59 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from app.core.config import APP_NAME, API_VERSION
+from app.core.config import APP_NAME, API_VERSION, GEO_SNAPSHOT_ENABLED, DATABASE_MODE, METRICS_ENABLED, PROFILING_ENABLED
 from app.core.exception_handelers import app_exception_handler
 from app.core.exceptions import AppException
 from app.database.base import Base
-from app.database.session import engine
+from app.database.session import engine, async_engine, SessionLocal
+from app.database.schema import sync_schema
 from app.api.address_api import router
+from app.repo import address_events
+from app.repo.coordinate_snapshot import coordinate_snapshot
+from app.services.address_service import AddressService
 from app.middleware.logging_middleware import LoggingMiddleware
+from app.middleware.metrics_middleware import MetricsMiddleware
+from app.middleware.profiling_middleware import ProfilingMiddleware
+from app.core import profiling
+from app.api.metrics_api import router as metrics_router
+from app.core.metrics import instrument_engine, instrument_model
+from app.models.address import Address
 from fastapi.exceptions import RequestValidationError
 from app.core.exception_handelers import validation_exception_handler,app_exception_handler
 
 Base.metadata.create_all(bind=engine)
+sync_schema(engine)
 
-app = FastAPI(title=APP_NAME, version=API_VERSION)
+# SQL timings and hydrated rows for /metrics
+if METRICS_ENABLED:
+    instrument_engine(engine)
+    if async_engine is not None:
+        instrument_engine(async_engine.sync_engine)
+    instrument_model(Address)
+
+# Per-request SQL time for profiled requests
+if PROFILING_ENABLED:
+    profiling.instrument_engine(engine)
+    if async_engine is not None:
+        profiling.instrument_engine(async_engine.sync_engine)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the in-memory coordinate snapshot used by nearby queries
+    if GEO_SNAPSHOT_ENABLED and coordinate_snapshot is not None:
+        address_events.subscribe(coordinate_snapshot.apply)
+        db = SessionLocal()
+        try:
+            # start the version guard first: it would drop a snapshot loaded
+            # before the first version it sees
+            AddressService.dataset_version(db)
+            coordinate_snapshot.load(db)
+        finally:
+            db.close()
+    yield
+
+
+app = FastAPI(title=APP_NAME, version=API_VERSION, lifespan=lifespan)
 
 app.add_exception_handler(AppException, app_exception_handler)
 
@@ -19,5 +61,17 @@ app.add_exception_handler(AppException, app_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 
 
-app.include_router(router)
+# Sync (threadpool) or async routes, selected by DATABASE_MODE
+if DATABASE_MODE == "async":
+    from app.api.address_api_async import router as async_router
+    app.include_router(async_router)
+else:
+    app.include_router(router)
+# Profiling runs inside the logging middleware to reuse its request_id
+if PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
 app.add_middleware(LoggingMiddleware)
+
+if METRICS_ENABLED:
+    app.include_router(metrics_router)
+    app.add_middleware(MetricsMiddleware)
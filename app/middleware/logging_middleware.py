@@ -1,51 +1,76 @@
 # app/middleware/logging_middleware.py
 
+"""
+Request Logging Middleware
+##########################
 
+Pure ASGI middleware: it wraps `send` to observe the response status
+instead of going through BaseHTTPMiddleware, so no extra task or response
+stream wrapping is added per request.
 
+Every request gets a `request_id` (in `request.state.request_id` and on
+its log records) and one access line at REQUEST_LOG_LEVEL, sampled by
+REQUEST_LOG_SAMPLE_RATE. Server errors, unhandled exceptions and requests
+slower than REQUEST_LOG_SLOW_MS are always logged.
+"""
+
+import logging
+import random
 import time
 import uuid
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from app.core.config import REQUEST_LOG_LEVEL, REQUEST_LOG_SAMPLE_RATE, REQUEST_LOG_SLOW_MS
 from app.core.logger import logger
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
+class LoggingMiddleware:
 
-        # Generate unique request ID
-        request_id = str(uuid.uuid4())
+    def __init__(self, app, level: str = REQUEST_LOG_LEVEL,
+                 sample_rate: float = REQUEST_LOG_SAMPLE_RATE, slow_ms: float = REQUEST_LOG_SLOW_MS):
+        self.app = app
+        self.level = logging.getLevelName(level) if isinstance(level, str) else level
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
 
-        # Attach request_id to request state
-        request.state.request_id = request_id
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        logger.info(
-            f"Incoming request: {request.method} {request.url.path}",
-            extra={"request_id": request_id},
-        )
+        start_time = time.perf_counter()
 
-        try:
-            response = await call_next(request)
+        # Generate unique request ID and attach it to request state
+        request_id = str(uuid.uuid4())
+        scope.setdefault("state", {})["request_id"] = request_id
+        extra = {"request_id": request_id}
 
-            process_time = round(time.time() - start_time, 4)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Incoming request: {scope['method']} {scope['path']}", extra=extra)
 
-            logger.info(
-                f"Completed {response.status_code} in {process_time}s",
-                extra={"request_id": request_id},
-            )
+        status_code = 500
 
-            return response
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
+        try:
+            await self.app(scope, receive, send_with_status)
         except Exception as e:
-            logger.exception(
-                f"Unhandled exception: {str(e)}",
-                extra={"request_id": request_id},
-            )
+            logger.exception(f"Unhandled exception: {str(e)}", extra=extra)
             raise
-
         finally:
-            logger.info(
-                f"Request completed: {request.method} {request.url.path}",
-                extra={"request_id": request_id},
-            )
+            process_ms = (time.perf_counter() - start_time) * 1000
+
+            if (
+                status_code >= 500
+                or process_ms >= self.slow_ms
+                or (self.sample_rate >= 1 or random.random() < self.sample_rate)
+            ):
+                level = max(self.level, logging.WARNING) if status_code >= 500 else self.level
+                if logger.isEnabledFor(level):
+                    logger.log(
+                        level,
+                        f"{scope['method']} {scope['path']} completed {status_code} in {process_ms:.1f}ms",
+                        extra=extra,
+                    )
@@ -0,0 +1,51 @@
+# app/middleware/metrics_middleware.py
+
+"""
+Request Metrics Middleware
+##########################
+
+Pure ASGI middleware feeding app/core/metrics.py: tracks requests in
+flight, observes latency per route template / method / status and binds a
+RequestStats to the request context so SQL statements and hydrated rows
+are attributed to the route.
+
+Requests that match no route are labelled 'unmatched' to keep the label
+set bounded.
+"""
+
+import time
+from app.core.metrics import RequestStats, current_request, requests_in_flight, request_duration
+
+
+class MetricsMiddleware:
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        stats = RequestStats()
+        token = current_request.set(stats)
+        requests_in_flight.inc()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            requests_in_flight.dec()
+
+            route = scope.get("route")
+            stats.route = getattr(route, "path", None) or "unmatched"
+            request_duration.observe(time.perf_counter() - start_time, stats.route, scope["method"], str(status_code))
+            stats.finish()
+            current_request.reset(token)
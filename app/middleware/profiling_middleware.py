@@ -0,0 +1,56 @@
+# app/middleware/profiling_middleware.py
+
+"""
+Request Profiling Middleware
+############################
+
+Pure ASGI middleware selecting the requests to profile (PROFILING_HEADER
+or PROFILING_SAMPLE_RATE) and writing their profile once the response has
+been sent (see app/core/profiling.py). Only added when PROFILING_ENABLED.
+
+Must run inside LoggingMiddleware so the profile is tagged with the
+request's `request_id`.
+"""
+
+import random
+import uuid
+from starlette.concurrency import run_in_threadpool
+from app.core.config import PROFILING_HEADER, PROFILING_SAMPLE_RATE
+from app.core.profiling import current_profile, start_session, finish_session
+
+
+class ProfilingMiddleware:
+
+    def __init__(self, app, header: str = PROFILING_HEADER, sample_rate: float = PROFILING_SAMPLE_RATE):
+        self.app = app
+        self.header = header.lower().encode("latin-1")
+        self.sample_rate = sample_rate
+
+    def _selected(self, scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == self.header:
+                return value.lower() not in (b"0", b"false", b"")
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._selected(scope):
+            await self.app(scope, receive, send)
+            return
+
+        request_id = scope.get("state", {}).get("request_id") or str(uuid.uuid4())
+        session = start_session(request_id, scope["method"], scope["path"])
+        if session is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                session.status_code = message["status"]
+            await send(message)
+
+        token = current_profile.set(session)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            current_profile.reset(token)
+            await run_in_threadpool(finish_session, session)
@@ -5,13 +5,25 @@ Model for Address:
     - Define database table structure
     - Define column types and constraints
     - Act as ORM entity for CRUD operations
+    - Declare the sortable columns and their (column, id) indexes
 """
 
-from sqlalchemy import Column, Integer, String, Float
+from sqlalchemy import Column, Integer, String, Float, Index
 from  app.database.base import Base
 
+# Columns a listing can be sorted by. Each one is backed by a (column, id)
+# index matching the ORDER BY column, id of the service, so a sorted page
+# (OFFSET or keyset cursor) is an index walk stopped by LIMIT.
+SORTABLE_COLUMNS = ("id", "name", "street", "city", "latitude", "longitude")
+
+
 class Address(Base):
     __tablename__ = "addresses"
+    __table_args__ = (
+        # Serves the bounding-box prefilter of nearby queries
+        Index("ix_addresses_lat_lon", "latitude", "longitude"),
+        *(Index(f"ix_addresses_{column}_id", column, "id") for column in SORTABLE_COLUMNS if column != "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
@@ -20,6 +32,9 @@ class Address(Base):
     latitude = Column(Float, nullable=False)
     longitude = Column(Float, nullable=False)
 
+    # Spatial grid cell (see app/utils/geo_grid.py), maintained by the repository
+    grid_cell = Column(Integer, index=True)
+
     def __repr__(self):
         """
         String representation of .
@@ -0,0 +1,25 @@
+# app/models/dataset_version.py
+"""
+Model for DatasetVersion:
+
+    - One row per versioned table (e.g. 'addresses')
+    - `version` is bumped by the repository in the same transaction as
+      every write to that table
+    - `row_count` is adjusted by the same statement (rows added/removed),
+      NULL until sync_schema has counted an existing table
+    - Read by the API to build ETags without touching the table itself
+"""
+
+from sqlalchemy import Column, Integer, String
+from app.database.base import Base
+
+
+class DatasetVersion(Base):
+    __tablename__ = "dataset_versions"
+
+    name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    row_count = Column(Integer)
+
+    def __repr__(self):
+        return f"<DatasetVersion(name='{self.name}', version={self.version})>"
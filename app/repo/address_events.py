@@ -0,0 +1,61 @@
+# app/repo/address_events.py
+
+"""
+Address Write Notifications
+###########################
+
+The repository publishes an AddressChange after every committed write so
+process-local structures derived from the addresses table (coordinate
+snapshot, caches, ...) can patch themselves instead of reloading.
+
+Usage:
+    from app.repo import address_events
+    address_events.subscribe(listener)   # listener(change: AddressChange)
+"""
+
+from app.core.logger import logger
+
+
+class AddressChange:
+    """
+    Description of one committed write.
+
+    Args:
+        action (str): 'create', 'update' or 'delete'
+        before (list): (id, latitude, longitude) of the rows before the write
+        after (list): (id, latitude, longitude) of the rows after the write
+        version (int, optional): Dataset version the write committed
+            (see app/repo/dataset_version.py)
+    """
+    __slots__ = ("action", "before", "after", "version")
+
+    def __init__(self, action: str, before: list = None, after: list = None, version: int = None):
+        self.action = action
+        self.before = before or []
+        self.after = after or []
+        self.version = version
+
+
+_listeners = []
+
+
+def subscribe(listener):
+    """
+    Register a callable invoked with every AddressChange.
+    """
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def publish(change: AddressChange):
+    """
+    Notify all listeners of a committed write.
+
+    A failing listener is logged and skipped; the write itself is already
+    committed and must not be reported as failed.
+    """
+    for listener in _listeners:
+        try:
+            listener(change)
+        except Exception:
+            logger.exception(f"Address change listener {listener!r} failed")
@@ -6,11 +6,18 @@ DB Access Layer for Address API
     - Executes database queries
     - Manages DB Operations
     - Performs CRUD operations
+    - Bumps the dataset version (and row count) inside every write transaction
 
 """
 
+from sqlalchemy import and_, or_, not_, insert, update, delete
 from sqlalchemy.orm import Session
+from app.core.config import BULK_INSERT_BATCH_SIZE, BULK_WRITE_CHUNK_SIZE
 from app.models.address import Address
+from app.repo import address_events
+from app.repo.address_events import AddressChange
+from app.repo.dataset_version import bump_addresses_version, ADDRESSES_VERSION, ADDRESSES_ROW_COUNT
+from app.utils.geo_grid import grid_cell
 
 
 class AddressRepository:
@@ -27,11 +34,76 @@ class AddressRepository:
         Returns:
             Address: Newly created address object
         """
+        address.grid_cell = grid_cell(address.latitude, address.longitude)
         db.add(address)
+        version = db.execute(bump_addresses_version(1)).scalar()
         db.commit()
         db.refresh(address)
+        address_events.publish(AddressChange(
+            "create",
+            after=[(address.id, address.latitude, address.longitude)],
+            version=version
+        ))
         return address
 
+    @staticmethod
+    def bulk_create(db: Session, rows: list, batch_size: int = BULK_INSERT_BATCH_SIZE):
+        """
+        Insert many address records in a single transaction.
+
+        Rows are sent as multi-row INSERT ... RETURNING statements of
+        `batch_size` rows, without building ORM objects or refreshing them.
+
+        Args:
+            db (Session): Active database session
+            rows (list): Validated address field dicts
+            batch_size (int): Rows per INSERT statement
+
+        Returns:
+            List[int]: Generated IDs, in the order of `rows`
+        """
+        if not rows:
+            return []
+
+        table = Address.__table__
+
+        # SQLAlchemy has no ordering sentinel for SQLite and would fall back
+        # to one INSERT per row. A multi-row INSERT into a rowid table hands
+        # out ascending ids in VALUES order, so sorting RETURNING restores it.
+        ordered = db.get_bind().dialect.name != "sqlite"
+        statement = insert(table).returning(table.c.id, sort_by_parameter_order=ordered)
+
+        ids = []
+        for start in range(0, len(rows), batch_size):
+            batch = [
+                {**row, "grid_cell": grid_cell(row["latitude"], row["longitude"])}
+                for row in rows[start:start + batch_size]
+            ]
+            batch_ids = db.execute(statement, batch).scalars().all()
+            ids.extend(batch_ids if ordered else sorted(batch_ids))
+        version = db.execute(bump_addresses_version(len(ids))).scalar()
+        db.commit()
+
+        address_events.publish(AddressChange(
+            "create",
+            after=[(address_id, row["latitude"], row["longitude"]) for address_id, row in zip(ids, rows)],
+            version=version
+        ))
+        return ids
+
+    @staticmethod
+    def get_version(db: Session):
+        """
+        Current version of the addresses table (see app/repo/dataset_version.py).
+
+        Args:
+            db (Session): Active database session
+
+        Returns:
+            int: Version, bumped by every committed write
+        """
+        return db.execute(ADDRESSES_VERSION).scalar() or 0
+
     @staticmethod
     def get(db: Session, address_id: int, skip: int = 0, limit: int = 100):
         """
@@ -49,17 +121,100 @@ class AddressRepository:
         return db.query(Address).filter(Address.id == address_id).first()
 
     @staticmethod
-    def get_all(db: Session):
+    def estimate_count(db: Session):
+        """
+        Number of address rows as kept next to the dataset version.
+
+        Every repository write adjusts it in its own transaction, so it is
+        current without running COUNT(*); writes made around the repository
+        (manual SQL) are not reflected.
+
+        Args:
+            db (Session): Active database session
+
+        Returns:
+            int | None: Row count, None when it is not known yet
+        """
+        return db.execute(ADDRESSES_ROW_COUNT).scalar()
+
+    @staticmethod
+    def get_many(db: Session, address_ids: list):
         """
-        Fetch all address records from database.
+        Fetch the addresses with the given IDs.
 
         Args:
             db (Session): Active database session
+            address_ids (list): Address primary keys
 
         Returns:
-            List[Address]: List of all addresses
+            List[Address]: Matching addresses ordered by ID
+        """
+        if not address_ids:
+            return []
+        return db.query(Address).filter(Address.id.in_(address_ids)).order_by(Address.id).all()
+
+    @staticmethod
+    def find_rows(db: Session, address_ids: list, columns: tuple):
+        """
+        Fetch the given columns of the addresses with the given IDs as plain
+        tuples, without loading ORM objects.
+
+        Args:
+            db (Session): Active database session
+            address_ids (list): Address primary keys
+            columns (tuple): Address column names to select
+
+        Returns:
+            List[Row]: Rows (in `columns` order) ordered by ID
+        """
+        if not address_ids:
+            return []
+        query = db.query(*(getattr(Address, column) for column in columns))
+        return query.filter(Address.id.in_(address_ids)).order_by(Address.id).all()
+
+    @staticmethod
+    def find_coordinates_in_area(db: Session, boxes: list, cell_ranges: list = None, exclude: list = None):
         """
-        return db.query(Address).all()
+        (id, latitude, longitude) of the addresses inside any of the boxes,
+        without loading ORM objects.
+
+        Args:
+            db (Session): Active database session
+            boxes (list): (min_lat, max_lat, min_lon, max_lon) boxes
+            cell_ranges (list, optional): Inclusive (first_cell, last_cell)
+                grid ranges covering the boxes
+            exclude (list, optional): Boxes whose addresses are skipped
+                (e.g. an area already fetched)
+
+        Returns:
+            List[Tuple[int, float, float]]: Coordinates, in no particular
+                order (callers sort what is left after their own filtering)
+        """
+        query = db.query(Address.id, Address.latitude, Address.longitude)
+        query = AddressRepository._in_area(query, boxes, cell_ranges)
+        if exclude:
+            query = query.filter(not_(AddressRepository._in_boxes(exclude)))
+        return [tuple(row) for row in query.all()]
+
+    @staticmethod
+    def _in_boxes(boxes: list):
+        return or_(*(
+            and_(
+                Address.latitude.between(min_lat, max_lat),
+                Address.longitude.between(min_lon, max_lon)
+            )
+            for min_lat, max_lat, min_lon, max_lon in boxes
+        ))
+
+    @staticmethod
+    def _in_area(query, boxes: list, cell_ranges: list = None):
+        query = query.filter(AddressRepository._in_boxes(boxes))
+
+        if cell_ranges is not None:
+            query = query.filter(or_(*(
+                Address.grid_cell.between(first, last) for first, last in cell_ranges
+            )))
+        return query
     
     @staticmethod
     def update(db: Session, address: Address,update_data: dict = None):
@@ -73,12 +228,118 @@ class AddressRepository:
         Returns:
             Address: Updated address object
         """
+        before = [(address.id, address.latitude, address.longitude)]
+
         for key, value in update_data.items():
             setattr(address, key, value)
+        address.grid_cell = grid_cell(address.latitude, address.longitude)
+        version = db.execute(bump_addresses_version()).scalar()
         db.commit()
         db.refresh(address)
+        address_events.publish(AddressChange(
+            "update",
+            before=before,
+            after=[(address.id, address.latitude, address.longitude)],
+            version=version
+        ))
         return address
 
+    @staticmethod
+    def find_coordinates(db: Session, address_ids: list = None, city: str = None):
+        """
+        Fetch (id, latitude, longitude) of the addresses selected by IDs or city.
+
+        Args:
+            db (Session): Active database session
+            address_ids (list, optional): Address primary keys
+            city (str, optional): Exact city name
+
+        Returns:
+            List[Tuple[int, float, float]]: Selected rows ordered by ID
+        """
+        query = db.query(Address.id, Address.latitude, Address.longitude)
+        if address_ids is not None:
+            rows = []
+            for start in range(0, len(address_ids), BULK_WRITE_CHUNK_SIZE):
+                chunk = address_ids[start:start + BULK_WRITE_CHUNK_SIZE]
+                rows.extend(query.filter(Address.id.in_(chunk)).all())
+            return sorted((tuple(row) for row in rows))
+        return [tuple(row) for row in query.filter(Address.city == city).order_by(Address.id).all()]
+
+    @staticmethod
+    def bulk_update(db: Session, rows: list, values: dict, chunk_size: int = BULK_WRITE_CHUNK_SIZE):
+        """
+        Apply the same field values to many addresses with set-based UPDATEs.
+
+        Runs one `UPDATE ... WHERE id IN (...)` per chunk of `chunk_size`
+        IDs, each chunk in its own transaction.
+
+        Args:
+            db (Session): Active database session
+            rows (list): (id, latitude, longitude) of the addresses to update
+            values (dict): Column values to set
+            chunk_size (int): IDs per statement / transaction
+
+        Returns:
+            int: Number of updated rows
+        """
+        values = dict(values)
+        if "latitude" in values:
+            values["grid_cell"] = grid_cell(values["latitude"], values["longitude"])
+
+        affected = 0
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            result = db.execute(
+                update(Address.__table__)
+                .where(Address.__table__.c.id.in_([row[0] for row in chunk]))
+                .values(**values)
+            )
+            version = db.execute(bump_addresses_version()).scalar()
+            db.commit()
+            affected += result.rowcount
+
+            address_events.publish(AddressChange(
+                "update",
+                before=chunk,
+                after=[
+                    (address_id, values.get("latitude", lat), values.get("longitude", lon))
+                    for address_id, lat, lon in chunk
+                ],
+                version=version
+            ))
+        return affected
+
+    @staticmethod
+    def bulk_delete(db: Session, rows: list, chunk_size: int = BULK_WRITE_CHUNK_SIZE):
+        """
+        Delete many addresses with set-based DELETEs.
+
+        Runs one `DELETE ... WHERE id IN (...)` per chunk of `chunk_size`
+        IDs, each chunk in its own transaction.
+
+        Args:
+            db (Session): Active database session
+            rows (list): (id, latitude, longitude) of the addresses to delete
+            chunk_size (int): IDs per statement / transaction
+
+        Returns:
+            int: Number of deleted rows
+        """
+        affected = 0
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            result = db.execute(
+                delete(Address.__table__)
+                .where(Address.__table__.c.id.in_([row[0] for row in chunk]))
+            )
+            version = db.execute(bump_addresses_version(-result.rowcount)).scalar()
+            db.commit()
+            affected += result.rowcount
+
+            address_events.publish(AddressChange("delete", before=chunk, version=version))
+        return affected
+
     @staticmethod
     def delete(db: Session, address: Address):
         """
@@ -88,5 +349,9 @@ class AddressRepository:
             db (Session): Active database session
             address (Address): Address ORM object to delete
         """
+        before = [(address.id, address.latitude, address.longitude)]
+
         db.delete(address)
+        version = db.execute(bump_addresses_version(-1)).scalar()
         db.commit()
+        address_events.publish(AddressChange("delete", before=before, version=version))
@@ -0,0 +1,119 @@
+# app/repo/address_repo_async.py
+
+""" 
+Async DB Access Layer for Address API 
+
+    - AsyncSession counterpart of AddressRepository (DATABASE_MODE 'async')
+    - Same CRUD operations, dataset version bumps and write notifications
+    - Awaits the driver (aiosqlite / asyncpg) instead of blocking a thread
+
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.address import Address
+from app.repo import address_events
+from app.repo.address_events import AddressChange
+from app.repo.dataset_version import bump_addresses_version, ADDRESSES_VERSION
+from app.utils.geo_grid import grid_cell
+
+
+class AsyncAddressRepository:
+
+    @staticmethod
+    async def create(db: AsyncSession, address: Address):
+        """
+        Create a new address record.
+
+        Args:
+            db (AsyncSession): Active async database session
+            address (Address): Address ORM object
+
+        Returns:
+            Address: Newly created address object
+        """
+        address.grid_cell = grid_cell(address.latitude, address.longitude)
+        db.add(address)
+        version = (await db.execute(bump_addresses_version(1))).scalar()
+        await db.commit()
+        await db.refresh(address)
+        address_events.publish(AddressChange(
+            "create",
+            after=[(address.id, address.latitude, address.longitude)],
+            version=version
+        ))
+        return address
+
+    @staticmethod
+    async def get_version(db: AsyncSession):
+        """
+        Current version of the addresses table (see app/repo/dataset_version.py).
+
+        Args:
+            db (AsyncSession): Active async database session
+
+        Returns:
+            int: Version, bumped by every committed write
+        """
+        return (await db.execute(ADDRESSES_VERSION)).scalar() or 0
+
+    @staticmethod
+    async def get(db: AsyncSession, address_id: int):
+        """
+        Fetch a single address by ID.
+
+        Args:
+            db (AsyncSession): Active async database session
+            address_id (int): Address primary key
+
+        Returns:
+            Address | None:
+                Address object if found,
+                otherwise None.
+        """
+        result = await db.execute(select(Address).where(Address.id == address_id))
+        return result.scalars().first()
+
+    @staticmethod
+    async def update(db: AsyncSession, address: Address, update_data: dict = None):
+        """
+        Update an existing address record.
+
+        Args:
+            db (AsyncSession): Active async database session
+            address (Address): Address ORM object to update
+
+        Returns:
+            Address: Updated address object
+        """
+        before = [(address.id, address.latitude, address.longitude)]
+
+        for key, value in update_data.items():
+            setattr(address, key, value)
+        address.grid_cell = grid_cell(address.latitude, address.longitude)
+        version = (await db.execute(bump_addresses_version())).scalar()
+        await db.commit()
+        await db.refresh(address)
+        address_events.publish(AddressChange(
+            "update",
+            before=before,
+            after=[(address.id, address.latitude, address.longitude)],
+            version=version
+        ))
+        return address
+
+    @staticmethod
+    async def delete(db: AsyncSession, address: Address):
+        """
+        Delete an existing address record.
+
+        Args:
+            db (AsyncSession): Active async database session
+            address (Address): Address ORM object to delete
+        """
+        before = [(address.id, address.latitude, address.longitude)]
+
+        await db.delete(address)
+        version = (await db.execute(bump_addresses_version(-1))).scalar()
+        await db.commit()
+        address_events.publish(AddressChange("delete", before=before, version=version))
@@ -0,0 +1,287 @@
+# app/repo/coordinate_snapshot.py
+
+"""
+In-Memory Coordinate Snapshot
+#############################
+
+Process-local, columnar copy of (id, latitude, longitude) for every address,
+so geo queries can be answered without loading ORM objects.
+
+Layout:
+    - Contiguous int64 ids and float64 radians / latitude cosines
+    - A tombstone bitmap (`_alive`) clearing the bit of deleted slots
+    - Compaction once tombstones exceed GEO_SNAPSHOT_COMPACT_RATIO
+
+The snapshot is loaded at startup and patched from the repository's
+write notifications (see app/repo/address_events.py). Writes made by other
+processes only show up in the shared dataset version: the service then
+invalidates the snapshot and reloads it before its next use (`refresh`).
+Writes notified while a load is reading the table are replayed on top of it.
+"""
+
+import math
+import threading
+from sqlalchemy.orm import Session
+from app.core.config import GEO_SNAPSHOT_COMPACT_RATIO
+from app.models.address import Address
+from app.repo.address_events import AddressChange
+from app.utils.distance import EARTH_RADIUS_KM, np
+
+
+class CoordinateSnapshot:
+
+    def __init__(self, capacity: int = 1024):
+        self.loaded = False
+        self.stale = False
+        self._epoch = 0
+        self._pending = None
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int):
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._lat = np.zeros(capacity, dtype=np.float64)
+        self._lon = np.zeros(capacity, dtype=np.float64)
+        self._cos_lat = np.zeros(capacity, dtype=np.float64)
+        self._alive = np.zeros(capacity, dtype=bool)
+
+        # scratch buffers reused by every scan
+        self._term = np.empty(capacity, dtype=np.float64)
+        self._work = np.empty(capacity, dtype=np.float64)
+        self._mask = np.empty(capacity, dtype=bool)
+
+        self._size = 0
+        self._dead_count = 0
+        self._slots = {}
+
+    def _grow(self):
+        size = self._size
+        ids, lat, lon, cos_lat, alive = self._ids, self._lat, self._lon, self._cos_lat, self._alive
+        slots, dead_count = self._slots, self._dead_count
+
+        self._allocate(max(len(ids) * 2, 1024))
+        self._ids[:size] = ids[:size]
+        self._lat[:size] = lat[:size]
+        self._lon[:size] = lon[:size]
+        self._cos_lat[:size] = cos_lat[:size]
+        self._alive[:size] = alive[:size]
+        self._size, self._slots, self._dead_count = size, slots, dead_count
+
+    def _write(self, slot: int, address_id: int, lat: float, lon: float):
+        lat_rad = math.radians(lat)
+        self._ids[slot] = address_id
+        self._lat[slot] = lat_rad
+        self._lon[slot] = math.radians(lon)
+        self._cos_lat[slot] = math.cos(lat_rad)
+        self._alive[slot] = True
+
+    def _upsert(self, address_id: int, lat: float, lon: float):
+        slot = self._slots.get(address_id)
+        if slot is None:
+            if self._size == len(self._ids):
+                self._grow()
+            slot = self._size
+            self._size += 1
+            self._slots[address_id] = slot
+        self._write(slot, address_id, lat, lon)
+
+    def _remove(self, address_id: int):
+        slot = self._slots.pop(address_id, None)
+        if slot is None:
+            return
+        self._alive[slot] = False
+        self._dead_count += 1
+
+        if self._dead_count > self._size * GEO_SNAPSHOT_COMPACT_RATIO:
+            self._compact()
+
+    def _compact(self):
+        alive = self._alive[:self._size].copy()
+        count = int(alive.sum())
+
+        for column in (self._ids, self._lat, self._lon, self._cos_lat):
+            column[:count] = column[:self._size][alive]
+        self._alive[:] = False
+        self._alive[:count] = True
+
+        self._size = count
+        self._dead_count = 0
+        self._slots = {int(address_id): slot for slot, address_id in enumerate(self._ids[:count])}
+
+    def load(self, db: Session):
+        """
+        Replace the snapshot contents with the current addresses table.
+
+        Args:
+            db (Session): Active database session
+        """
+        with self._load_lock:
+            self._load(db)
+
+    def refresh(self, db: Session):
+        """
+        Reload the snapshot if it was invalidated; concurrent callers wait
+        for a single reload.
+
+        Args:
+            db (Session): Active database session
+        """
+        with self._load_lock:
+            if self.stale:
+                self._load(db)
+
+    def _load(self, db: Session):
+        with self._lock:
+            epoch = self._epoch
+            self._pending = []
+
+        try:
+            rows = db.query(Address.id, Address.latitude, Address.longitude).order_by(Address.id).all()
+        except Exception:
+            with self._lock:
+                self._pending = None
+            raise
+
+        with self._lock:
+            self._allocate(max(len(rows), 1024))
+            for address_id, lat, lon in rows:
+                self._upsert(address_id, lat, lon)
+
+            # local writes notified while the rows were read
+            for change in self._pending:
+                self._apply(change)
+            self._pending = None
+
+            # invalidated meanwhile: the rows may predate that write
+            self.stale = epoch != self._epoch
+            self.loaded = not self.stale
+
+    def invalidate(self):
+        """
+        Mark the snapshot out of date (e.g. after a write by another
+        process); nearby queries fall back to SQL until `refresh` reloads it.
+        """
+        with self._lock:
+            self._epoch += 1
+            self.stale = self.stale or self.loaded
+            self.loaded = False
+
+    def apply(self, change: AddressChange):
+        """
+        Patch the snapshot with a committed write (address_events listener).
+        """
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append(change)
+            elif self.loaded:
+                self._apply(change)
+
+    def _apply(self, change: AddressChange):
+        if change.action == "delete":
+            for address_id, _, _ in change.before:
+                self._remove(address_id)
+        else:
+            for address_id, lat, lon in change.after:
+                self._upsert(address_id, lat, lon)
+
+    def _haversine_terms(self, lat: float, lon: float):
+        # haversine term of every slot against (lat, lon), in the scratch
+        # buffer `_term` (caller holds the lock)
+        n = self._size
+        lat_rad, lon_rad = math.radians(lat), math.radians(lon)
+        term, work = self._term[:n], self._work[:n]
+
+        # sin^2(d_lat / 2)
+        np.subtract(self._lat[:n], lat_rad, out=term)
+        np.multiply(term, 0.5, out=term)
+        np.sin(term, out=term)
+        np.multiply(term, term, out=term)
+
+        # cos(lat1) * cos(lat2) * sin^2(d_lon / 2)
+        np.subtract(self._lon[:n], lon_rad, out=work)
+        np.multiply(work, 0.5, out=work)
+        np.sin(work, out=work)
+        np.multiply(work, work, out=work)
+        np.multiply(work, self._cos_lat[:n], out=work)
+        np.multiply(work, math.cos(lat_rad), out=work)
+
+        np.add(term, work, out=term)
+        return term
+
+    def within(self, lat: float, lon: float, radius_km: float, with_coordinates: bool = False):
+        """
+        IDs of the addresses within a radius of a point.
+
+        The scan runs entirely in the preallocated scratch buffers; only the
+        returned arrays are allocated.
+
+        Args:
+            lat (float): Latitude of the center point
+            lon (float): Longitude of the center point
+            radius_km (float): Radius in kilometers
+            with_coordinates (bool): Also return the matches' coordinates
+
+        Returns:
+            numpy.ndarray | Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+                Matching address IDs in ascending order, with their latitudes
+                and longitudes in degrees when `with_coordinates` is set
+        """
+        angular = radius_km / EARTH_RADIUS_KM
+        if angular < 0:
+            threshold = -1.0
+        elif angular >= math.pi:
+            threshold = 1.0
+        else:
+            threshold = math.sin(angular / 2) ** 2
+
+        with self._lock:
+            n = self._size
+            term, mask = self._haversine_terms(lat, lon), self._mask[:n]
+            np.less_equal(term, threshold, out=mask)
+            np.logical_and(mask, self._alive[:n], out=mask)
+
+            ids = self._ids[:n][mask]
+            if not with_coordinates:
+                return np.sort(ids)
+
+            order = np.argsort(ids)
+            return (
+                ids[order],
+                np.degrees(self._lat[:n][mask][order]),
+                np.degrees(self._lon[:n][mask][order]),
+            )
+
+    def nearest(self, lat: float, lon: float, k: int):
+        """
+        The k addresses closest to a point, from one pass over the snapshot.
+
+        Args:
+            lat (float): Latitude of the center point
+            lon (float): Longitude of the center point
+            k (int): Number of addresses to return
+
+        Returns:
+            List[Tuple[int, float]]: (id, distance in km), closest first,
+                ties by ID
+        """
+        with self._lock:
+            n = self._size
+            count = min(k, n - self._dead_count)
+            if count <= 0:
+                return []
+
+            term, dead = self._haversine_terms(lat, lon), self._mask[:n]
+            np.logical_not(self._alive[:n], out=dead)
+            term[dead] = np.inf
+
+            closest = np.argpartition(term, count - 1)[:count]
+            ids = self._ids[closest]
+            terms = term[closest]
+
+        distances = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(terms, 0.0, 1.0)))
+        order = np.lexsort((ids, distances))
+        return [(int(ids[i]), float(distances[i])) for i in order]
+
+
+coordinate_snapshot = CoordinateSnapshot() if np is not None else None
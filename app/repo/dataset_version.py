@@ -0,0 +1,46 @@
+# app/repo/dataset_version.py
+
+"""
+Dataset Version Counter
+#######################
+
+Monotonic version and row count of the addresses table, stored in
+`dataset_versions` (row created by sync_schema) so that every process
+sharing the database sees the same values.
+
+The repositories execute `bump_addresses_version(...)` inside each write
+transaction, right before the commit, and publish the version it returns
+with the AddressChange; a reader therefore never sees new rows with an
+old version. The same statement adjusts the row count by the rows the
+write added or removed. All statements work on Session and AsyncSession
+alike (`db.execute` / `await db.execute`).
+"""
+
+from sqlalchemy import select, update
+from app.models.address import Address
+from app.models.dataset_version import DatasetVersion
+
+
+ADDRESSES = Address.__tablename__
+
+_table = DatasetVersion.__table__
+
+
+def bump_addresses_version(rows_added: int = 0):
+    """
+    Statement bumping the addresses version, returning the new version.
+
+    Args:
+        rows_added (int): Rows the write inserted (negative: deleted)
+    """
+    return (
+        update(_table)
+        .where(_table.c.name == ADDRESSES)
+        .values(version=_table.c.version + 1, row_count=_table.c.row_count + rows_added)
+        .returning(_table.c.version)
+    )
+
+
+ADDRESSES_VERSION = select(_table.c.version).where(_table.c.name == ADDRESSES)
+
+ADDRESSES_ROW_COUNT = select(_table.c.row_count).where(_table.c.name == ADDRESSES)
@@ -10,7 +10,8 @@ Schemas for Address API:
 
 """
 
-from pydantic import BaseModel, Field
+from typing import Optional
+from pydantic import BaseModel, Field, model_validator
 
 class AddressBase(BaseModel):
     """ Base Schema for Address """
@@ -31,6 +32,45 @@ class AddressUpdate(AddressBase):
     pass
 
 
+class AddressPatch(BaseModel):
+    """ Partial Address Fields Applied By Bulk Update """
+    name: Optional[str] = None
+    street: Optional[str] = None
+    city: Optional[str] = None
+    latitude: Optional[float] = Field(None, ge=-90, le=90, description="Latitude must be between -90 and 90")
+    longitude: Optional[float] = Field(None, ge=-180, le=180, description="Longitude must be between -180 and 180")
+
+    @model_validator(mode="after")
+    def check_fields(self):
+        if (self.latitude is None) != (self.longitude is None):
+            raise ValueError("latitude and longitude must be updated together")
+        if not self.model_dump(exclude_none=True):
+            raise ValueError("at least one field must be updated")
+        return self
+
+
+class AddressSelection(BaseModel):
+    """ Selects Addresses For Bulk Operations: By IDs Or By City """
+    ids: Optional[list[int]] = Field(None, min_length=1)
+    city: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_selector(self):
+        if (self.ids is None) == (self.city is None):
+            raise ValueError("provide exactly one of ids or city")
+        return self
+
+
+class AddressBulkUpdate(AddressSelection):
+    """ Address Bulk Update Schema """
+    values: AddressPatch
+
+
+class AddressBulkDelete(AddressSelection):
+    """ Address Bulk Delete Schema """
+    pass
+
+
 class AddressResponse(AddressBase):
     """ Address Response Schema Including ID """
     id: int
@@ -38,3 +78,23 @@ class AddressResponse(AddressBase):
     model_config = {
         "from_attributes": True  
     }
+
+
+# AddressResponse fields in serialization order; the fast read paths select
+# these columns as plain tuples instead of loading Address entities
+ADDRESS_RESPONSE_FIELDS = tuple(AddressResponse.model_fields)
+
+
+class AddressFieldsResponse(BaseModel):
+    """ Address Response Limited To The Fields Requested With `fields=` """
+    name: Optional[str] = None
+    street: Optional[str] = None
+    city: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    id: Optional[int] = None
+
+
+class AddressDistanceResponse(AddressResponse):
+    """ Address Response Schema Including Distance From The Query Point """
+    distance_km: float
@@ -6,21 +6,78 @@ Business Logic Layer for Address API
 
 This module contains all the core business logic for managing addresses.
 Responsibilities include:
-- Creating, updating, deleting addresses
-- Fetching all addresses with pagination, search, and sorting
+- Creating, updating, deleting addresses (single and bulk)
+- Fetching single addresses and listing pages through the response cache
+- Fetching all addresses with pagination (offset or keyset cursor), search, and sorting
 - Retrieving nearby addresses using distance calculations
+- Finding the k nearest addresses ordered by distance
+- Streaming exports and NDJSON/CSV imports of the address table
+- Reading the dataset version behind the ETags of the listings
 - Handling exceptions for not found resources
 
 It acts as a bridge between the repository layer and API layer,
 keeping the service logic centralized and reusable.
 """
 
+import math
+from math import ceil
 from app.repo.address_repo import AddressRepository
-from app.core.exceptions import NotFoundException
-from app.models.address import Address
-from app.utils.distance import haversine
+from app.repo.coordinate_snapshot import coordinate_snapshot
+from app.repo import address_events
+from app.core.cache import CountCache, AddressCache, LRUCache, NearbyCache, DatasetVersionGuard
+from app.core.config import NEAREST_INITIAL_RADIUS_KM, EXPORT_BATCH_SIZE, IMPORT_CHUNK_SIZE, IMPORT_MAX_ERRORS
+from app.core.config import CACHE_MAX_ENTRIES, CACHE_TTL_SECONDS
+from app.core.config import NEARBY_CACHE_ENABLED, NEARBY_CACHE_MAX_ENTRIES, NEARBY_CACHE_MAX_CANDIDATES
+from app.core.exceptions import NotFoundException, BadRequestException
+from app.models.address import Address, SORTABLE_COLUMNS
+from app.utils.distance import EARTH_RADIUS_KM, CoordinateBatch, haversine_batch, within_radius, np
+from app.utils.geo_grid import bounding_box, cell_ranges
+from app.utils.cursor import encode_cursor, decode_cursor
+from app.utils.export import EXPORT_COLUMNS, ENCODERS
+from app.utils.ingest import iter_records
+from app.database.full_text import fts_enabled, fts_hits, match_expression
 from app.core.logger import logger
+from app.core.metrics import register_cache_stats
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.orm import Session
+from pydantic import ValidationError
+from app.schemas.address_schema import AddressCreate, AddressResponse, ADDRESS_RESPONSE_FIELDS
+
+
+# Totals of the paginated listing, kept in step with repository writes
+count_cache = CountCache()
+address_events.subscribe(count_cache.apply)
+
+# Single addresses and listing pages, dropped as soon as a write commits
+address_cache = AddressCache(
+    items=LRUCache(CACHE_MAX_ENTRIES, CACHE_TTL_SECONDS),
+    pages=LRUCache(CACHE_MAX_ENTRIES, CACHE_TTL_SECONDS),
+)
+address_events.subscribe(address_cache.apply)
+
+# Nearby candidate sets per quantized (point, radius), dropped per grid cell
+nearby_cache = NearbyCache(NEARBY_CACHE_MAX_ENTRIES, NEARBY_CACHE_MAX_CANDIDATES)
+address_events.subscribe(nearby_cache.apply)
+
+
+def _drop_local_state():
+    count_cache.clear()
+    address_cache.clear()
+    nearby_cache.clear()
+    if coordinate_snapshot is not None:
+        coordinate_snapshot.invalidate()
+
+
+# Drops all of the above, and the coordinate snapshot, when another worker
+# wrote to the shared database
+dataset_version_guard = DatasetVersionGuard(clear=_drop_local_state)
+address_events.subscribe(dataset_version_guard.apply)
+
+register_cache_stats("address", address_cache.items.stats)
+register_cache_stats("list_page", address_cache.pages.stats)
+register_cache_stats("nearby", nearby_cache.stats)
+
+
 class AddressService:
 
     @staticmethod
@@ -35,9 +92,214 @@ class AddressService:
         Returns:
             Address: Created address object
         """
-        address = Address(**data.dict())
+        address = Address(**data.model_dump())
         return AddressRepository.create(db, address)
     
+    @staticmethod
+    def validate_items(items: list, start_index: int = 0):
+        """
+        Validate raw address payloads against AddressCreate in one pass.
+
+        Args:
+            items (list): Raw address dicts
+            start_index (int): Index reported for the first item
+
+        Returns:
+            Tuple[List[dict], List[dict]]: Valid address field dicts and one
+                error entry ({'index', 'fields'}) per invalid item
+        """
+        rows, errors = [], []
+        for index, item in enumerate(items, start=start_index):
+            try:
+                rows.append(AddressCreate.model_validate(item).model_dump())
+            except ValidationError as exc:
+                errors.append({
+                    "index": index,
+                    "fields": [
+                        {
+                            "name": ".".join(str(loc) for loc in err.get("loc", [])),
+                            "error_type": err.get("type"),
+                            "message": err.get("msg"),
+                        }
+                        for err in exc.errors()
+                    ]
+                })
+        return rows, errors
+
+    @staticmethod
+    def bulk_create(db: Session, items: list):
+        """
+        Create many addresses in a single transaction.
+
+        Invalid items are reported and skipped; the valid ones are still
+        inserted.
+
+        Args:
+            db (Session): SQLAlchemy database session
+            items (list): Raw address dicts
+
+        Returns:
+            Tuple[List[int], List[dict]]: IDs of the created addresses and
+                per-item validation errors
+        """
+        rows, errors = AddressService.validate_items(items)
+        ids = AddressRepository.bulk_create(db, rows)
+        return ids, errors
+
+    @staticmethod
+    def import_chunk(db: Session, records: list):
+        """
+        Validate and insert one chunk of an import in its own transaction.
+
+        Args:
+            db (Session): SQLAlchemy database session
+            records (list): (line number, raw address dict) pairs
+
+        Returns:
+            Tuple[int, List[dict]]: Number of inserted rows and per-row
+                validation errors ({'line', 'fields'})
+        """
+        lines = [line for line, _ in records]
+        rows, errors = AddressService.validate_items([item for _, item in records])
+        ids = AddressRepository.bulk_create(db, rows)
+
+        errors = [{"line": lines[error["index"]], "fields": error["fields"]} for error in errors]
+        return len(ids), errors
+
+    @staticmethod
+    async def import_stream(chunks, fmt: str, write_chunk, chunk_size: int = IMPORT_CHUNK_SIZE):
+        """
+        Import an NDJSON/CSV upload while it is being received.
+
+        Records are parsed incrementally and handed to `write_chunk` every
+        `chunk_size` rows, so each chunk is committed on its own and a bad
+        row only costs its own line.
+
+        Args:
+            chunks: Async iterator of the request body bytes
+            fmt (str): 'ndjson' or 'csv'
+            write_chunk: Awaitable callable running `import_chunk` on a
+                session, e.g. through `run_in_threadpool` or `run_sync`
+            chunk_size (int): Rows per committed chunk
+
+        Returns:
+            dict: Import report (processed, inserted, failed, chunks and the
+                first IMPORT_MAX_ERRORS errors)
+        """
+        report = {"processed": 0, "inserted": 0, "failed": 0, "chunks": 0, "errors": []}
+
+        def record_errors(errors):
+            report["failed"] += len(errors)
+            room = IMPORT_MAX_ERRORS - len(report["errors"])
+            report["errors"].extend(errors[:max(room, 0)])
+
+        async def flush(records):
+            inserted, errors = await write_chunk(records)
+            report["inserted"] += inserted
+            report["chunks"] += 1
+            record_errors(errors)
+            logger.info(
+                f"Import progress: {report['processed']} rows processed, "
+                f"{report['inserted']} inserted, {report['failed']} failed"
+            )
+
+        records = []
+        async for line, item, error in iter_records(chunks, fmt):
+            report["processed"] += 1
+            if error is not None:
+                record_errors([{"line": line, "fields": [error]}])
+                continue
+
+            records.append((line, item))
+            if len(records) >= chunk_size:
+                await flush(records)
+                records = []
+
+        if records:
+            await flush(records)
+
+        report["errors_truncated"] = report["failed"] > len(report["errors"])
+        return report
+
+    @staticmethod
+    def bulk_update(db: Session, data):
+        """
+        Apply the same changes to all addresses selected by IDs or city.
+
+        Args:
+            db (Session): SQLAlchemy database session
+            data (AddressBulkUpdate): Selection and field values to set
+
+        Returns:
+            int: Number of updated addresses
+        """
+        rows = AddressRepository.find_coordinates(db, address_ids=data.ids, city=data.city)
+        return AddressRepository.bulk_update(db, rows, data.values.model_dump(exclude_none=True))
+
+    @staticmethod
+    def bulk_delete(db: Session, data):
+        """
+        Delete all addresses selected by IDs or city.
+
+        Args:
+            db (Session): SQLAlchemy database session
+            data (AddressBulkDelete): Selection of addresses to delete
+
+        Returns:
+            int: Number of deleted addresses
+        """
+        rows = AddressRepository.find_coordinates(db, address_ids=data.ids, city=data.city)
+        return AddressRepository.bulk_delete(db, rows)
+
+    @staticmethod
+    def dataset_version(db: Session):
+        """
+        Read the current dataset version, without touching the addresses
+        table, and drop the process-local caches if another worker wrote
+        since this one last looked.
+
+        Args:
+            db (Session): SQLAlchemy database session
+
+        Returns:
+            int: Version of the addresses table
+        """
+        version = AddressRepository.get_version(db)
+        dataset_version_guard.observe(version)
+        return version
+
+    @staticmethod
+    def get(db: Session, address_id: int):
+        """
+        Fetch one address by ID, served from the response cache when possible
+        (and no other worker wrote since it was cached).
+
+        Args:
+            db (Session): SQLAlchemy database session
+            address_id (int): ID of the address
+
+        Raises:
+            NotFoundException: If address with given ID does not exist
+
+        Returns:
+            AddressResponse: The address
+        """
+        # drops the cache first if another worker wrote since the last look
+        AddressService.dataset_version(db)
+
+        cached = address_cache.get_item(address_id)
+        if cached is not None:
+            return cached
+
+        generation = address_cache.generation
+        address = AddressRepository.get(db, address_id)
+        if not address:
+            raise NotFoundException("Address not found")
+
+        result = AddressResponse.model_validate(address)
+        address_cache.set_item(address_id, result, generation)
+        return result
+
     @staticmethod
     def update(db, address_id, data):
         """
@@ -57,13 +319,192 @@ class AddressService:
         address = AddressRepository.get(db, address_id)
         if not address:
             raise NotFoundException("Address not found")
-        
-        update_data = data.dict(exclude_unset=True)
-        
-        return AddressRepository.update(db, address, data.dict())
+
+        return AddressRepository.update(db, address, data.model_dump())
+
+    @staticmethod
+    def _search_query(db: Session, search: str = None, by_relevance: bool = False, sort_by: str = "id"):
+        """
+        Base address query with the optional name/city search filter applied.
+
+        On SQLite with the FTS5 index the words of `search` are matched as
+        token prefixes; otherwise (and for searches without any word) it is a
+        substring ILIKE match, served by trigram indexes on PostgreSQL.
+        With `by_relevance` the best matches are ordered first.
+
+        When the query will be ordered by another column than the ID
+        (`sort_by`), the FTS hits only filter: the page is read by walking
+        the (sort_by, id) index in order and stops at LIMIT, instead of
+        sorting every hit of a broad term.
+        """
+        query = db.query(Address)
+        if not search:
+            return query
+
+        match = match_expression(search) if fts_enabled(db.get_bind()) else None
+        if match is not None:
+            hits = fts_hits(match)
+            if by_relevance:
+                return query.join(hits, hits.c.rowid == Address.id).order_by(hits.c.rank)
+            # `id + 0` is no rowid lookup, so SQLite cannot drive the query
+            # from the hits and sort them; it tests each row of the index walk
+            # against the hit list (built once) instead
+            target = Address.id if sort_by in ("id", "relevance") else Address.id + 0
+            return query.filter(target.in_(select(hits.c.rowid)))
+
+        # search filter
+        query = query.filter(
+            (Address.name.ilike(f"%{search}%")) |
+            (Address.city.ilike(f"%{search}%"))
+        )
+        if by_relevance and db.get_bind().dialect.name == "postgresql":
+            query = query.order_by(func.greatest(
+                func.similarity(Address.name, search),
+                func.similarity(Address.city, search)
+            ).desc())
+        return query
+
+    @staticmethod
+    def _search_key(db: Session, search: str = None):
+        """
+        Normalized form of a search filter, used as count cache key.
+        """
+        if not search:
+            return ""
+        if fts_enabled(db.get_bind()):
+            return match_expression(search) or search
+        return search
+
+    @staticmethod
+    def parse_sort(sort_by: str = "id"):
+        """
+        Validate a `sort_by=` value against the sortable columns.
+
+        Args:
+            sort_by (str): Column name or 'relevance'
+
+        Raises:
+            BadRequestException: If `sort_by` is not a sortable column
+
+        Returns:
+            str: `sort_by`
+        """
+        if sort_by != "relevance" and sort_by not in SORTABLE_COLUMNS:
+            raise BadRequestException(
+                f"Unknown sort_by: {sort_by} (allowed: relevance, {', '.join(SORTABLE_COLUMNS)})",
+                "INVALID_SORT"
+            )
+        return sort_by
+
+    @staticmethod
+    def _sort_column(sort_by: str):
+        """
+        Address column a listing is sorted by (the ID for 'relevance').
+        """
+        AddressService.parse_sort(sort_by)
+        return Address.id if sort_by == "relevance" else getattr(Address, sort_by)
+
+    @staticmethod
+    def _order(query, sort_by: str, sort_order: str):
+        """
+        Apply sorting, with the ID as tiebreaker so the order is total.
+        """
+        sort_column = AddressService._sort_column(sort_by)
+        columns = [sort_column] if sort_column is Address.id else [sort_column, Address.id]
+
+        if sort_order == "desc":
+            return query.order_by(*(column.desc() for column in columns))
+        return query.order_by(*(column.asc() for column in columns))
+
+    @staticmethod
+    def parse_fields(fields: str = None):
+        """
+        Validate a `fields=` sparse fieldset.
+
+        Args:
+            fields (str, optional): Comma-separated AddressResponse field names
+
+        Raises:
+            BadRequestException: If a name is not an address field
+
+        Returns:
+            tuple: Requested fields in AddressResponse order (every field
+                when `fields` is empty)
+        """
+        if not fields:
+            return ADDRESS_RESPONSE_FIELDS
+
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = sorted(requested - set(ADDRESS_RESPONSE_FIELDS))
+        if unknown:
+            raise BadRequestException(
+                f"Unknown fields: {', '.join(unknown)} (allowed: {', '.join(ADDRESS_RESPONSE_FIELDS)})",
+                "INVALID_FIELDS"
+            )
+        return tuple(field for field in ADDRESS_RESPONSE_FIELDS if field in requested) or ADDRESS_RESPONSE_FIELDS
+
+    @staticmethod
+    def _project(query, columns: tuple):
+        """
+        Select only the given Address columns, as plain rows.
+        """
+        return query.with_entities(*(getattr(Address, column) for column in columns))
+
+    @staticmethod
+    def count(db: Session, search: str = None, include_total: str = "exact"):
+        """
+        Count the addresses matching a search filter.
+
+        Args:
+            db (Session): SQLAlchemy database session
+            search (str, optional): Filter addresses by name or city
+            include_total (str): 'false' to skip counting, 'exact' for a
+                (cached) exact count, 'approx' to prefer any cached count or
+                the row count kept with the dataset version over running COUNT(*).
+                The row count only covers unfiltered listings: with a
+                search, 'approx' returns the (cached) exact count
+
+        Returns:
+            int | None: Number of matching addresses, None when skipped
+        """
+        if include_total == "false":
+            return None
+
+        key = AddressService._search_key(db, search)
+        cached = count_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # there is no estimate of a filtered count: a search is counted exactly
+        if include_total == "approx" and not search:
+            estimate = AddressRepository.estimate_count(db)
+            if estimate is not None:
+                return estimate
+
+        generation = count_cache.generation
+        total = AddressService._search_query(db, search).count()
+        count_cache.set(key, total, generation)
+        return total
+
+    @staticmethod
+    def next_cursor(address: Address, sort_by: str = "id", sort_order: str = "asc"):
+        """
+        Build the keyset cursor pointing just after an address.
+
+        Args:
+            address (Address | Row): Last address of the current page
+            sort_by (str): Column name the page is sorted by
+            sort_order (str): 'asc' or 'desc'
+
+        Returns:
+            str: Opaque cursor token
+        """
+        sort_column = AddressService._sort_column(sort_by)
+        return encode_cursor(sort_by, sort_order, getattr(address, sort_column.key), address.id)
 
     @staticmethod
-    def get_all(db: Session, skip: int = 0, limit: int = 10, search: str = None, sort_by: str = "id", sort_order: str = "asc"):
+    def get_all(db: Session, skip: int = 0, limit: int = 10, search: str = None, sort_by: str = "id", sort_order: str = "asc",
+                include_total: str = "exact", columns: tuple = None):
         """
         Retrieve addresses with optional search, sorting, and pagination.
 
@@ -72,29 +513,187 @@ class AddressService:
             skip (int): Number of records to skip (pagination)
             limit (int): Maximum number of records to return
             search (str, optional): Filter addresses by name or city
+            sort_by (str): Column name to sort by, or 'relevance' to order
+                search matches best first
+            sort_order (str): 'asc' or 'desc' for sorting order
+            include_total (str): 'false', 'approx' or 'exact' (see `count`)
+            columns (tuple, optional): Column names to select as plain rows
+                instead of loading Address entities
+
+        Returns:
+            Tuple[List[Address | Row], int | None]: List of addresses and total count
+        """
+        query = AddressService._search_query(db, search, by_relevance=sort_by == "relevance", sort_by=sort_by)
+
+        total = AddressService.count(db, search, include_total)
+        query = AddressService._order(query, sort_by, sort_order)
+        if columns is not None:
+            query = AddressService._project(query, columns)
+        return query.offset(skip).limit(limit).all(), total
+
+    @staticmethod
+    def get_page_after(db: Session, cursor: str = None, limit: int = 10, search: str = None,
+                       sort_by: str = "id", sort_order: str = "asc", include_total: str = "false",
+                       columns: tuple = None):
+        """
+        Retrieve the page following a keyset cursor.
+
+        Seeks with `(sort_col, id) > (last_value, last_id)` (or `<` when
+        descending), so the cost of a page does not grow with its depth.
+
+        Args:
+            db (Session): SQLAlchemy database session
+            cursor (str, optional): Cursor from a previous page, None for the first page
+            limit (int): Maximum number of records to return
+            search (str, optional): Filter addresses by name or city
             sort_by (str): Column name to sort by
             sort_order (str): 'asc' or 'desc' for sorting order
+            include_total (str): 'false', 'approx' or 'exact' (see `count`)
+            columns (tuple, optional): Column names to select as plain rows
+                (must include the sort column)
+
+        Raises:
+            BadRequestException: If the cursor is malformed or was issued
+                for a different sort
 
         Returns:
-            Tuple[List[Address], int]: List of addresses and total count
+            Tuple[List[Address | Row], str | None, int | None]:
+                Page of addresses, cursor of the next page (None on the last
+                page) and total count (None unless requested)
         """
-        query = db.query(Address)
+        if sort_by == "relevance":
+            raise BadRequestException("Cursor pagination does not support sort_by=relevance", "INVALID_CURSOR")
 
-        # search filter
-        if search:
-            query = query.filter(
-                (Address.name.ilike(f"%{search}%")) |
-                (Address.city.ilike(f"%{search}%"))
+        query = AddressService._search_query(db, search, sort_by=sort_by)
+        total = AddressService.count(db, search, include_total)
+
+        if cursor:
+            position = decode_cursor(cursor)
+            if position["sort_by"] != sort_by or position["sort_order"] != sort_order:
+                raise BadRequestException("Cursor does not match sort_by/sort_order", "INVALID_CURSOR")
+
+            sort_column = AddressService._sort_column(sort_by)
+            if sort_column is Address.id:
+                key, last = Address.id, position["id"]
+            else:
+                key, last = tuple_(sort_column, Address.id), tuple_(position["value"], position["id"])
+            query = query.filter(key < last if sort_order == "desc" else key > last)
+
+        # fetch one extra row to know whether another page follows
+        query = AddressService._order(query, sort_by, sort_order)
+        if columns is not None:
+            query = AddressService._project(query, columns)
+        results = query.limit(limit + 1).all()
+
+        next_cursor = None
+        if len(results) > limit:
+            results = results[:limit]
+            next_cursor = AddressService.next_cursor(results[-1], sort_by, sort_order)
+        return results, next_cursor, total
+
+    @staticmethod
+    def list_page(db: Session, page: int = 1, page_size: int = 10, search: str = None,
+                  sort_by: str = "id", sort_order: str = "asc", cursor: str = None, include_total: str = None,
+                  fields: tuple = ADDRESS_RESPONSE_FIELDS):
+        """
+        Retrieve one page of the address listing with its pagination metadata.
+
+        Without `cursor` the page is addressed by number (OFFSET) and counted
+        exactly by default; with a cursor it is fetched by keyset and only
+        counted when `include_total` asks for it.
+
+        Args:
+            db (Session): SQLAlchemy database session
+            page (int): Page number (offset mode)
+            page_size (int): Number of items per page
+            search (str, optional): Filter addresses by name or city
+            sort_by (str): Column name to sort by, or 'relevance'
+            sort_order (str): 'asc' or 'desc' for sorting order
+            cursor (str, optional): Keyset cursor of the page to fetch
+            include_total (str, optional): 'false', 'approx' or 'exact'
+            fields (tuple): AddressResponse fields to select and return
+                (see `parse_fields`)
+
+        Pages are served from the response cache until the next write.
+        Rows are selected as plain column tuples, not Address entities.
+
+        Returns:
+            Tuple[List[dict], dict]: Page of addresses (the requested
+                fields, in order) and the fields of PaginatedMeta (page,
+                page_size, total, total_pages, next_cursor)
+        """
+        key = (page, page_size, search, sort_by, sort_order, cursor, include_total, fields)
+        cached = address_cache.get_page(key)
+        if cached is not None:
+            return cached
+        generation = address_cache.generation
+
+        # the cursor of the next page needs the sort column and ID of the
+        # last row; they are selected after the requested fields
+        columns = fields + tuple(
+            column for column in dict.fromkeys((AddressService._sort_column(sort_by).key, "id"))
+            if column not in fields
+        )
+
+        if cursor is not None:
+            results, next_cursor, total = AddressService.get_page_after(
+                db, cursor=cursor, limit=page_size, search=search, sort_by=sort_by,
+                sort_order=sort_order, include_total=include_total or "false", columns=columns
+            )
+            page = None
+        else:
+            skip = (page - 1) * page_size
+            results, total = AddressService.get_all(
+                db, skip=skip, limit=page_size, search=search, sort_by=sort_by,
+                sort_order=sort_order, include_total=include_total or "exact", columns=columns
             )
 
-        # sorting
-        sort_column = getattr(Address, sort_by, Address.id)
-        sort_column = sort_column.desc() if sort_order == "desc" else sort_column.asc()
-        query = query.order_by(sort_column)
+            # Cursor to continue with keyset pagination after this page
+            # (relevance order has no keyset, see get_page_after)
+            has_more = len(results) == page_size if total is None else skip + len(results) < total
+            next_cursor = None
+            if results and has_more and sort_by != "relevance":
+                next_cursor = AddressService.next_cursor(results[-1], sort_by, sort_order)
+
+        total_pages = None
+        if total is not None:
+            total_pages = ceil(total / page_size) if total else 1
+
+        result = [dict(zip(fields, row)) for row in results], {
+            "page": page,
+            "page_size": page_size,
+            "total": total,
+            "total_pages": total_pages,
+            "next_cursor": next_cursor,
+        }
+        address_cache.set_page(key, result, generation)
+        return result
+
+    @staticmethod
+    def export(db: Session, fmt: str = "ndjson", search: str = None, sort_by: str = "id", sort_order: str = "asc"):
+        """
+        Stream the (optionally filtered and sorted) address table as text chunks.
+
+        Rows are read as plain column tuples through a server-side cursor
+        (`stream_results` + `yield_per`), so memory stays constant
+        regardless of the table size.
 
-        total = query.count()
-        results = query.offset(skip).limit(limit).all()
-        return results, total
+        Args:
+            db (Session): SQLAlchemy database session, kept open while iterating
+            fmt (str): 'ndjson' or 'csv'
+            search (str, optional): Filter addresses by name or city
+            sort_by (str): Column name to sort by, or 'relevance'
+            sort_order (str): 'asc' or 'desc' for sorting order
+
+        Yields:
+            str: Encoded chunk of EXPORT_BATCH_SIZE rows (CSV starts with its header)
+        """
+        query = AddressService._search_query(db, search, by_relevance=sort_by == "relevance", sort_by=sort_by)
+        query = AddressService._order(query, sort_by, sort_order)
+        query = query.with_entities(*(getattr(Address, column) for column in EXPORT_COLUMNS))
+
+        result = db.execute(query.statement.execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE))
+        yield from ENCODERS[fmt](result.partitions())
 
     @staticmethod
     def delete(db, address_id):
@@ -115,10 +714,57 @@ class AddressService:
         AddressRepository.delete(db, address)
 
     @staticmethod
-    def nearby(db, lat, lon, distance, skip=0, limit=10):
+    def _snapshot(db: Session):
+        """
+        The coordinate snapshot, current at the shared dataset version, or
+        None when it is disabled or could not be brought up to date.
+
+        Another worker's write shows up as a newer version: the guard then
+        invalidates the snapshot and it is reloaded here.
+        """
+        if coordinate_snapshot is None or not (coordinate_snapshot.loaded or coordinate_snapshot.stale):
+            return None
+
+        AddressService.dataset_version(db)
+        if coordinate_snapshot.stale:
+            coordinate_snapshot.refresh(db)
+        return coordinate_snapshot if coordinate_snapshot.loaded else None
+
+    @staticmethod
+    def _nearby_candidates(db: Session, lat: float, lon: float, radius_km: float):
+        """
+        IDs and coordinates of every address within a radius, ordered by ID,
+        read from the coordinate snapshot when loaded, else from the
+        bounding box (and grid cells) of the radius.
+        """
+        snapshot = AddressService._snapshot(db)
+        if snapshot is not None:
+            ids, latitudes, longitudes = snapshot.within(lat, lon, radius_km, with_coordinates=True)
+            return ids, CoordinateBatch(latitudes, longitudes)
+
+        boxes = bounding_box(lat, lon, radius_km)
+        rows = AddressRepository.find_coordinates_in_area(db, boxes, cell_ranges(boxes))
+
+        # the boxes over-cover the circle: keep the rows inside it, and only
+        # sort those by ID
+        mask = within_radius(lat, lon, CoordinateBatch([row[1] for row in rows], [row[2] for row in rows]), radius_km)
+        rows = sorted(row for row, inside in zip(rows, mask) if inside)
+
+        ids = [row[0] for row in rows]
+        if np is not None:
+            ids = np.asarray(ids, dtype=np.int64)
+        return ids, CoordinateBatch([row[1] for row in rows], [row[2] for row in rows])
+
+    @staticmethod
+    def nearby(db, lat, lon, distance, skip=0, limit=10, fields=ADDRESS_RESPONSE_FIELDS):
         """
         Retrieve addresses within a certain distance from given coordinates
-        using the Python haversine function, with pagination support.
+        using a vectorized haversine check, with pagination support.
+
+        The radius check runs on a candidate set of (id, coordinates): cached
+        per quantized query (see NearbyCache), else taken from the in-memory
+        coordinate snapshot or the bounding box of the radius. Only the
+        requested page is loaded from the database.
 
         Args:
             db (Session): SQLAlchemy database session
@@ -127,23 +773,99 @@ class AddressService:
             distance (float): Radius in kilometers to search within
             skip (int): Number of records to skip (pagination)
             limit (int): Maximum number of records to return
+            fields (tuple): AddressResponse fields to select and return
+                (see `parse_fields`)
+
+        Returns:
+            Tuple[List[dict], int]: Page of nearby addresses (the requested
+                fields, in order) and total count
+        """
+        quantized = NearbyCache.quantize(lat, lon, distance) if NEARBY_CACHE_ENABLED else None
+
+        if quantized is None:
+            candidates = AddressService._nearby_candidates(db, lat, lon, distance)
+        else:
+            key, center_lat, center_lon, radius = quantized
+            candidates = nearby_cache.get(key)
+            if candidates is None:
+                generation = nearby_cache.generation
+                candidates = AddressService._nearby_candidates(db, center_lat, center_lon, radius)
+                nearby_cache.set(key, candidates, center_lat, center_lon, radius, generation)
+
+        # Exact radius check against the candidates
+        ids, batch = candidates
+        mask = within_radius(lat, lon, batch, distance)
+        if np is not None:
+            ids = ids[mask]
+        else:
+            ids = [address_id for address_id, inside in zip(ids, mask) if inside]
+
+        page_ids = [int(address_id) for address_id in ids[skip: skip + limit]]
+        rows = AddressRepository.find_rows(db, page_ids, fields)
+        return [dict(zip(fields, row)) for row in rows], len(ids)
+
+    @staticmethod
+    def nearest(db, lat, lon, k=10):
+        """
+        Retrieve the k addresses closest to given coordinates.
+
+        Candidates are ranked as (id, coordinates) tuples: in one pass over
+        the coordinate snapshot when it is loaded, else by an expanding ring
+        search (see `_nearest_in_rings`). Only the k winners are loaded as
+        Address entities.
+
+        Args:
+            db (Session): SQLAlchemy database session
+            lat (float): Latitude of the center point
+            lon (float): Longitude of the center point
+            k (int): Number of addresses to return
 
         Returns:
-            Tuple[List[Address], int]: Paginated list of nearby addresses and total count
+            List[Tuple[Address, float]]: Addresses with their distance in km,
+                closest first
+        """
+        snapshot = AddressService._snapshot(db)
+        if snapshot is not None:
+            ranked = snapshot.nearest(lat, lon, k)
+        else:
+            ranked = AddressService._nearest_in_rings(db, lat, lon, k)
+
+        addresses = {
+            address.id: address
+            for address in AddressRepository.get_many(db, [address_id for address_id, _ in ranked])
+        }
+        # an address deleted since it was ranked is skipped
+        return [(addresses[address_id], distance) for address_id, distance in ranked if address_id in addresses]
+
+    @staticmethod
+    def _nearest_in_rings(db, lat, lon, k):
         """
+        (id, distance in km) of the k addresses closest to a point, closest
+        first (ties by ID).
 
-        # Fetch all addresses 
-        addresses = AddressRepository.get_all(db)
+        The radius doubles until at least k addresses lie inside it; every
+        address closer than the k-th hit is then guaranteed to be inside.
+        Each step only fetches the coordinates of the ring it adds to the
+        area already searched.
+        """
+        max_radius = math.pi * EARTH_RADIUS_KM
+        radius = NEAREST_INITIAL_RADIUS_KM
+        searched = None
+        ids, distances = [], []
 
-        # Filter haversine
-        nearby_addresses = [
-            addr for addr in addresses
-            if haversine(lat, lon, addr.latitude, addr.longitude) <= distance
-        ]
+        while True:
+            boxes = bounding_box(lat, lon, radius)
+            rows = AddressRepository.find_coordinates_in_area(db, boxes, cell_ranges(boxes), exclude=searched)
+            searched = boxes
 
-        total = len(nearby_addresses)
+            ids.extend(row[0] for row in rows)
+            distances.extend(float(distance) for distance in haversine_batch(lat, lon, CoordinateBatch(
+                [row[1] for row in rows], [row[2] for row in rows]
+            )))
 
-        # pagination
-        paginated_results = nearby_addresses[skip: skip + limit]
+            inside = [(address_id, distance) for address_id, distance in zip(ids, distances) if distance <= radius]
+            if len(inside) >= k or radius >= max_radius:
+                inside.sort(key=lambda item: (item[1], item[0]))
+                return inside[:k]
 
-        return paginated_results, total
\ No newline at end of file
+            radius = min(radius * 2, max_radius)
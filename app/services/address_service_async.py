@@ -0,0 +1,148 @@
+# app/services/address_service_async.py
+
+"""
+Async Business Logic Layer for Address API
+##########################################
+
+AsyncSession counterpart of AddressService, used when DATABASE_MODE is
+'async'.
+
+- Get/create/update/delete go through AsyncAddressRepository (get also
+  shares the response cache of AddressService)
+- Listing, nearby and nearest reuse the AddressService query logic through
+  `AsyncSession.run_sync`, so both modes build exactly the same SQL while
+  the I/O is awaited on the async driver
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.repo.address_repo_async import AsyncAddressRepository
+from app.services.address_service import AddressService, address_cache, dataset_version_guard
+from app.core.exceptions import NotFoundException
+from app.models.address import Address
+from app.schemas.address_schema import AddressResponse
+
+
+class AsyncAddressService:
+
+    @staticmethod
+    async def create(db: AsyncSession, data):
+        """
+        Create a new address record.
+
+        Args:
+            db (AsyncSession): Async database session
+            data (AddressCreate): Pydantic model with address fields
+
+        Returns:
+            Address: Created address object
+        """
+        address = Address(**data.model_dump())
+        return await AsyncAddressRepository.create(db, address)
+
+    @staticmethod
+    async def dataset_version(db: AsyncSession):
+        """
+        Async AddressService.dataset_version.
+
+        Args:
+            db (AsyncSession): Async database session
+
+        Returns:
+            int: Version of the addresses table
+        """
+        version = await AsyncAddressRepository.get_version(db)
+        dataset_version_guard.observe(version)
+        return version
+
+    @staticmethod
+    async def get(db: AsyncSession, address_id: int):
+        """
+        Fetch one address by ID, served from the response cache when possible
+        (and no other worker wrote since it was cached).
+
+        Args:
+            db (AsyncSession): Async database session
+            address_id (int): ID of the address
+
+        Raises:
+            NotFoundException: If address with given ID does not exist
+
+        Returns:
+            AddressResponse: The address
+        """
+        # drops the cache first if another worker wrote since the last look
+        await AsyncAddressService.dataset_version(db)
+
+        cached = address_cache.get_item(address_id)
+        if cached is not None:
+            return cached
+
+        generation = address_cache.generation
+        address = await AsyncAddressRepository.get(db, address_id)
+        if not address:
+            raise NotFoundException("Address not found")
+
+        result = AddressResponse.model_validate(address)
+        address_cache.set_item(address_id, result, generation)
+        return result
+
+    @staticmethod
+    async def update(db: AsyncSession, address_id, data):
+        """
+        Update an existing address by ID.
+
+        Args:
+            db (AsyncSession): Async database session
+            address_id (int): ID of the address to update
+            data (AddressUpdate): Pydantic model with updated fields
+
+        Raises:
+            NotFoundException: If address with given ID does not exist
+
+        Returns:
+            Address: Updated address object
+        """
+        address = await AsyncAddressRepository.get(db, address_id)
+        if not address:
+            raise NotFoundException("Address not found")
+
+        return await AsyncAddressRepository.update(db, address, data.model_dump())
+
+    @staticmethod
+    async def delete(db: AsyncSession, address_id):
+        """
+        Delete an address by ID.
+
+        Args:
+            db (AsyncSession): Async database session
+            address_id (int): ID of the address to delete
+
+        Raises:
+            NotFoundException: If address with given ID does not exist
+        """
+        address = await AsyncAddressRepository.get(db, address_id)
+        if not address:
+            raise NotFoundException("Address not found")
+
+        await AsyncAddressRepository.delete(db, address)
+
+    @staticmethod
+    async def list_page(db: AsyncSession, **kwargs):
+        """
+        Async AddressService.list_page (same arguments and result).
+        """
+        return await db.run_sync(AddressService.list_page, **kwargs)
+
+    @staticmethod
+    async def nearby(db: AsyncSession, **kwargs):
+        """
+        Async AddressService.nearby (same arguments and result).
+        """
+        return await db.run_sync(AddressService.nearby, **kwargs)
+
+    @staticmethod
+    async def nearest(db: AsyncSession, **kwargs):
+        """
+        Async AddressService.nearest (same arguments and result).
+        """
+        return await db.run_sync(AddressService.nearest, **kwargs)
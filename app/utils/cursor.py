@@ -0,0 +1,59 @@
+# app/utils/cursor.py
+
+"""
+Opaque Pagination Cursors
+#########################
+
+A cursor records the sort key and ID of the last row of a page so the next
+page can seek with `WHERE (sort_col, id) > (value, id)` instead of OFFSET.
+
+The token is URL-safe base64 JSON; clients must treat it as opaque.
+"""
+
+import base64
+import binascii
+import json
+from app.core.exceptions import BadRequestException
+
+
+def encode_cursor(sort_by: str, sort_order: str, value, last_id: int) -> str:
+    """
+    Build a cursor pointing just after a row.
+
+    Args:
+        sort_by (str): Sort column name the page was ordered by
+        sort_order (str): 'asc' or 'desc'
+        value: Sort column value of the last row
+        last_id (int): ID of the last row
+
+    Returns:
+        str: Opaque cursor token
+    """
+    payload = json.dumps({"s": sort_by, "o": sort_order, "v": value, "id": last_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> dict:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        token (str): Opaque cursor token
+
+    Raises:
+        BadRequestException: If the token is malformed
+
+    Returns:
+        dict: {'sort_by', 'sort_order', 'value', 'id'}
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return {
+            "sort_by": payload["s"],
+            "sort_order": payload["o"],
+            "value": payload["v"],
+            "id": int(payload["id"]),
+        }
+    except (binascii.Error, ValueError, KeyError, TypeError, UnicodeDecodeError):
+        raise BadRequestException("Invalid pagination cursor", "INVALID_CURSOR")
@@ -3,14 +3,28 @@
 """
 Haversine Formula - Calculate distance between two points on a sphere
 
+    - haversine: distance between two scalar coordinates
+    - CoordinateBatch / haversine_batch / within_radius: vectorized NumPy
+      variants for one center against many coordinates
+
+When NumPy is not installed the batch functions fall back to calling the
+scalar haversine per coordinate.
 """
 
 
 import math
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+EARTH_RADIUS_KM = 6371
+
 
 def haversine(lat1, lon1, lat2, lon2):
-    R = 6371 
+    R = EARTH_RADIUS_KM
 
     d_lat = math.radians(lat2 - lat1)
     d_lon = math.radians(lon2 - lon1)
@@ -24,3 +38,84 @@ def haversine(lat1, lon1, lat2, lon2):
 
     c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
     return R * c
+
+
+class CoordinateBatch:
+    """
+    Many coordinates preconverted to radians, with their latitude cosines
+    cached so repeated distance queries against the same points skip that work.
+
+    Args:
+        latitudes (Sequence[float]): Latitudes in degrees
+        longitudes (Sequence[float]): Longitudes in degrees
+    """
+
+    def __init__(self, latitudes, longitudes):
+        if np is None:
+            self.latitudes = list(latitudes)
+            self.longitudes = list(longitudes)
+            return
+
+        self.lat_rad = np.radians(np.asarray(latitudes, dtype=np.float64))
+        self.lon_rad = np.radians(np.asarray(longitudes, dtype=np.float64))
+        self.cos_lat = np.cos(self.lat_rad)
+
+    def __len__(self):
+        if np is None:
+            return len(self.latitudes)
+        return len(self.lat_rad)
+
+    def haversine_term(self, lat, lon):
+        """
+        Return the haversine `a` term between (lat, lon) and every coordinate.
+        """
+        lat_rad = math.radians(lat)
+        a = np.sin((self.lat_rad - lat_rad) / 2) ** 2
+        a += math.cos(lat_rad) * self.cos_lat * np.sin((self.lon_rad - math.radians(lon)) / 2) ** 2
+        return a
+
+
+def haversine_batch(lat, lon, batch: CoordinateBatch):
+    """
+    Distances in kilometers from one point to every coordinate of a batch.
+
+    Args:
+        lat (float): Latitude of the center point
+        lon (float): Longitude of the center point
+        batch (CoordinateBatch): Coordinates to measure against
+
+    Returns:
+        numpy.ndarray | List[float]: Distance per coordinate, in batch order
+    """
+    if np is None:
+        return [haversine(lat, lon, lat2, lon2) for lat2, lon2 in zip(batch.latitudes, batch.longitudes)]
+
+    a = np.clip(batch.haversine_term(lat, lon), 0.0, 1.0)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def within_radius(lat, lon, batch: CoordinateBatch, radius_km):
+    """
+    Mask of the batch coordinates lying within a radius of one point.
+
+    The comparison is done on the haversine term against a precomputed
+    threshold, so no square root or arcsine is evaluated per coordinate.
+
+    Args:
+        lat (float): Latitude of the center point
+        lon (float): Longitude of the center point
+        batch (CoordinateBatch): Coordinates to test
+        radius_km (float): Radius in kilometers
+
+    Returns:
+        numpy.ndarray | List[bool]: True for coordinates inside the radius
+    """
+    if np is None:
+        return [d <= radius_km for d in haversine_batch(lat, lon, batch)]
+
+    angular = radius_km / EARTH_RADIUS_KM
+    if angular < 0:
+        return np.zeros(len(batch), dtype=bool)
+    if angular >= math.pi:
+        return np.ones(len(batch), dtype=bool)
+    return batch.haversine_term(lat, lon) <= math.sin(angular / 2) ** 2
@@ -0,0 +1,50 @@
+# app/utils/etag.py
+
+"""
+Entity Tags For Conditional GETs
+################################
+
+A listing's ETag combines the dataset version (see
+app/repo/dataset_version.py) with the normalized query parameters, so it
+changes as soon as any write commits and never depends on the body.
+
+A request whose If-None-Match carries the current tag is answered with
+304 Not Modified before the addresses table is queried.
+"""
+
+import hashlib
+import json
+
+
+def make_etag(version: int, *params) -> str:
+    """
+    Build the strong ETag of a response.
+
+    Args:
+        version (int): Dataset version the response is read at
+        *params: Normalized query parameters (JSON-serializable)
+
+    Returns:
+        str: Quoted entity tag, e.g. '"42-1f2e3d4c5b6a7988"'
+    """
+    digest = hashlib.sha1(json.dumps(params, separators=(",", ":")).encode()).hexdigest()[:16]
+    return f'"{version}-{digest}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Whether an If-None-Match header selects `etag` (weak comparison, as
+    RFC 9110 requires for If-None-Match).
+
+    Args:
+        if_none_match (str): Header value, None when absent
+        etag (str): Current entity tag
+
+    Returns:
+        bool: True when the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
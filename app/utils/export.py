@@ -0,0 +1,55 @@
+# app/utils/export.py
+
+"""
+Export Encoders
+###############
+
+Turn batches of address rows (tuples in EXPORT_COLUMNS order) into text
+chunks for streaming responses:
+
+    - NDJSON: one JSON object per line
+    - CSV: header line followed by one record per line
+"""
+
+import csv
+import io
+import json
+
+
+EXPORT_COLUMNS = ("id", "name", "street", "city", "latitude", "longitude")
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def ndjson_chunks(batches):
+    """
+    Yield one NDJSON text chunk per batch of rows.
+    """
+    for batch in batches:
+        yield "".join(json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False) + "\n" for row in batch)
+
+
+def csv_chunks(batches):
+    """
+    Yield the CSV header, then one CSV text chunk per batch of rows.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+
+    writer.writerow(EXPORT_COLUMNS)
+    yield buffer.getvalue()
+
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(batch)
+        yield buffer.getvalue()
+
+
+ENCODERS = {
+    "ndjson": ndjson_chunks,
+    "csv": csv_chunks,
+}
@@ -0,0 +1,136 @@
+# app/utils/geo_grid.py
+
+"""
+Fixed Grid Spatial Index
+########################
+
+Splits the globe into square cells of GRID_CELL_DEGREES and maps every
+coordinate to an integer cell id (row-major, rows from the south pole,
+columns from the antimeridian).
+
+Because cells in one grid row are numbered contiguously, the area covered
+by a search radius can be expressed as a handful of `cell BETWEEN a AND b`
+ranges, which an index on the cell column serves directly.
+"""
+
+import math
+from app.core.config import GRID_CELL_DEGREES, NEARBY_MAX_GRID_RANGES
+from app.utils.distance import EARTH_RADIUS_KM
+
+
+GRID_ROWS = math.ceil(180 / GRID_CELL_DEGREES)
+GRID_COLS = math.ceil(360 / GRID_CELL_DEGREES)
+
+
+def _row(lat):
+    return min(max(int((lat + 90) // GRID_CELL_DEGREES), 0), GRID_ROWS - 1)
+
+
+def _col(lon):
+    return min(max(int((lon + 180) // GRID_CELL_DEGREES), 0), GRID_COLS - 1)
+
+
+def grid_cell(lat, lon):
+    """
+    Return the grid cell id containing a coordinate.
+
+    Args:
+        lat (float): Latitude in degrees
+        lon (float): Longitude in degrees
+
+    Returns:
+        int: Grid cell id
+    """
+    return _row(lat) * GRID_COLS + _col(lon)
+
+
+def bounding_box(lat, lon, radius_km):
+    """
+    Compute the lat/lon boxes enclosing a circle on the sphere.
+
+    Latitudes are clamped at the poles (a circle containing a pole spans
+    every longitude) and a box crossing the antimeridian is split in two.
+
+    Args:
+        lat (float): Latitude of the center point
+        lon (float): Longitude of the center point
+        radius_km (float): Circle radius in kilometers
+
+    Returns:
+        List[Tuple[float, float, float, float]]:
+            (min_lat, max_lat, min_lon, max_lon) boxes covering the circle
+    """
+    angular = radius_km / EARTH_RADIUS_KM
+    if angular >= math.pi:
+        return [(-90.0, 90.0, -180.0, 180.0)]
+
+    d_lat = math.degrees(angular)
+    min_lat = lat - d_lat
+    max_lat = lat + d_lat
+
+    # circle reaches over a pole
+    if min_lat <= -90 or max_lat >= 90:
+        return [(max(min_lat, -90.0), min(max_lat, 90.0), -180.0, 180.0)]
+
+    ratio = math.sin(angular) / math.cos(math.radians(lat))
+    if ratio >= 1:
+        return [(min_lat, max_lat, -180.0, 180.0)]
+
+    d_lon = math.degrees(math.asin(ratio))
+    min_lon = lon - d_lon
+    max_lon = lon + d_lon
+
+    # antimeridian wrap
+    if min_lon < -180:
+        return [
+            (min_lat, max_lat, min_lon + 360, 180.0),
+            (min_lat, max_lat, -180.0, max_lon),
+        ]
+    if max_lon > 180:
+        return [
+            (min_lat, max_lat, min_lon, 180.0),
+            (min_lat, max_lat, -180.0, max_lon - 360),
+        ]
+    return [(min_lat, max_lat, min_lon, max_lon)]
+
+
+def row_spans(boxes, max_rows: int = NEARBY_MAX_GRID_RANGES):
+    """
+    Convert bounding boxes into per-row grid column spans.
+
+    Args:
+        boxes (list): Boxes as returned by `bounding_box`
+        max_rows (int): Max spans before giving up
+
+    Returns:
+        List[Tuple[int, int, int]] | None:
+            Inclusive (row, first_col, last_col) spans, or None when the
+            area needs more than `max_rows` spans.
+    """
+    spans = []
+    for min_lat, max_lat, min_lon, max_lon in boxes:
+        first_col, last_col = _col(min_lon), _col(max_lon)
+        for row in range(_row(min_lat), _row(max_lat) + 1):
+            spans.append((row, first_col, last_col))
+
+        if len(spans) > max_rows:
+            return None
+    return spans
+
+
+def cell_ranges(boxes):
+    """
+    Convert bounding boxes into contiguous grid cell id ranges.
+
+    Args:
+        boxes (list): Boxes as returned by `bounding_box`
+
+    Returns:
+        List[Tuple[int, int]] | None:
+            Inclusive (first_cell, last_cell) ranges, or None when the
+            area needs more than NEARBY_MAX_GRID_RANGES ranges.
+    """
+    spans = row_spans(boxes)
+    if spans is None:
+        return None
+    return [(row * GRID_COLS + first, row * GRID_COLS + last) for row, first, last in spans]
@@ -0,0 +1,104 @@
+# app/utils/ingest.py
+
+"""
+Incremental Upload Parsing
+##########################
+
+Parses NDJSON or CSV uploads record by record while the request body is
+still arriving, so large imports never have to be buffered in memory.
+
+    - iter_lines: async byte chunks -> numbered text lines
+    - iter_records: numbered lines -> (line_no, record dict, parse error)
+
+CSV uploads must start with a header row; quoted fields may span lines.
+"""
+
+import codecs
+import csv
+import json
+
+
+async def iter_lines(chunks):
+    """
+    Split an async stream of byte chunks into UTF-8 text lines.
+
+    Yields:
+        Tuple[int, str]: 1-based line number and the line without newline
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    line_no = 0
+
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            line_no += 1
+            yield line_no, line.rstrip("\r")
+
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield line_no + 1, pending.rstrip("\r")
+
+
+def _parse_error(error_type: str, message: str):
+    return {"name": "", "error_type": error_type, "message": message}
+
+
+async def _ndjson_records(lines):
+    async for line_no, line in lines:
+        if not line.strip():
+            continue
+        try:
+            yield line_no, json.loads(line), None
+        except ValueError as exc:
+            yield line_no, None, _parse_error("json_invalid", str(exc))
+
+
+async def _csv_records(lines):
+    header = None
+    record, first_line = "", 0
+
+    async for line_no, line in lines:
+        if not record:
+            first_line = line_no
+        record = f"{record}\n{line}" if record else line
+
+        # a quoted field continues on the next line
+        if record.count('"') % 2:
+            continue
+
+        text, record = record, ""
+        if not text.strip():
+            continue
+
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in values]
+        elif len(values) != len(header):
+            yield first_line, None, _parse_error(
+                "csv_columns", f"Expected {len(header)} columns, got {len(values)}"
+            )
+        else:
+            yield first_line, dict(zip(header, values)), None
+
+    if record:
+        yield first_line, None, _parse_error("csv_invalid", "Unterminated quoted field")
+
+
+async def iter_records(chunks, fmt: str):
+    """
+    Parse an async stream of byte chunks as NDJSON or CSV records.
+
+    Args:
+        chunks: Async iterator of bytes (e.g. `request.stream()`)
+        fmt (str): 'ndjson' or 'csv'
+
+    Yields:
+        Tuple[int, dict | None, dict | None]:
+            Line number, parsed record (None on error) and parse error
+            (None on success)
+    """
+    records = _csv_records if fmt == "csv" else _ndjson_records
+    async for item in records(iter_lines(chunks)):
+        yield item
@@ -0,0 +1,135 @@
+# benchmarks/concurrency_benchmark.py
+
+"""
+Concurrency Benchmark: engine profiles
+######################################
+
+Runs the same mixed workload against a freshly seeded database once per
+engine profile (see app/database/profiles.py): reader threads fetch
+listing pages while writer threads insert and update single addresses,
+one commit per write.
+
+Reports throughput and p50/p95/p99 latency per operation, and the number
+of operations that failed (e.g. `database is locked`).
+
+Usage:
+    python -m benchmarks.concurrency_benchmark --rows 100000 --readers 8 --writers 4
+    python -m benchmarks.concurrency_benchmark --profiles default sqlite --duration 20
+"""
+
+import argparse
+import os
+import random
+import statistics
+import threading
+import time
+from sqlalchemy.orm import sessionmaker
+from app.database.profiles import make_engine
+from app.models.address import Address
+from app.utils.geo_grid import grid_cell
+from benchmarks.datasets import generate_rows, seed_database
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return 0.0
+    samples = sorted(samples)
+    return samples[min(int(len(samples) * fraction), len(samples) - 1)] * 1000
+
+
+def reader(Session, stop, samples, failures, page_size):
+    rng = random.Random()
+    while not stop.is_set():
+        started = time.perf_counter()
+        db = Session()
+        try:
+            db.query(Address).order_by(Address.id).offset(rng.randint(0, 1000)).limit(page_size).all()
+            samples.append(time.perf_counter() - started)
+        except Exception:
+            failures.append("read")
+        finally:
+            db.close()
+
+
+def writer(Session, stop, samples, failures, seed):
+    rng = random.Random(seed)
+    rows = generate_rows(10_000_000, seed)
+    while not stop.is_set():
+        started = time.perf_counter()
+        db = Session()
+        try:
+            if rng.random() < 0.5:
+                row = next(rows)
+                db.add(Address(**row, grid_cell=grid_cell(row["latitude"], row["longitude"])))
+            else:
+                address = db.get(Address, rng.randint(1, 1000))
+                if address is not None:
+                    address.name = f"{address.name.split('#')[0]}#{rng.randint(0, 999)}"
+            db.commit()
+            samples.append(time.perf_counter() - started)
+        except Exception:
+            db.rollback()
+            failures.append("write")
+        finally:
+            db.close()
+
+
+def run_profile(profile, args):
+    path = f"{args.database.removesuffix('.db')}_{profile}.db"
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    url = f"sqlite:///{path}"
+    seed_database(url, args.rows).dispose()
+
+    engine = make_engine(url, profile)
+    Session = sessionmaker(bind=engine)
+    stop = threading.Event()
+    read_samples, write_samples, failures = [], [], []
+
+    threads = [
+        threading.Thread(target=reader, args=(Session, stop, read_samples, failures, args.page_size))
+        for _ in range(args.readers)
+    ] + [
+        threading.Thread(target=writer, args=(Session, stop, write_samples, failures, seed))
+        for seed in range(args.writers)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+
+    print(f"\nprofile={profile}")
+    for name, samples in (("read", read_samples), ("write", write_samples)):
+        print(
+            f"  {name:<5} {len(samples) / args.duration:>9.1f} ops/s"
+            f"  p50 {percentile(samples, 0.50):7.2f} ms"
+            f"  p95 {percentile(samples, 0.95):7.2f} ms"
+            f"  p99 {percentile(samples, 0.99):7.2f} ms"
+            f"  mean {statistics.fmean(samples) * 1000 if samples else 0:7.2f} ms"
+        )
+    print(f"  failed reads {failures.count('read')}, failed writes {failures.count('write')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--database", default="bench_concurrency.db", help="SQLite file prefix, one file per profile")
+    parser.add_argument("--profiles", nargs="+", default=["default", "sqlite"])
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per profile")
+    parser.add_argument("--page-size", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{args.rows} rows, {args.readers} readers, {args.writers} writers, {args.duration}s per profile")
+    for profile in args.profiles:
+        run_profile(profile, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+# benchmarks/load_benchmark.py
+
+"""
+HTTP Load Benchmark
+###################
+
+Seeds deterministic datasets (see benchmarks/datasets.py) and drives the
+API over HTTP, either in-process through the ASGI `app` or against a
+uvicorn server, at a configurable concurrency.
+
+Scenarios:
+    create                 POST /addresses/
+    list_shallow           first pages of /addresses/list/
+    list_deep              last pages of /addresses/list/ (large OFFSET)
+    list_search_shallow    first pages with a search term
+    list_search_deep       deeper pages with a search term
+    nearby_small           /addresses/nearby/ with a 2 km radius around a city
+    nearby_large           /addresses/nearby/ with a 50 km radius around a city
+    delete                 DELETE /addresses/{id} of the rows created above
+
+For every dataset size and driver the harness records p50/p95/p99 latency,
+throughput, errors and peak RSS into a JSON file meant to be diffed across
+commits. Every run works on its own database file (never addresses.db
+unless passed explicitly); response caches are disabled unless --cache.
+
+Usage:
+    python -m benchmarks.load_benchmark --rows 10000 100000 1000000
+    python -m benchmarks.load_benchmark --rows 100000 --drivers uvicorn --concurrency 32
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import resource
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+SCENARIOS = [
+    "create", "list_shallow", "list_deep", "list_search_shallow", "list_search_deep",
+    "nearby_small", "nearby_large", "delete",
+]
+
+SEARCH_TERMS = ["kolkata", "rahul", "warehouse", "cafe", "tokyo", "maria"]
+PAGE_SIZE = 20
+
+
+def request_factory(scenario: str, rows: int, rng: random.Random, created: list):
+    """
+    Build the (method, url, json) of the next request of a scenario.
+    """
+    from benchmarks.datasets import CITIES, generate_rows
+
+    last_page = max(rows // PAGE_SIZE, 1)
+
+    if scenario == "create":
+        row = next(generate_rows(1, rng.randrange(1 << 30)))
+        return "POST", "/addresses/", row
+    if scenario == "list_shallow":
+        return "GET", f"/addresses/list/?page={rng.randint(1, 5)}&page_size={PAGE_SIZE}", None
+    if scenario == "list_deep":
+        return "GET", f"/addresses/list/?page={rng.randint(max(last_page - 50, 1), last_page)}&page_size={PAGE_SIZE}", None
+    if scenario == "list_search_shallow":
+        term = rng.choice(SEARCH_TERMS)
+        return "GET", f"/addresses/list/?search={term}&page={rng.randint(1, 5)}&page_size={PAGE_SIZE}", None
+    if scenario == "list_search_deep":
+        term = rng.choice(SEARCH_TERMS)
+        page = rng.randint(max(last_page // 20, 1), max(last_page // 10, 1))
+        return "GET", f"/addresses/list/?search={term}&page={page}&page_size={PAGE_SIZE}", None
+    if scenario in ("nearby_small", "nearby_large"):
+        _, lat, lon, _ = rng.choice(CITIES)
+        lat, lon = lat + rng.uniform(-0.05, 0.05), lon + rng.uniform(-0.05, 0.05)
+        distance = 2 if scenario == "nearby_small" else 50
+        return "GET", f"/addresses/nearby/?lat={lat:.5f}&lon={lon:.5f}&distance={distance}&page_size={PAGE_SIZE}", None
+    if scenario == "delete":
+        if not created:
+            return None
+        return "DELETE", f"/addresses/{created.pop()}", None
+    raise ValueError(scenario)
+
+
+async def run_scenario(client, scenario: str, args, created: list):
+    rng = random.Random(f"{args.seed}-{scenario}")
+    requests = args.requests if scenario != "delete" else min(args.requests, len(created))
+    samples, errors = [], 0
+
+    async def send(request):
+        method, url, body = request
+        response = await client.request(method, url, json=body)
+        if scenario == "create" and response.status_code == 200:
+            created.append(response.json()["data"]["id"])
+        return response.status_code < 400
+
+    for _ in range(min(args.warmup, requests) if scenario not in ("create", "delete") else 0):
+        await send(request_factory(scenario, args.current_rows, rng, created))
+
+    pending = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in pending:
+            request = request_factory(scenario, args.current_rows, rng, created)
+            if request is None:
+                return
+            started = time.perf_counter()
+            try:
+                ok = await send(request)
+            except Exception:
+                ok = False
+            samples.append(time.perf_counter() - started)
+            errors += not ok
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    samples.sort()
+
+    def pct(fraction):
+        return round(samples[min(int(len(samples) * fraction), len(samples) - 1)] * 1000, 3) if samples else None
+
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "throughput_rps": round(len(samples) / elapsed, 1) if elapsed else None,
+        "p50_ms": pct(0.50),
+        "p95_ms": pct(0.95),
+        "p99_ms": pct(0.99),
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 3) if samples else None,
+    }
+
+
+async def drive(client, args):
+    created = []
+    return {scenario: await run_scenario(client, scenario, args, created) for scenario in args.scenarios}
+
+
+def run_inprocess(args):
+    """
+    Drive the ASGI app in this process (DATABASE_URL must already point
+    at the benchmark database). Prints the JSON result on stdout.
+    """
+    import httpx
+    from app.main import app
+
+    # httpx logs every request at INFO: keep the log writes out of the latencies
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    async def main():
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                return await drive(client, args)
+
+    results = asyncio.run(main())
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"scenarios": results, "peak_rss_mb": round(peak_rss_mb, 1)}))
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _peak_rss_mb(pid: int):
+    # VmHWM: peak resident set size (Linux)
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+
+def run_uvicorn(args, env):
+    """
+    Start uvicorn on the benchmark database and drive it over TCP.
+    """
+    import httpx
+
+    port = _free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+         "--workers", "1", "--log-level", "warning"],
+        env=env,
+    )
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        deadline = time.monotonic() + 120
+        while True:
+            try:
+                httpx.get(f"{base_url}/docs", timeout=1)
+                break
+            except httpx.TransportError:
+                if server.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("uvicorn did not start")
+                time.sleep(0.2)
+
+        async def main():
+            limits = httpx.Limits(max_connections=args.concurrency)
+            async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+                return await drive(client, args)
+
+        results = asyncio.run(main())
+        return {"scenarios": results, "peak_rss_mb": _peak_rss_mb(server.pid)}
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def benchmark_env(args, database: str):
+    env = dict(os.environ)
+    env["DATABASE_URL"] = f"sqlite:///{database}"
+    env.setdefault("REQUEST_LOG_SAMPLE_RATE", "0")
+    if not args.cache:
+        env["CACHE_MAX_ENTRIES"] = "0"
+        env["NEARBY_CACHE_ENABLED"] = "false"
+    return env
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database", default="bench_load.db",
+                        help="SQLite file prefix, one file per dataset size (seeded once, reused)")
+    parser.add_argument("--reseed", action="store_true", help="Reseed even if the dataset file exists")
+    parser.add_argument("--drivers", nargs="+", default=["inprocess", "uvicorn"], choices=["inprocess", "uvicorn"])
+    parser.add_argument("--scenarios", nargs="+", default=SCENARIOS, choices=SCENARIOS)
+    parser.add_argument("--requests", type=int, default=500, help="Requests per scenario")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--cache", action="store_true", help="Keep the response caches enabled")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--inprocess-worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--current-rows", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.inprocess_worker:
+        run_inprocess(args)
+        return
+
+    from benchmarks.datasets import seed_database
+
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "concurrency": args.concurrency,
+            "requests_per_scenario": args.requests,
+            "cache": args.cache,
+        },
+        "results": {},
+    }
+
+    for rows in args.rows:
+        database = f"{args.database.removesuffix('.db')}_{rows}.db"
+        if args.reseed or not Path(database).exists():
+            started = time.perf_counter()
+            seed_database(f"sqlite:///{database}", rows, args.seed).dispose()
+            print(f"Seeded {rows} rows into {database} in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+        env = benchmark_env(args, database)
+        report["results"][str(rows)] = {}
+
+        for driver in args.drivers:
+            print(f"rows={rows} driver={driver}", file=sys.stderr)
+            if driver == "inprocess":
+                # fresh interpreter per run: the app binds DATABASE_URL at import
+                command = [sys.executable, "-m", "benchmarks.load_benchmark", "--inprocess-worker",
+                           "--current-rows", str(rows), "--seed", str(args.seed),
+                           "--requests", str(args.requests), "--warmup", str(args.warmup),
+                           "--concurrency", str(args.concurrency), "--scenarios", *args.scenarios]
+                output = subprocess.run(command, env=env, capture_output=True, text=True, check=True).stdout
+                result = json.loads(output.strip().splitlines()[-1])
+            else:
+                args.current_rows = rows
+                result = run_uvicorn(args, env)
+            report["results"][str(rows)][driver] = result
+
+            for scenario, figures in result["scenarios"].items():
+                print(
+                    f"  {scenario:<20} {figures['throughput_rps'] or 0:>8.1f} req/s"
+                    f"  p50 {figures['p50_ms'] or 0:8.2f}  p95 {figures['p95_ms'] or 0:8.2f}"
+                    f"  p99 {figures['p99_ms'] or 0:8.2f} ms  errors {figures['errors']}",
+                    file=sys.stderr,
+                )
+            print(f"  peak RSS {result['peak_rss_mb']} MB", file=sys.stderr)
+
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Results written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
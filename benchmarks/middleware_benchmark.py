@@ -0,0 +1,150 @@
+# benchmarks/middleware_benchmark.py
+
+"""
+Middleware Benchmark: request logging overhead
+##############################################
+
+Compares, in-process over ASGI (no network), the request latency and
+throughput of:
+
+- none:   no logging middleware
+- legacy: the former BaseHTTPMiddleware logger writing three lines per
+          request through RotatingFileHandlers on the event loop
+- asgi:   the current pure ASGI LoggingMiddleware on the queued handlers
+
+on a hello-world route and on `/addresses/list/` (page cache disabled
+unless --cached, so every list request reaches the database).
+
+Usage:
+    python -m benchmarks.middleware_benchmark --requests 5000 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import tempfile
+import time
+import uuid
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+import httpx
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from app.api.address_api import router
+from app.core.cache import LRUCache
+from app.database.base import Base
+from app.database.schema import sync_schema
+from app.database.session import engine
+from app.middleware.logging_middleware import LoggingMiddleware
+from app.services.address_service import address_cache
+
+
+ROUTES = {"hello": "/hello", "list": "/addresses/list/?page_size=10"}
+
+
+def legacy_logger(log_dir: Path):
+    legacy = logging.getLogger("benchmark.legacy")
+    legacy.propagate = False
+    formatter = logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(filename)s:%(lineno)d | %(message)s")
+    for name, level in (("app.log", logging.INFO), ("error.log", logging.ERROR)):
+        handler = RotatingFileHandler(log_dir / name, maxBytes=5 * 1024 * 1024, backupCount=5)
+        handler.setFormatter(formatter)
+        handler.setLevel(level)
+        legacy.addHandler(handler)
+    legacy.setLevel(logging.INFO)
+    return legacy
+
+
+def legacy_middleware(legacy):
+
+    class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+
+        async def dispatch(self, request: Request, call_next):
+            start_time = time.time()
+            request_id = str(uuid.uuid4())
+            request.state.request_id = request_id
+            legacy.info(f"Incoming request: {request.method} {request.url.path}", extra={"request_id": request_id})
+            try:
+                response = await call_next(request)
+                process_time = round(time.time() - start_time, 4)
+                legacy.info(f"Completed {response.status_code} in {process_time}s", extra={"request_id": request_id})
+                return response
+            finally:
+                legacy.info(f"Request completed: {request.method} {request.url.path}", extra={"request_id": request_id})
+
+    return LegacyLoggingMiddleware
+
+
+def build_app(variant: str, log_dir: Path):
+    app = FastAPI()
+
+    @app.get("/hello")
+    async def hello():
+        return {"message": "hello"}
+
+    app.include_router(router)
+
+    if variant == "legacy":
+        app.add_middleware(legacy_middleware(legacy_logger(log_dir)))
+    elif variant == "asgi":
+        app.add_middleware(LoggingMiddleware)
+    return app
+
+
+async def drive(app, path: str, requests: int, concurrency: int):
+    transport = httpx.ASGITransport(app=app)
+    samples = []
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(min(100, requests)):
+            await client.get(path)
+
+        remaining = iter(range(requests))
+
+        async def worker():
+            for _ in remaining:
+                started = time.perf_counter()
+                response = await client.get(path)
+                samples.append(time.perf_counter() - started)
+                assert response.status_code == 200, response.text
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    samples.sort()
+    return {
+        "rps": requests / elapsed,
+        "p50": samples[len(samples) // 2] * 1000,
+        "p99": samples[min(int(len(samples) * 0.99), len(samples) - 1)] * 1000,
+        "mean": statistics.fmean(samples) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--variants", nargs="+", default=["none", "legacy", "asgi"])
+    parser.add_argument("--cached", action="store_true", help="Keep the list page cache enabled")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    sync_schema(engine)
+    if not args.cached:
+        address_cache.pages = LRUCache(max_entries=0)
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        for route, path in ROUTES.items():
+            print(f"\n{route} ({path}), {args.requests} requests, concurrency {args.concurrency}")
+            for variant in args.variants:
+                result = asyncio.run(drive(build_app(variant, Path(log_dir)), path, args.requests, args.concurrency))
+                print(
+                    f"  {variant:<7} {result['rps']:>8.0f} req/s"
+                    f"  p50 {result['p50']:6.2f} ms  p99 {result['p99']:6.2f} ms  mean {result['mean']:6.2f} ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,493 @@
+# benchmarks/query_plans.py
+
+"""
+Query Plan Regression Check
+###########################
+
+Seeds a large synthetic database (see benchmarks/datasets.py), runs every
+kind of query AddressService / AddressRepository emits (listing per sort
+column with and without search, keyset pages, sparse fieldsets, counts,
+get by id, nearby, nearest, export and the write paths) and captures the
+SQL they send.
+
+Each captured statement is explained:
+    - SQLite: EXPLAIN QUERY PLAN
+    - PostgreSQL: EXPLAIN (ANALYZE, FORMAT JSON), inside a rolled back savepoint
+
+and checked for plan problems:
+    - full_scan:<table>         SQLite `SCAN <table>` / PostgreSQL Seq Scan
+    - full_index_scan:<table>   SQLite `SCAN <table> USING [COVERING] INDEX`
+                                without a constraint / PostgreSQL Index
+                                (Only) Scan without an Index Cond
+    - temp_btree:<purpose>      SQLite `USE TEMP B-TREE FOR ...`
+    - sort:<keys>               PostgreSQL Sort node
+
+A walk in ORDER BY order (rowid or index) that stops at the LIMIT, skips
+at most MAX_WALK_OFFSET rows and needs no sort afterwards is not a full
+scan. Every other problem fails the check (exit status 1) unless ACCEPTED
+lists it, with the reason, for that case (by name) and statement: the
+baseline never accepts problems. Plans and median
+statement timings are written to the report (and to the baseline with
+--update-baseline); a plan that differs from the baseline is reported,
+timings are informational, neither fails the check.
+
+tests/test_query_plans.py runs the check as part of the test suite.
+
+Usage:
+    python -m benchmarks.query_plans                       # check, compare with the baseline
+    python -m benchmarks.query_plans --update-baseline     # record the current plans
+    python -m benchmarks.query_plans --database postgresql://localhost/bench --reseed
+"""
+
+import argparse
+import fnmatch
+import json
+import re
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from sqlalchemy import event, inspect, text
+from sqlalchemy.orm import sessionmaker
+from app.database.profiles import make_engine
+from app.database.schema import sync_schema
+from app.models.address import Address, SORTABLE_COLUMNS
+from app.schemas.address_schema import AddressCreate, AddressUpdate, AddressBulkUpdate, AddressBulkDelete
+from app.services.address_service import AddressService, address_cache, count_cache, nearby_cache
+from benchmarks.datasets import CITIES, generate_rows, seed_database
+
+
+BASELINE = Path(__file__).with_name("query_plans_baseline.json")
+
+SORT_COLUMNS = list(SORTABLE_COLUMNS)
+SEARCH = "kolkata"
+PAGE_SIZE = 20
+# sparse fieldset of map clients
+MAP_FIELDS = ("latitude", "longitude", "id")
+
+# city with few rows, used by the bulk write cases
+SMALL_CITY = "Suva"
+
+# SCAN <table> [AS alias] [USING [COVERING] INDEX <index>]; a constrained
+# index lookup is reported as SEARCH instead
+_SQLITE_FULL_SCAN = re.compile(r"^SCAN (\w+)(?: AS \w+)?(?: USING (?:COVERING )?INDEX (\w+))?$")
+_SQLITE_TEMP_BTREE = re.compile(r"^USE TEMP B-TREE FOR (.+)$")
+# ORDER BY ... LIMIT of the outermost query (no subquery in between)
+_ORDER_LIMIT = re.compile(r"\bORDER BY\b(?:(?!\bSELECT\b).)*\bLIMIT\b", re.IGNORECASE)
+# OFFSET ?, OFFSET %(name)s or a literal OFFSET at the end of a statement
+_OFFSET = re.compile(r"\bOFFSET\s+(\?|%\((\w+)\)s|\d+)\s*$", re.IGNORECASE)
+
+_COUNT = r"^SELECT count\(\*\)"
+_FTS = r"\baddresses_fts\b"
+_TRIGRAM = r"\bILIKE\b|\bsimilarity\("
+
+# OFFSET up to which an ordered walk stopped by LIMIT is still bounded
+MAX_WALK_OFFSET = 1000
+
+# cases whose offset page (or the first page before a cursor) counts the
+# whole table for its exact total
+_EXACT_TOTAL_CASES = (
+    "count_exact", "list_deep_offset", "list_fields_map",
+    *(f"list_sort_{column}_{order}" for column in SORT_COLUMNS for order in ("asc", "desc")),
+    *(f"list_cursor_{column}" for column in SORT_COLUMNS),
+)
+_DEEP_OFFSET = "deep OFFSET pages walk every skipped row; clients continue with next_cursor instead"
+
+# Plan problems accepted on purpose, per dialect:
+#     (case names, issue pattern, statement regex, reason)
+# The issue pattern is an fnmatch pattern, the regex is searched in the
+# normalized SQL.
+ACCEPTED = {
+    "sqlite": [
+        (_EXACT_TOTAL_CASES, "full_index_scan:addresses", _COUNT,
+         "an exact total reads the narrowest index once; it is cached per filter until the next write"),
+        (("list_deep_offset",), "full_scan:addresses", r"\bOFFSET\b", _DEEP_OFFSET),
+        (("list_search_deep_offset",), "full_index_scan:addresses", r"\bOFFSET\b", _DEEP_OFFSET),
+        (("list_search_relevance",), "temp_btree:ORDER BY", _FTS,
+         "bm25 rank is computed per match, no index can hold it"),
+        (("export_first_chunk",), "full_index_scan:addresses", r"^SELECT",
+         "an export streams every row in ORDER BY order"),
+    ],
+    "postgresql": [
+        (_EXACT_TOTAL_CASES, "full_*scan:addresses", _COUNT,
+         "an exact total reads the table (or narrowest index) once; it is cached per filter until the next write"),
+        (("list_deep_offset", "list_search_deep_offset"), "full_*scan:addresses", r"\bOFFSET\b", _DEEP_OFFSET),
+        (("list_search_relevance",), "sort:*", _TRIGRAM,
+         "similarity() is computed per match, no index can hold it"),
+        (("export_first_chunk",), "full_*scan:addresses", r"^SELECT",
+         "an export streams every row in ORDER BY order"),
+    ],
+}
+
+
+def read_cases(rows: int):
+    """
+    Read-only cases: name -> callable(db).
+    """
+    middle = rows // 2
+    _, lat, lon, _ = CITIES[0]
+
+    def first_cursor(db, sort_by, search=None):
+        _, meta = AddressService.list_page(db, page_size=PAGE_SIZE, search=search, sort_by=sort_by)
+        return meta["next_cursor"]
+
+    cases = {
+        "get_by_id": lambda db: AddressService.get(db, middle),
+        "count_exact": lambda db: AddressService.count(db, include_total="exact"),
+        "count_approx": lambda db: AddressService.count(db, include_total="approx"),
+        "count_search": lambda db: AddressService.count(db, SEARCH, include_total="exact"),
+        "list_deep_offset": lambda db: AddressService.list_page(db, page=middle // PAGE_SIZE, page_size=PAGE_SIZE),
+        "list_search_relevance": lambda db: AddressService.list_page(
+            db, page_size=PAGE_SIZE, search=SEARCH, sort_by="relevance"),
+        "nearby_small": lambda db: AddressService.nearby(db, lat, lon, 2, limit=PAGE_SIZE),
+        "nearby_large": lambda db: AddressService.nearby(db, lat, lon, 50, limit=PAGE_SIZE),
+        "nearest": lambda db: AddressService.nearest(db, lat, lon, k=PAGE_SIZE),
+        "export_first_chunk": lambda db: next(AddressService.export(db, "ndjson", sort_by="name")),
+        "list_search_deep_offset": lambda db: AddressService.list_page(
+            db, page=100, page_size=PAGE_SIZE, search=SEARCH, sort_by="name"),
+        "list_fields_map": lambda db: AddressService.list_page(db, page_size=PAGE_SIZE, fields=MAP_FIELDS),
+        "nearby_fields_map": lambda db: AddressService.nearby(db, lat, lon, 2, limit=PAGE_SIZE, fields=MAP_FIELDS),
+    }
+
+    for column in SORT_COLUMNS:
+        for order in ("asc", "desc"):
+            cases[f"list_sort_{column}_{order}"] = (
+                lambda db, column=column, order=order: AddressService.list_page(
+                    db, page_size=PAGE_SIZE, sort_by=column, sort_order=order)
+            )
+        cases[f"list_search_sort_{column}"] = (
+            lambda db, column=column: AddressService.list_page(
+                db, page_size=PAGE_SIZE, search=SEARCH, sort_by=column)
+        )
+        cases[f"list_cursor_{column}"] = (
+            lambda db, column=column: AddressService.list_page(
+                db, cursor=first_cursor(db, column), page_size=PAGE_SIZE, sort_by=column)
+        )
+        cases[f"list_cursor_search_{column}"] = (
+            lambda db, column=column: AddressService.list_page(
+                db, cursor=first_cursor(db, column, SEARCH), page_size=PAGE_SIZE, search=SEARCH, sort_by=column)
+        )
+    return cases
+
+
+def write_cases(seed: int):
+    """
+    Write cases, each leaving the table as it found it: name -> callable(db).
+    """
+    row = next(generate_rows(1, seed))
+
+    def create_update_delete(db):
+        address = AddressService.create(db, AddressCreate(**row))
+        AddressService.update(db, address.id, AddressUpdate(**{**row, "street": "1 Plan Street"}))
+        AddressService.delete(db, address.id)
+
+    def bulk_create_delete(db):
+        ids, _ = AddressService.bulk_create(db, [dict(row) for _ in range(3)])
+        AddressService.bulk_delete(db, AddressBulkDelete(ids=ids))
+
+    def bulk_update_by_city(db):
+        AddressService.bulk_update(db, AddressBulkUpdate(city=SMALL_CITY, values={"city": SMALL_CITY}))
+
+    return {
+        "write_create_update_delete": create_update_delete,
+        "write_bulk_create_delete": bulk_create_delete,
+        "write_bulk_update_by_city": bulk_update_by_city,
+    }
+
+
+class StatementCapture:
+    """
+    Records the SQL statements (with parameters and duration) an engine
+    runs while `statements` is a list.
+    """
+
+    def __init__(self, engine):
+        self.statements = None
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info["plan_query_start"] = time.perf_counter()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.pop("plan_query_start", None)
+        if self.statements is None or started is None or executemany:
+            return
+        if Address.__tablename__ not in statement:
+            return
+        self.statements.append((statement, parameters, time.perf_counter() - started))
+
+    def run(self, fn, db):
+        self.statements = []
+        try:
+            fn(db)
+            return self.statements
+        finally:
+            self.statements = None
+
+
+def _normalize(statement: str) -> str:
+    return " ".join(statement.split())
+
+
+def _offset(statement, parameters):
+    """
+    OFFSET of the outermost query (0 without one).
+    """
+    match = _OFFSET.search(_normalize(statement))
+    if not match:
+        return 0
+    token, name = match.groups()
+    if name:
+        return int(parameters[name])
+    if token == "?":
+        # SQLAlchemy binds OFFSET last
+        return int(parameters[-1])
+    return int(token)
+
+
+def _drop_limited_walks(statement, parameters, issues):
+    """
+    A walk in ORDER BY order (rowid or index) that stops at the LIMIT is
+    bounded by the page, unless a sort follows or a deep OFFSET makes it
+    read (and throw away) every skipped row.
+    """
+    if not _ORDER_LIMIT.search(_normalize(statement)) or any(i.startswith(("temp_btree:", "sort:")) for i in issues):
+        return issues
+    if _offset(statement, parameters) > MAX_WALK_OFFSET:
+        return issues
+    return [issue for issue in issues if not issue.startswith(("full_scan:", "full_index_scan:"))]
+
+
+def explain_sqlite(conn, statement, parameters):
+    rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+
+    depth, plan, issues = {0: -1}, [], []
+    for node_id, parent, _, detail in rows:
+        depth[node_id] = depth.get(parent, -1) + 1
+        plan.append("  " * depth[node_id] + detail)
+
+        full_scan = _SQLITE_FULL_SCAN.match(detail)
+        if full_scan and full_scan.group(1) != "CONSTANT":
+            kind = "full_index_scan" if full_scan.group(2) else "full_scan"
+            issues.append(f"{kind}:{full_scan.group(1)}")
+        temp_btree = _SQLITE_TEMP_BTREE.match(detail)
+        if temp_btree:
+            issues.append(f"temp_btree:{temp_btree.group(1)}")
+
+    return plan, _drop_limited_walks(statement, parameters, issues)
+
+
+def explain_postgresql(conn, statement, parameters):
+    savepoint = conn.begin_nested()
+    try:
+        document = conn.exec_driver_sql(f"EXPLAIN (ANALYZE, FORMAT JSON) {statement}", parameters).scalar()
+    finally:
+        savepoint.rollback()
+    if isinstance(document, str):
+        document = json.loads(document)
+
+    plan, issues = [], []
+
+    def walk(node, depth):
+        relation = f" on {node['Relation Name']}" if "Relation Name" in node else ""
+        index = f" using {node['Index Name']}" if "Index Name" in node else ""
+        plan.append(f"{'  ' * depth}{node['Node Type']}{relation}{index} ({node.get('Actual Total Time', 0):.3f} ms)")
+        if node["Node Type"] == "Seq Scan":
+            issues.append(f"full_scan:{node['Relation Name']}")
+        if node["Node Type"] in ("Index Scan", "Index Only Scan") and "Index Cond" not in node:
+            issues.append(f"full_index_scan:{node['Relation Name']}")
+        if node["Node Type"] in ("Sort", "Incremental Sort"):
+            issues.append(f"sort:{', '.join(node.get('Sort Key', []))}")
+        for child in node.get("Plans", []):
+            walk(child, depth + 1)
+
+    walk(document[0]["Plan"], 0)
+    return plan, _drop_limited_walks(statement, parameters, issues)
+
+
+EXPLAINERS = {"sqlite": explain_sqlite, "postgresql": explain_postgresql}
+
+
+def reset_caches():
+    count_cache.clear()
+    address_cache.items.clear()
+    address_cache.pages.clear()
+    nearby_cache.clear()
+
+
+def run_case(engine, capture, explain, fn, repeat):
+    """
+    Run a case `repeat` times; explain every distinct statement it sent.
+
+    Returns:
+        dict: Issues and per-statement plans and median durations
+    """
+    Session = sessionmaker(bind=engine)
+    timings = {}
+    captured = {}
+
+    for _ in range(repeat):
+        reset_caches()
+        db = Session()
+        try:
+            for statement, parameters, elapsed in capture.run(fn, db):
+                sql = _normalize(statement)
+                captured.setdefault(sql, (statement, parameters))
+                timings.setdefault(sql, []).append(elapsed)
+        finally:
+            db.close()
+
+    statements, issues = [], set()
+    with engine.connect() as conn:
+        for sql, (statement, parameters) in captured.items():
+            plan, found = explain(conn, statement, parameters)
+            issues.update(found)
+            statements.append({
+                "sql": sql,
+                "plan": plan,
+                "issues": sorted(set(found)),
+                "median_ms": round(statistics.median(timings[sql]) * 1000, 3),
+            })
+        conn.rollback()
+
+    return {"issues": sorted(issues), "statements": statements}
+
+
+def accepted_reason(dialect: str, case: str, issue: str, sql: str):
+    """
+    Reason ACCEPTED gives for a problem of a statement, None if it is not
+    accepted.
+    """
+    for cases, issue_pattern, statement, reason in ACCEPTED.get(dialect, []):
+        if case in cases and fnmatch.fnmatchcase(issue, issue_pattern) \
+                and re.search(statement, sql):
+            return reason
+    return None
+
+
+def compare(results: dict, dialect: str):
+    """
+    Problems of each case that ACCEPTED does not list for its statement.
+
+    Returns:
+        dict: case -> list of unaccepted issues
+    """
+    regressions = {}
+    for case, result in results.items():
+        new = sorted({
+            issue
+            for statement in result["statements"]
+            for issue in statement["issues"]
+            if accepted_reason(dialect, case, issue, statement["sql"]) is None
+        })
+        if new:
+            regressions[case] = new
+    return regressions
+
+
+def changed_plans(results: dict, baseline: dict):
+    """
+    Cases whose plans differ from the baseline.
+
+    Returns:
+        list: case names
+    """
+    def plans(result):
+        return {statement["sql"]: statement["plan"] for statement in result["statements"]}
+
+    return sorted(case for case, result in results.items() if case in baseline and plans(result) != plans(baseline[case]))
+
+
+def prepare_database(url: str, rows: int, seed: int, reseed: bool):
+    if not reseed:
+        engine = make_engine(url)
+        seeded = False
+        if inspect(engine).has_table(Address.__tablename__):
+            with engine.connect() as conn:
+                seeded = conn.execute(text(f"SELECT count(*) FROM {Address.__tablename__}")).scalar() == rows
+        if seeded:
+            # possibly seeded by an older revision: upgrade it as the app would
+            sync_schema(engine)
+            with engine.begin() as conn:
+                conn.exec_driver_sql("ANALYZE")
+            return engine
+        engine.dispose()
+
+    started = time.perf_counter()
+    seed_database(url, rows, seed).dispose()
+    engine = make_engine(url)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+    print(f"Seeded {rows} rows into {url} in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database", default="bench_plans.db", help="SQLite file or SQLAlchemy URL")
+    parser.add_argument("--reseed", action="store_true", help="Reseed even if the database holds --rows rows")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per read case for the timings")
+    parser.add_argument("--baseline", default=str(BASELINE))
+    parser.add_argument("--update-baseline", action="store_true", help="Write the current plans as the baseline")
+    parser.add_argument("--output", default="query_plans.json", help="Report with every plan and timing")
+    args = parser.parse_args()
+
+    url = args.database if "://" in args.database else f"sqlite:///{args.database}"
+    engine = prepare_database(url, args.rows, args.seed, args.reseed)
+    dialect = engine.dialect.name
+    if dialect not in EXPLAINERS:
+        parser.error(f"No plan checks for the {dialect} dialect")
+
+    capture = StatementCapture(engine)
+    cases = {name: (fn, args.repeat) for name, fn in read_cases(args.rows).items()}
+    cases.update({name: (fn, 1) for name, fn in write_cases(args.seed).items()})
+
+    results = {}
+    for name, (fn, repeat) in sorted(cases.items()):
+        results[name] = run_case(engine, capture, EXPLAINERS[dialect], fn, repeat)
+    engine.dispose()
+
+    baseline_path = Path(args.baseline)
+    baselines = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+    baseline = baselines.get(dialect, {}).get("cases", {})
+    regressions = compare(results, dialect)
+
+    print(f"{'case':<34}{'ms':>10}{'baseline ms':>14}  issues", file=sys.stderr)
+    for name, result in results.items():
+        total_ms = sum(statement["median_ms"] for statement in result["statements"])
+        base_ms = sum(statement["median_ms"] for statement in baseline.get(name, {}).get("statements", []))
+        flag = "  REGRESSION" if name in regressions else ""
+        print(f"{name:<34}{total_ms:>10.2f}{base_ms:>14.2f}  {', '.join(result['issues']) or '-'}{flag}",
+              file=sys.stderr)
+
+    meta = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "dialect": dialect,
+        "rows": args.rows,
+        "seed": args.seed,
+    }
+    Path(args.output).write_text(json.dumps({"meta": meta, "cases": results, "regressions": regressions}, indent=2) + "\n")
+
+    if args.update_baseline:
+        baselines[dialect] = {"meta": meta, "cases": results}
+        baseline_path.write_text(json.dumps(baselines, indent=2) + "\n")
+        print(f"Baseline written to {baseline_path}", file=sys.stderr)
+    else:
+        for name in sorted(set(baseline) - set(results)):
+            print(f"warning: baseline case {name} was not run", file=sys.stderr)
+        for name in changed_plans(results, baseline):
+            print(f"note: {name} has a different plan than the baseline", file=sys.stderr)
+
+    if regressions:
+        for name, issues in regressions.items():
+            print(f"FAIL {name}: {', '.join(issues)} (not in ACCEPTED)", file=sys.stderr)
+        sys.exit(1)
+    print("No plan regressions", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
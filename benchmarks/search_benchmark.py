@@ -0,0 +1,76 @@
+# benchmarks/search_benchmark.py
+
+"""
+Search Benchmark: ILIKE scan vs full-text index
+###############################################
+
+Times the `search` filter of the address listing (total count + first page)
+through the original `name ILIKE '%x%' OR city ILIKE '%x%'` query and
+through AddressService, which uses the FTS5 index on SQLite.
+
+Usage:
+    python -m benchmarks.search_benchmark --rows 1000000
+    python -m benchmarks.search_benchmark --database bench.db --reuse
+"""
+
+import argparse
+import statistics
+import time
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.models.address import Address
+from app.services.address_service import AddressService, count_cache
+from benchmarks.datasets import seed_database
+
+
+TERMS = ["kolkata", "rahul", "ware", "cafe 12", "zzz"]
+
+
+def ilike_page(db, search, page_size):
+    query = db.query(Address).filter(
+        (Address.name.ilike(f"%{search}%")) |
+        (Address.city.ilike(f"%{search}%"))
+    )
+    total = query.count()
+    results = query.order_by(Address.id).limit(page_size).all()
+    return results, total
+
+
+def indexed_page(db, search, page_size):
+    count_cache.clear()
+    return AddressService.get_all(db, limit=page_size, search=search)
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        _, total = fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--database", default="bench_search.db")
+    parser.add_argument("--reuse", action="store_true", help="Skip seeding, use the existing database")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--page-size", type=int, default=10)
+    args = parser.parse_args()
+
+    url = args.database if "://" in args.database else f"sqlite:///{args.database}"
+    engine = create_engine(url) if args.reuse else seed_database(url, args.rows)
+    db = sessionmaker(bind=engine)()
+
+    print(f"{'term':<12}{'ilike ms':>12}{'hits':>10}{'indexed ms':>14}{'hits':>10}{'speedup':>10}")
+    for term in TERMS:
+        ilike_ms, ilike_total = timed(lambda: ilike_page(db, term, args.page_size), args.repeat)
+        fts_ms, fts_total = timed(lambda: indexed_page(db, term, args.page_size), args.repeat)
+        print(f"{term:<12}{ilike_ms:>12.2f}{ilike_total:>10}{fts_ms:>14.2f}{fts_total:>10}{ilike_ms / fts_ms:>9.1f}x")
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
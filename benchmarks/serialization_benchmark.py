@@ -0,0 +1,124 @@
+# benchmarks/serialization_benchmark.py
+
+"""
+Serialization Benchmark: ORM + response_model vs column tuples + orjson
+#######################################################################
+
+Per-row cost of producing the body of a `/addresses/list/` page
+(page_size=100 by default), split into fetching the rows and encoding
+the response:
+
+    orm_response_model   Address entities, AddressResponse.model_validate per row,
+                         PaginatedSuccessResponse, then what FastAPI does with
+                         a response_model (dump, validate again, dump to JSON)
+                         and JSONResponse rendering
+    tuples_json          column tuples -> dicts -> paginated_envelope,
+                         rendered by the standard json encoder
+    tuples_orjson        same, rendered by FastJSONResponse (orjson)
+
+All three produce the same bytes; the benchmark checks that first.
+
+Usage:
+    python -m benchmarks.serialization_benchmark
+    python -m benchmarks.serialization_benchmark --rows 100000 --page-size 100 --repeat 500
+"""
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+from fastapi.responses import JSONResponse
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.responses import (
+    FastJSONResponse, PaginatedMeta, PaginatedSuccessResponse, AddressResponse, paginated_envelope, orjson
+)
+from app.models.address import Address
+from app.schemas.address_schema import ADDRESS_RESPONSE_FIELDS
+from benchmarks.datasets import seed_database
+
+
+MESSAGE = "Addresses fetched successfully"
+
+
+def fetch_entities(db, skip, limit):
+    return db.query(Address).order_by(Address.id).offset(skip).limit(limit).all()
+
+
+def fetch_tuples(db, skip, limit):
+    columns = (getattr(Address, field) for field in ADDRESS_RESPONSE_FIELDS)
+    return db.query(*columns).order_by(Address.id).offset(skip).limit(limit).all()
+
+
+def encode_response_model(entities, meta):
+    response = PaginatedSuccessResponse(
+        message=MESSAGE,
+        meta=PaginatedMeta(**meta),
+        data=[AddressResponse.model_validate(a) for a in entities]
+    )
+    # FastAPI with response_model: dump the returned model, validate the
+    # result against the response model, serialize it, render JSON
+    content = PaginatedSuccessResponse.model_validate(response.model_dump())
+    return JSONResponse(content.model_dump(mode="json")).body
+
+
+def encode_tuples(rows, meta, response_class):
+    data = [dict(zip(ADDRESS_RESPONSE_FIELDS, row)) for row in rows]
+    return response_class(paginated_envelope(MESSAGE, meta, data)).body
+
+
+def measure(fetch, encode, db, args):
+    fetch_times, encode_times = [], []
+    body = None
+    for i in range(args.repeat):
+        skip = (i * args.page_size) % max(args.rows - args.page_size, 1)
+        started = time.perf_counter()
+        rows = fetch(db, skip, args.page_size)
+        fetched = time.perf_counter()
+        body = encode(rows)
+        encode_times.append(time.perf_counter() - fetched)
+        fetch_times.append(fetched - started)
+        db.expunge_all()
+    return statistics.median(fetch_times), statistics.median(encode_times), body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--database", default="bench_serialize.db")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=300)
+    args = parser.parse_args()
+
+    url = f"sqlite:///{args.database}"
+    engine = create_engine(url) if Path(args.database).exists() else seed_database(url, args.rows)
+    db = sessionmaker(bind=engine)()
+
+    meta = {"page": 1, "page_size": args.page_size, "total": args.rows, "total_pages": args.rows // args.page_size}
+    variants = {
+        "orm_response_model": (fetch_entities, lambda rows: encode_response_model(rows, meta)),
+        "tuples_json": (fetch_tuples, lambda rows: encode_tuples(rows, meta, JSONResponse)),
+        "tuples_orjson": (fetch_tuples, lambda rows: encode_tuples(rows, meta, FastJSONResponse)),
+    }
+
+    # same page, same bytes
+    bodies = {name: encode(fetch(db, 0, args.page_size)) for name, (fetch, encode) in variants.items()}
+    if len(set(bodies.values())) != 1:
+        raise SystemExit("Serialized bodies differ: " + ", ".join(bodies))
+    if orjson is None:
+        print("orjson is not installed: tuples_orjson falls back to the standard encoder")
+
+    print(f"page_size={args.page_size}, median over {args.repeat} pages, microseconds per row")
+    print(f"{'variant':<22}{'fetch':>10}{'encode':>10}{'total':>10}{'speedup':>10}")
+    reference = None
+    for name, (fetch, encode) in variants.items():
+        fetch_s, encode_s, _ = measure(fetch, encode, db, args)
+        per_row = [seconds / args.page_size * 1e6 for seconds in (fetch_s, encode_s, fetch_s + encode_s)]
+        reference = reference or per_row[2]
+        print(f"{name:<22}{per_row[0]:>10.2f}{per_row[1]:>10.2f}{per_row[2]:>10.2f}{reference / per_row[2]:>9.1f}x")
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
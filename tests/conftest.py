@@ -0,0 +1,80 @@
+# tests/conftest.py
+
+"""
+Shared Test Fixtures
+####################
+
+The application binds DATABASE_URL when it is imported, so the test
+database is chosen here, before any app module is loaded.
+
+Fixtures:
+    client          TestClient running the app lifespan (snapshot load)
+    other_worker    Writes to the shared database like another uvicorn
+                    worker: own engine, no address_events in this process
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+DATABASE_PATH = Path(tempfile.mkdtemp(prefix="address-api-tests-")) / "test.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{DATABASE_PATH}"
+os.environ["DATABASE_MODE"] = "sync"
+os.environ.setdefault("REQUEST_LOG_SAMPLE_RATE", "0")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, delete, insert, update
+from app.main import app
+from app.models.address import Address
+from app.repo.dataset_version import bump_addresses_version
+from app.utils.geo_grid import grid_cell
+
+
+class OtherWorker:
+    """
+    A second process sharing the database: every write commits together
+    with the dataset version bump (and row count), as AddressRepository does.
+    """
+
+    def __init__(self, url: str):
+        self.engine = create_engine(url)
+
+    def _write(self, statement, sign: int = 0):
+        with self.engine.begin() as conn:
+            result = conn.execute(statement)
+            conn.execute(bump_addresses_version(sign * result.rowcount))
+        return result
+
+    def create(self, name: str, city: str, latitude: float, longitude: float) -> int:
+        statement = insert(Address.__table__).values(
+            name=name, street="1 Test Street", city=city, latitude=latitude, longitude=longitude,
+            grid_cell=grid_cell(latitude, longitude)
+        )
+        return self._write(statement, 1).inserted_primary_key[0]
+
+    def update(self, address_id: int, **values):
+        if "latitude" in values:
+            values["grid_cell"] = grid_cell(values["latitude"], values["longitude"])
+        self._write(update(Address.__table__).where(Address.__table__.c.id == address_id).values(**values))
+
+    def delete(self, address_id: int = None):
+        statement = delete(Address.__table__)
+        if address_id is not None:
+            statement = statement.where(Address.__table__.c.id == address_id)
+        self._write(statement, -1)
+
+
+@pytest.fixture
+def other_worker():
+    worker = OtherWorker(os.environ["DATABASE_URL"])
+    yield worker
+    worker.engine.dispose()
+
+
+@pytest.fixture
+def client(other_worker):
+    # every test starts from an empty table
+    other_worker.delete()
+    with TestClient(app) as client:
+        yield client
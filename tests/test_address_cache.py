@@ -0,0 +1,19 @@
+# tests/test_address_cache.py
+
+"""
+GET /addresses/{id} never serves a record another worker changed.
+"""
+
+
+def test_cached_item_follows_other_worker(client, other_worker):
+    address_id = client.post("/addresses/", json={
+        "name": "Home", "street": "1 Park Street", "city": "Kolkata", "latitude": 22.5, "longitude": 88.3
+    }).json()["data"]["id"]
+    assert client.get(f"/addresses/{address_id}").json()["data"]["name"] == "Home"
+    assert client.get(f"/addresses/{address_id}").json()["data"]["name"] == "Home"
+
+    other_worker.update(address_id, name="Office")
+    assert client.get(f"/addresses/{address_id}").json()["data"]["name"] == "Office"
+
+    other_worker.delete(address_id)
+    assert client.get(f"/addresses/{address_id}").status_code == 404
@@ -0,0 +1,78 @@
+# tests/test_async_app.py
+
+"""
+Smoke test of the app in DATABASE_MODE=async (AsyncSession routes).
+
+The mode is fixed when the app is imported, so it runs in its own process
+on its own database.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCRIPT = """
+import json
+from fastapi.testclient import TestClient
+from app.main import app
+from app.database.session import async_engine
+
+assert async_engine is not None and async_engine.dialect.driver == "aiosqlite"
+
+home = {"name": "Home", "street": "1 Park Street", "city": "Kolkata", "latitude": 22.5726, "longitude": 88.3639}
+office = {"name": "Office", "street": "2 Lake Road", "city": "Delhi", "latitude": 28.6139, "longitude": 77.209}
+results = {}
+
+with TestClient(app) as client:
+    created = client.post("/addresses/", json=home)
+    address_id = created.json()["data"]["id"]
+    results["create"] = created.status_code
+    results["bulk"] = client.post("/addresses/bulk", json=[office, {**office, "latitude": 99}]).json()["data"]["created"]
+    results["get"] = client.get(f"/addresses/{address_id}").json()["data"]["name"]
+    results["list"] = [row["name"] for row in client.get("/addresses/list/?sort_by=name").json()["data"]]
+    results["search"] = [row["name"] for row in client.get("/addresses/list/?search=kol").json()["data"]]
+    results["nearby"] = [row["name"] for row in client.get(
+        "/addresses/nearby/?lat=22.57&lon=88.36&distance=5").json()["data"]]
+    results["nearest"] = [row["name"] for row in client.get(
+        "/addresses/nearest/?lat=28.6&lon=77.2&k=1").json()["data"]]
+    results["update"] = client.put(f"/addresses/{address_id}", json={**home, "name": "Home 2"}).status_code
+    results["export"] = len(client.get("/addresses/export?format=ndjson").text.splitlines())
+    results["delete"] = client.delete(f"/addresses/{address_id}").status_code
+    results["missing"] = client.get(f"/addresses/{address_id}").status_code
+
+print(json.dumps(results))
+"""
+
+
+def test_async_mode_serves_the_api(tmp_path):
+    env = {
+        **os.environ,
+        "DATABASE_MODE": "async",
+        "DATABASE_URL": f"sqlite:///{tmp_path / 'async.db'}",
+        "REQUEST_LOG_SAMPLE_RATE": "0",
+    }
+    env.pop("ASYNC_DATABASE_URL", None)
+
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", SCRIPT],
+        cwd=ROOT, env=env, capture_output=True, text=True, timeout=120,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout.splitlines()[-1]) == {
+        "create": 200,
+        "bulk": 1,
+        "get": "Home",
+        "list": ["Home", "Office"],
+        "search": ["Home"],
+        "nearby": ["Home"],
+        "nearest": ["Office"],
+        "update": 200,
+        "export": 2,
+        "delete": 200,
+        "missing": 404,
+    }
@@ -0,0 +1,85 @@
+# tests/test_bulk.py
+
+"""
+POST /addresses/bulk, PATCH /addresses/bulk and DELETE /addresses/bulk:
+response bodies and what ends up in the table.
+"""
+
+from sqlalchemy import select
+from app.models.address import Address
+from app.utils.geo_grid import grid_cell
+
+
+def address(name, city="Kolkata", latitude=22.5, longitude=88.3):
+    return {"name": name, "street": "1 Park Street", "city": city, "latitude": latitude, "longitude": longitude}
+
+
+def stored(other_worker):
+    with other_worker.engine.connect() as conn:
+        rows = conn.execute(select(Address.__table__).order_by(Address.id)).mappings().all()
+    return {row["id"]: dict(row) for row in rows}
+
+
+def test_bulk_create_reports_invalid_items(client, other_worker):
+    response = client.post("/addresses/bulk", json=[
+        address("Home"),
+        {**address("Broken"), "latitude": 91},
+        {"name": "No street", "city": "Delhi", "latitude": 28.6, "longitude": 77.2},
+        address("Office", "Delhi", 28.6, 77.2),
+    ])
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["created"] == 2 and data["failed"] == 2
+    assert [error["index"] for error in data["errors"]] == [1, 2]
+    assert [field["name"] for field in data["errors"][0]["fields"]] == ["latitude"]
+    assert [field["name"] for field in data["errors"][1]["fields"]] == ["street"]
+
+    rows = stored(other_worker)
+    assert list(rows) == data["ids"]
+    assert [row["name"] for row in rows.values()] == ["Home", "Office"]
+    assert rows[data["ids"][1]]["grid_cell"] == grid_cell(28.6, 77.2)
+
+
+def test_bulk_update_by_ids_and_city(client, other_worker):
+    ids = client.post("/addresses/bulk", json=[
+        address("A"), address("B"), address("C", "Delhi", 28.6, 77.2),
+    ]).json()["data"]["ids"]
+
+    response = client.patch("/addresses/bulk", json={"ids": ids[:1], "values": {"latitude": 22.6, "longitude": 88.4}})
+    assert response.json()["data"] == {"updated": 1}
+    response = client.patch("/addresses/bulk", json={"city": "Kolkata", "values": {"street": "2 Lake Road"}})
+    assert response.json()["data"] == {"updated": 2}
+
+    rows = stored(other_worker)
+    assert (rows[ids[0]]["latitude"], rows[ids[0]]["longitude"]) == (22.6, 88.4)
+    assert rows[ids[0]]["grid_cell"] == grid_cell(22.6, 88.4)
+    assert [rows[i]["street"] for i in ids] == ["2 Lake Road", "2 Lake Road", "1 Park Street"]
+
+
+def test_bulk_update_rejects_latitude_without_longitude(client, other_worker):
+    [address_id] = client.post("/addresses/bulk", json=[address("A")]).json()["data"]["ids"]
+
+    response = client.patch("/addresses/bulk", json={"ids": [address_id], "values": {"latitude": 10}})
+
+    assert response.status_code == 422
+    assert response.json()["error"]["code"] == "VALIDATION_ERROR"
+    assert stored(other_worker)[address_id]["latitude"] == 22.5
+
+
+def test_bulk_update_needs_one_selector(client):
+    response = client.patch("/addresses/bulk", json={"ids": [1], "city": "Kolkata", "values": {"name": "X"}})
+    assert response.status_code == 422
+
+
+def test_bulk_delete_by_ids_and_city(client, other_worker):
+    ids = client.post("/addresses/bulk", json=[
+        address("A"), address("B", "Delhi"), address("C", "Delhi"), address("D"),
+    ]).json()["data"]["ids"]
+
+    response = client.request("DELETE", "/addresses/bulk", json={"ids": [ids[0], 10_000]})
+    assert response.json()["data"] == {"deleted": 1}
+    response = client.request("DELETE", "/addresses/bulk", json={"city": "Delhi"})
+    assert response.json()["data"] == {"deleted": 2}
+
+    assert list(stored(other_worker)) == [ids[3]]
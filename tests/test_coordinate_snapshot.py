@@ -0,0 +1,74 @@
+# tests/test_coordinate_snapshot.py
+
+"""
+Coordinate snapshot reloads and writes notified during a load.
+"""
+
+import pytest
+from app.database.session import SessionLocal
+from app.repo.address_events import AddressChange
+from app.repo.coordinate_snapshot import CoordinateSnapshot, coordinate_snapshot
+
+pytestmark = pytest.mark.skipif(coordinate_snapshot is None, reason="numpy is not installed")
+
+
+NEARBY = "/addresses/nearby/?lat=22.5726&lon=88.3639&distance=5"
+
+
+def test_reloaded_after_other_worker_write(client, other_worker):
+    client.post("/addresses/", json={
+        "name": "Home", "street": "1 Park Street", "city": "Kolkata", "latitude": 22.5726, "longitude": 88.3639
+    })
+    assert client.get(NEARBY).json()["meta"]["total"] == 1
+    assert coordinate_snapshot.loaded
+
+    office = other_worker.create("Office", "Kolkata", 22.5730, 88.3640)
+    assert client.get(NEARBY).json()["meta"]["total"] == 2
+    assert coordinate_snapshot.loaded
+    assert office in coordinate_snapshot.within(22.5726, 88.3639, 5)
+
+
+class NotifyingSession:
+    """
+    Session that delivers a write notification while the snapshot reads
+    the table, as a concurrent request of this process would.
+    """
+
+    def __init__(self, db, snapshot, change):
+        self.db, self.snapshot, self.change = db, snapshot, change
+
+    def query(self, *columns):
+        self.snapshot.apply(self.change)
+        return self.db.query(*columns)
+
+
+def test_load_replays_concurrent_writes(client, other_worker):
+    other_worker.create("Home", "Kolkata", 22.5726, 88.3639)
+    snapshot = CoordinateSnapshot()
+
+    db = SessionLocal()
+    try:
+        snapshot.load(NotifyingSession(db, snapshot, AddressChange("create", after=[(999, 22.5731, 88.3641)])))
+    finally:
+        db.close()
+
+    assert snapshot.loaded
+    assert 999 in snapshot.within(22.5726, 88.3639, 5)
+
+
+def test_invalidated_during_load_stays_stale(client):
+    snapshot = CoordinateSnapshot()
+
+    class InvalidatingSession(NotifyingSession):
+        def query(self, *columns):
+            self.snapshot.invalidate()
+            return self.db.query(*columns)
+
+    db = SessionLocal()
+    try:
+        snapshot.load(db)
+        snapshot.load(InvalidatingSession(db, snapshot, None))
+    finally:
+        db.close()
+
+    assert snapshot.stale and not snapshot.loaded
@@ -0,0 +1,67 @@
+# tests/test_counts.py
+
+"""
+include_total=approx served from the row count kept with the dataset version.
+"""
+
+from sqlalchemy import event, update
+from app.database.schema import sync_schema
+from app.database.session import SessionLocal, engine
+from app.models.dataset_version import DatasetVersion
+from app.repo.address_repo import AddressRepository
+from app.services.address_service import count_cache
+
+
+def address(i):
+    return {"name": f"Home {i}", "street": "1 Park Street", "city": "Kolkata", "latitude": 22.5, "longitude": 88.3}
+
+
+def row_count():
+    db = SessionLocal()
+    try:
+        return AddressRepository.estimate_count(db)
+    finally:
+        db.close()
+
+
+def test_row_count_follows_writes(client, other_worker):
+    ids = [client.post("/addresses/", json=address(i)).json()["data"]["id"] for i in range(3)]
+    client.post("/addresses/bulk", json=[address(i) for i in range(5)])
+    client.delete(f"/addresses/{ids[0]}")
+    client.request("DELETE", "/addresses/bulk", json={"ids": ids[1:]})
+    other_worker.create("Office", "Kolkata", 22.5, 88.3)
+    assert row_count() == 6
+
+
+def test_approx_total_skips_count(client):
+    client.post("/addresses/bulk", json=[address(i) for i in range(4)])
+    count_cache.clear()
+
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        response = client.get("/addresses/list/?include_total=approx")
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert response.json()["meta"]["total"] == 4
+    assert not [statement for statement in statements if "count(" in statement.lower()]
+
+
+def test_existing_table_is_counted_once(client, other_worker):
+    client.post("/addresses/bulk", json=[address(i) for i in range(3)])
+    with other_worker.engine.begin() as conn:
+        conn.execute(update(DatasetVersion.__table__).values(row_count=None))
+    assert row_count() is None
+
+    sync_schema(engine)
+    assert row_count() == 3
+
+
+def test_approx_total_with_search_is_exact(client):
+    client.post("/addresses/bulk", json=[address(i) for i in range(4)] + [{**address(9), "name": "Depot", "city": "Delhi"}])
+    count_cache.clear()
+
+    response = client.get("/addresses/list/?include_total=approx&search=delhi")
+    assert response.json()["meta"]["total"] == 1
@@ -0,0 +1,56 @@
+# tests/test_dataset_version.py
+
+"""
+ETags and process-local caches against writes made by another worker.
+"""
+
+
+NEARBY = "/addresses/nearby/?lat=22.5726&lon=88.3639&distance=5"
+
+
+def address(name="Home", city="Kolkata", latitude=22.5726, longitude=88.3639):
+    return {"name": name, "street": "1 Park Street", "city": city, "latitude": latitude, "longitude": longitude}
+
+
+def test_not_modified_until_a_write(client):
+    client.post("/addresses/", json=address())
+    response = client.get("/addresses/list/")
+    etag = response.headers["etag"]
+
+    cached = client.get("/addresses/list/", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+    client.post("/addresses/", json=address("Office"))
+    fresh = client.get("/addresses/list/", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] != etag
+
+
+def test_list_sees_other_worker_writes(client, other_worker):
+    client.post("/addresses/", json=address())
+    before = client.get("/addresses/list/")
+    assert before.json()["meta"]["total"] == 1
+
+    other_worker.create("Office", "Kolkata", 22.5730, 88.3640)
+
+    after = client.get("/addresses/list/", headers={"If-None-Match": before.headers["etag"]})
+    assert after.status_code == 200
+    assert after.headers["etag"] != before.headers["etag"]
+    assert after.json()["meta"]["total"] == 2
+
+
+def test_nearby_sees_other_worker_writes(client, other_worker):
+    client.post("/addresses/", json=address())
+    before = client.get(NEARBY)
+    assert before.json()["meta"]["total"] == 1
+
+    office = other_worker.create("Office", "Kolkata", 22.5730, 88.3640)
+
+    after = client.get(NEARBY)
+    assert after.headers["etag"] != before.headers["etag"]
+    assert after.json()["meta"]["total"] == 2
+    assert office in [row["id"] for row in after.json()["data"]]
+
+    other_worker.delete(office)
+    assert client.get(NEARBY).json()["meta"]["total"] == 1
@@ -0,0 +1,62 @@
+# tests/test_distance.py
+
+"""
+The vectorized haversine_batch / within_radius against the scalar haversine.
+"""
+
+import math
+import random
+
+import pytest
+from app.utils.distance import EARTH_RADIUS_KM, CoordinateBatch, haversine, haversine_batch, within_radius
+
+
+def random_batch(count=5000, seed=3):
+    rng = random.Random(seed)
+    latitudes = [rng.uniform(-90, 90) for _ in range(count)]
+    longitudes = [rng.uniform(-180, 180) for _ in range(count)]
+    return latitudes, longitudes
+
+
+@pytest.mark.parametrize("lat, lon", [(22.57, 88.36), (0.0, 179.9), (-89.5, -45.0), (51.5, -0.1)])
+def test_batch_matches_scalar(lat, lon):
+    latitudes, longitudes = random_batch()
+    batch = CoordinateBatch(latitudes, longitudes)
+
+    distances = list(haversine_batch(lat, lon, batch))
+
+    expected = [haversine(lat, lon, lat2, lon2) for lat2, lon2 in zip(latitudes, longitudes)]
+    assert distances == pytest.approx(expected, abs=1e-6)
+
+
+def test_known_distances():
+    batch = CoordinateBatch([22.5726, 0.0, 0.0, -90.0], [88.3639, -179.9, 180.0, 10.0])
+    distances = haversine_batch(22.5726, 88.3639, batch)
+
+    assert distances[0] == 0.0
+    assert haversine_batch(0.0, 179.9, batch)[1] == pytest.approx(2 * math.pi * EARTH_RADIUS_KM * 0.2 / 360)
+    # antipodal and pole-to-pole points do not turn into NaN
+    assert haversine_batch(0.0, 0.0, batch)[2] == pytest.approx(math.pi * EARTH_RADIUS_KM)
+    assert haversine_batch(90.0, 0.0, batch)[3] == pytest.approx(math.pi * EARTH_RADIUS_KM)
+
+
+@pytest.mark.parametrize("radius_km", [0.0, 1.0, 500.0, 5000.0, 15000.0])
+def test_within_radius_matches_distances(radius_km):
+    latitudes, longitudes = random_batch()
+    batch = CoordinateBatch(latitudes, longitudes)
+
+    mask = list(within_radius(10.0, 170.0, batch, radius_km))
+
+    distances = haversine_batch(10.0, 170.0, batch)
+    # ignore points within rounding of the boundary
+    for inside, distance in zip(mask, distances):
+        if abs(distance - radius_km) > 1e-6:
+            assert bool(inside) == (distance <= radius_km)
+
+
+def test_within_radius_edge_radii():
+    batch = CoordinateBatch(*random_batch(100))
+
+    assert all(within_radius(0.0, 0.0, batch, math.pi * EARTH_RADIUS_KM))
+    assert not any(within_radius(0.0, 0.0, batch, -1.0))
+    assert len(within_radius(0.0, 0.0, CoordinateBatch([], []), 10.0)) == 0
@@ -0,0 +1,54 @@
+# tests/test_export.py
+
+"""
+GET /addresses/export streams the filtered, sorted table as NDJSON or CSV.
+"""
+
+import csv
+import io
+import json
+
+from app.utils.export import EXPORT_COLUMNS
+
+
+def address(name, city="Kolkata"):
+    return {"name": name, "street": "1 Park Street", "city": city, "latitude": 22.5, "longitude": 88.3}
+
+
+def test_export_ndjson_sorted_and_filtered(client):
+    ids = client.post("/addresses/bulk", json=[
+        address("Charlie"), address("Alpha"), address("Bravo", "Delhi"),
+    ]).json()["data"]["ids"]
+
+    response = client.get("/addresses/export?format=ndjson&sort_by=name")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["name"] for row in rows] == ["Alpha", "Bravo", "Charlie"]
+    assert rows[0] == {"id": ids[1], **address("Alpha")}
+
+    response = client.get("/addresses/export?format=ndjson&search=kolkata&sort_order=desc")
+    assert [json.loads(line)["id"] for line in response.text.splitlines()] == [ids[1], ids[0]]
+
+
+def test_export_csv_quotes_fields(client):
+    client.post("/addresses/bulk", json=[address('Flat 2, "Rose" Villa'), address("Line\nbreak")])
+
+    response = client.get("/addresses/export?format=csv")
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == "attachment; filename=addresses.csv"
+
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == list(EXPORT_COLUMNS)
+    assert [row[1] for row in rows[1:]] == ['Flat 2, "Rose" Villa', "Line\nbreak"]
+
+
+def test_export_empty_table(client):
+    assert client.get("/addresses/export?format=ndjson").text == ""
+    assert client.get("/addresses/export?format=csv").text == ",".join(EXPORT_COLUMNS) + "\n"
+
+
+def test_export_rejects_unknown_sort_before_streaming(client):
+    response = client.get("/addresses/export?sort_by=grid_cell")
+    assert response.status_code == 400
+    assert "INVALID_SORT" in response.text
@@ -0,0 +1,98 @@
+# tests/test_geo_grid.py
+
+"""
+bounding_box / row_spans / cell_ranges around the antimeridian and the poles.
+"""
+
+import math
+import random
+
+import pytest
+from app.utils.distance import haversine
+from app.utils.geo_grid import GRID_COLS, GRID_ROWS, bounding_box, cell_ranges, grid_cell, row_spans
+
+
+def in_boxes(boxes, lat, lon):
+    return any(min_lat <= lat <= max_lat and min_lon <= lon <= max_lon for min_lat, max_lat, min_lon, max_lon in boxes)
+
+
+def in_spans(spans, lat, lon):
+    row, col = divmod(grid_cell(lat, lon), GRID_COLS)
+    return any(r == row and first <= col <= last for r, first, last in spans)
+
+
+def points_within(lat, lon, radius_km, count=2000, seed=7):
+    """
+    Random points inside a circle: walk a random bearing and distance.
+    """
+    rng = random.Random(seed)
+    lat1, lon1 = math.radians(lat), math.radians(lon)
+    for _ in range(count):
+        angular = rng.uniform(0, radius_km) / 6371
+        bearing = rng.uniform(0, 2 * math.pi)
+        lat2 = math.asin(math.sin(lat1) * math.cos(angular) + math.cos(lat1) * math.sin(angular) * math.cos(bearing))
+        lon2 = lon1 + math.atan2(
+            math.sin(bearing) * math.sin(angular) * math.cos(lat1),
+            math.cos(angular) - math.sin(lat1) * math.sin(lat2),
+        )
+        yield math.degrees(lat2), (math.degrees(lon2) + 540) % 360 - 180
+
+
+def test_box_crossing_antimeridian_is_split():
+    boxes = bounding_box(10.0, 179.8, 100)
+
+    assert len(boxes) == 2
+    (_, _, east_min, east_max), (_, _, west_min, west_max) = boxes
+    assert east_max == 180.0 and 178.5 < east_min < 179.8
+    assert west_min == -180.0 and -180.0 < west_max < -179.0
+
+    # a point just across the antimeridian
+    assert haversine(10.0, 179.8, 10.0, -179.9) < 100
+    assert in_boxes(boxes, 10.0, -179.9)
+    assert not in_boxes(boxes, 10.0, 0.0)
+
+
+@pytest.mark.parametrize("lat, lon, radius_km", [
+    (10.0, 179.8, 100),      # crosses +180
+    (-35.0, -179.95, 250),   # crosses -180
+    (89.7, 12.0, 50),        # reaches the north pole
+    (-89.9, -70.0, 30),      # reaches the south pole
+    (64.0, 178.0, 400),
+])
+def test_boxes_and_spans_cover_the_circle(lat, lon, radius_km):
+    boxes = bounding_box(lat, lon, radius_km)
+    spans = row_spans(boxes, max_rows=10_000)
+
+    for point_lat, point_lon in points_within(lat, lon, radius_km):
+        assert in_boxes(boxes, point_lat, point_lon), (point_lat, point_lon)
+        assert in_spans(spans, point_lat, point_lon), (point_lat, point_lon)
+
+
+def test_box_reaching_a_pole_spans_every_longitude():
+    [(min_lat, max_lat, min_lon, max_lon)] = bounding_box(89.9, 45.0, 50)
+
+    assert max_lat == 90.0 and min_lat < 89.9
+    assert (min_lon, max_lon) == (-180.0, 180.0)
+    # the opposite side of the pole is within the radius
+    assert haversine(89.9, 45.0, 89.9, -135.0) < 50
+
+    spans = row_spans(bounding_box(89.9, 45.0, 50), max_rows=10_000)
+    assert {row for row, _, _ in spans} >= {GRID_ROWS - 1}
+    assert all((first, last) == (0, GRID_COLS - 1) for _, first, last in spans)
+
+
+def test_circle_larger_than_the_earth_covers_everything():
+    assert bounding_box(0.0, 0.0, math.pi * 6371) == [(-90.0, 90.0, -180.0, 180.0)]
+
+
+def test_grid_cell_clamps_at_the_edges():
+    assert grid_cell(90.0, 180.0) == GRID_ROWS * GRID_COLS - 1
+    assert grid_cell(-90.0, -180.0) == 0
+
+
+def test_cell_ranges_give_up_past_the_row_limit():
+    boxes = bounding_box(0.0, 0.0, 5000)
+    assert row_spans(boxes, max_rows=3) is None
+    ranges = cell_ranges(bounding_box(10.0, 179.8, 100))
+    assert ranges is not None
+    assert all(first <= last for first, last in ranges)
@@ -0,0 +1,76 @@
+# tests/test_import.py
+
+"""
+POST /addresses/import: chunked NDJSON/CSV uploads with per-line errors.
+"""
+
+import json
+
+from sqlalchemy import select
+from app.models.address import Address
+
+
+def stored(other_worker):
+    with other_worker.engine.connect() as conn:
+        return conn.execute(
+            select(Address.name, Address.street, Address.city).order_by(Address.id)
+        ).all()
+
+
+def row(name, city="Kolkata", latitude=22.5):
+    return {"name": name, "street": "1 Park Street", "city": city, "latitude": latitude, "longitude": 88.3}
+
+
+def test_import_ndjson_reports_bad_lines(client, other_worker):
+    body = "\n".join([
+        json.dumps(row("A")),
+        "{not json",
+        "",
+        json.dumps(row("B", latitude=95)),
+        json.dumps(row("C")),
+        json.dumps(row("D")),
+    ])
+
+    response = client.post("/addresses/import?format=ndjson&chunk_size=2", content=body.encode())
+
+    assert response.status_code == 200
+    report = response.json()["data"]
+    assert {key: report[key] for key in ("processed", "inserted", "failed", "chunks")} == {
+        "processed": 5, "inserted": 3, "failed": 2, "chunks": 2,
+    }
+    assert [error["line"] for error in report["errors"]] == [2, 4]
+    assert report["errors"][0]["fields"][0]["error_type"] == "json_invalid"
+    assert report["errors"][1]["fields"][0]["name"] == "latitude"
+    assert report["errors_truncated"] is False
+    assert [name for name, _, _ in stored(other_worker)] == ["A", "C", "D"]
+
+
+def test_import_csv_with_multiline_quoted_field(client, other_worker):
+    body = (
+        "name,street,city,latitude,longitude\r\n"
+        '"Flat 2, ""Rose"" Villa","12 Park Street\nSecond floor",Kolkata,22.5,88.3\r\n'
+        "Too,few,columns\r\n"
+        "Office,1 Main Road,Delhi,28.6,77.2\r\n"
+    )
+
+    response = client.post("/addresses/import?format=csv", content=body.encode("utf-8-sig"))
+
+    report = response.json()["data"]
+    assert (report["processed"], report["inserted"], report["failed"]) == (3, 2, 1)
+    # the quoted record spans lines 2-3, so the short row is line 4
+    assert report["errors"][0]["line"] == 4
+    assert report["errors"][0]["fields"][0]["error_type"] == "csv_columns"
+    assert stored(other_worker) == [
+        ('Flat 2, "Rose" Villa', "12 Park Street\nSecond floor", "Kolkata"),
+        ("Office", "1 Main Road", "Delhi"),
+    ]
+
+
+def test_import_csv_unterminated_quote(client, other_worker):
+    body = 'name,street,city,latitude,longitude\nHome,"1 Park Street,Kolkata,22.5,88.3\n'
+
+    report = client.post("/addresses/import?format=csv", content=body.encode()).json()["data"]
+
+    assert report["inserted"] == 0
+    assert report["errors"][0]["fields"][0]["error_type"] == "csv_invalid"
+    assert stored(other_worker) == []
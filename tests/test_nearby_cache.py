@@ -0,0 +1,81 @@
+# tests/test_nearby_cache.py
+
+"""
+NearbyCache: quantized keys and cell-based invalidation on writes.
+"""
+
+from app.core.cache import NearbyCache
+from app.repo.address_events import AddressChange
+from app.utils.distance import haversine
+
+KOLKATA = (22.5726, 88.3639)
+DELHI = (28.6139, 77.2090)
+
+
+def cached(cache, lat, lon, radius_km):
+    key, center_lat, center_lon, radius = NearbyCache.quantize(lat, lon, radius_km)
+    cache.set(key, ([1, 2], None), center_lat, center_lon, radius, cache.generation)
+    return key
+
+
+def test_quantize_covers_the_query():
+    key, center_lat, center_lon, radius = NearbyCache.quantize(*KOLKATA, 2)
+
+    assert NearbyCache.quantize(KOLKATA[0] + 0.001, KOLKATA[1] - 0.001, 2.2)[0] == key
+    # every point within the query radius is within the candidate radius
+    assert radius >= 2 + haversine(center_lat, center_lon, *KOLKATA)
+    assert NearbyCache.quantize(*KOLKATA, 0) is None
+
+
+def test_write_in_a_covered_cell_evicts():
+    cache = NearbyCache()
+    key = cached(cache, *KOLKATA, 2)
+
+    cache.apply(AddressChange("create", after=[(10, KOLKATA[0] + 0.005, KOLKATA[1])]))
+
+    assert cache.get(key) is None
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_write_elsewhere_keeps_the_entry():
+    cache = NearbyCache()
+    key = cached(cache, *KOLKATA, 2)
+
+    cache.apply(AddressChange("create", after=[(10, *DELHI)]))
+    # same row of grid cells, far outside the area
+    cache.apply(AddressChange("create", after=[(11, KOLKATA[0], KOLKATA[1] + 5)]))
+
+    assert cache.get(key) == ([1, 2], None)
+    assert cache.stats()["invalidations"] == 0
+
+
+def test_update_moving_out_of_the_area_evicts():
+    cache = NearbyCache()
+    kolkata = cached(cache, *KOLKATA, 2)
+    delhi = cached(cache, *DELHI, 2)
+
+    cache.apply(AddressChange("update", before=[(10, *KOLKATA)], after=[(10, 19.07, 72.87)]))
+
+    assert cache.get(kolkata) is None
+    assert cache.get(delhi) is not None
+
+
+def test_wide_entries_are_evicted_by_any_write():
+    cache = NearbyCache()
+    key = cached(cache, *KOLKATA, 3000)
+
+    cache.apply(AddressChange("delete", before=[(10, -33.86, 151.2)]))
+
+    assert cache.get(key) is None
+
+
+def test_set_after_a_write_is_ignored():
+    cache = NearbyCache()
+    key, center_lat, center_lon, radius = NearbyCache.quantize(*KOLKATA, 2)
+    generation = cache.generation
+
+    # candidates read before a write committed may miss it
+    cache.apply(AddressChange("create", after=[(10, *DELHI)]))
+    cache.set(key, ([1], None), center_lat, center_lon, radius, generation)
+
+    assert cache.get(key) is None
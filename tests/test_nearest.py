@@ -0,0 +1,52 @@
+# tests/test_nearest.py
+
+"""
+k-nearest search: snapshot and expanding-ring paths agree with brute force.
+"""
+
+import random
+import pytest
+from app.database.session import SessionLocal
+from app.services.address_service import AddressService
+from app.utils.distance import haversine
+
+
+CENTER = (22.5726, 88.3639)
+
+
+@pytest.fixture
+def points(client):
+    rng = random.Random(7)
+    created = []
+    for i in range(60):
+        # a dense cluster plus a few far away, beyond the first rings
+        spread = 0.05 if i < 50 else 5.0
+        lat, lon = CENTER[0] + rng.uniform(-spread, spread), CENTER[1] + rng.uniform(-spread, spread)
+        response = client.post("/addresses/", json={
+            "name": f"Point {i}", "street": "1 Test Street", "city": "Kolkata", "latitude": lat, "longitude": lon
+        })
+        created.append((response.json()["data"]["id"], lat, lon))
+    return created
+
+
+def expected(points, k):
+    ranked = sorted((haversine(*CENTER, lat, lon), address_id) for address_id, lat, lon in points)
+    return [address_id for _, address_id in ranked[:k]]
+
+
+@pytest.mark.parametrize("k", [1, 10, 55, 100])
+def test_nearest_endpoint(client, points, k):
+    response = client.get(f"/addresses/nearest/?lat={CENTER[0]}&lon={CENTER[1]}&k={k}")
+    data = response.json()["data"]
+    assert [row["id"] for row in data] == expected(points, k)
+    assert [row["distance_km"] for row in data] == sorted(row["distance_km"] for row in data)
+
+
+@pytest.mark.parametrize("k", [1, 10, 55, 100])
+def test_rings_match_brute_force(client, points, k):
+    db = SessionLocal()
+    try:
+        ranked = AddressService._nearest_in_rings(db, *CENTER, k)
+    finally:
+        db.close()
+    assert [address_id for address_id, _ in ranked] == expected(points, k)
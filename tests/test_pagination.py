@@ -0,0 +1,56 @@
+# tests/test_pagination.py
+
+"""
+Following meta.next_cursor walks the same rows as offset pages.
+"""
+
+import pytest
+
+
+CITIES = ["Kolkata", "Delhi", "Mumbai"]
+
+
+@pytest.fixture
+def addresses(client):
+    client.post("/addresses/bulk", json=[
+        {"name": f"Home {i % 7}", "street": "1 Park Street", "city": CITIES[i % 3], "latitude": 22.5, "longitude": 88.3}
+        for i in range(23)
+    ])
+
+
+def follow(client, query):
+    rows, cursor, pages = [], None, 0
+    while True:
+        url = f"/addresses/list/?page_size=5&{query}" + (f"&cursor={cursor}" if cursor else "")
+        response = client.get(url)
+        assert response.status_code == 200, response.json()
+        rows.extend(row["id"] for row in response.json()["data"])
+        cursor = response.json()["meta"]["next_cursor"]
+        pages += 1
+        if cursor is None:
+            return rows, pages
+
+
+@pytest.mark.parametrize("query", ["sort_by=id", "sort_by=name&sort_order=desc", "sort_by=city&search=kolkata"])
+def test_cursor_walks_every_row(client, addresses, query):
+    rows, pages = follow(client, query)
+    expected = client.get(f"/addresses/list/?page_size=100&{query}").json()["data"]
+    assert rows == [row["id"] for row in expected]
+    assert pages == -(-len(expected) // 5)
+
+
+def test_relevance_has_no_cursor(client, addresses):
+    response = client.get("/addresses/list/?page_size=5&search=kolkata&sort_by=relevance")
+    assert response.status_code == 200
+    assert response.json()["meta"]["total"] > 5
+    assert response.json()["meta"]["next_cursor"] is None
+
+    # the next page is reached by number
+    assert client.get("/addresses/list/?page=2&page_size=5&search=kolkata&sort_by=relevance").status_code == 200
+
+
+@pytest.mark.parametrize("sort_by", ["grid_cell", "metadata", "__class__"])
+def test_unsortable_column_rejected(client, sort_by):
+    response = client.get(f"/addresses/list/?sort_by={sort_by}")
+    assert response.status_code == 400
+    assert "INVALID_SORT" in response.text
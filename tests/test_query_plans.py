@@ -0,0 +1,73 @@
+# tests/test_query_plans.py
+
+"""
+The query plan check (benchmarks/query_plans.py) as part of the suite.
+
+The full check runs in its own process, against a seeded database kept in
+the pytest cache so only the first run pays for seeding; QUERY_PLAN_ROWS
+sets its size. The plan classification is also tested on its own.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from app.database.base import Base
+from benchmarks.query_plans import MAX_WALK_OFFSET, accepted_reason, explain_sqlite
+
+ROOT = Path(__file__).resolve().parent.parent
+ROWS = int(os.getenv("QUERY_PLAN_ROWS", "100000"))
+
+
+def test_no_unaccepted_plan_problems(request, tmp_path):
+    database = request.config.cache.mkdir("query_plans") / f"bench_plans_{ROWS}.db"
+    report = tmp_path / "query_plans.json"
+
+    result = subprocess.run(
+        [
+            sys.executable, "-W", "ignore", "-m", "benchmarks.query_plans",
+            "--database", str(database), "--rows", str(ROWS), "--repeat", "1", "--output", str(report),
+        ],
+        cwd=ROOT, capture_output=True, text=True, timeout=600,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert json.loads(report.read_text())["regressions"] == {}
+
+
+@pytest.fixture(scope="module")
+def plan_conn():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.connect() as conn:
+        yield conn
+    engine.dispose()
+
+
+@pytest.mark.parametrize("statement, parameters, issues", [
+    # ordered index walk stopped by LIMIT
+    ("SELECT id FROM addresses ORDER BY name, id LIMIT ? OFFSET ?", (20, 0), []),
+    ("SELECT id FROM addresses ORDER BY name, id LIMIT ? OFFSET ?", (20, MAX_WALK_OFFSET), []),
+    # a deep OFFSET reads every skipped row
+    ("SELECT id FROM addresses ORDER BY name, id LIMIT ? OFFSET ?", (20, MAX_WALK_OFFSET + 1),
+     ["full_index_scan:addresses"]),
+    ("SELECT name FROM addresses ORDER BY id LIMIT ? OFFSET ?", (20, 50_000), ["full_scan:addresses"]),
+    # unconstrained index scan
+    ("SELECT count(*) FROM addresses", (), ["full_index_scan:addresses"]),
+    ("SELECT id FROM addresses WHERE name = ?", ("Home",), []),
+    # sorted without an index
+    ("SELECT id FROM addresses ORDER BY street || city LIMIT ?", (20,), ["full_scan:addresses", "temp_btree:ORDER BY"]),
+])
+def test_plan_issues(plan_conn, statement, parameters, issues):
+    _, found = explain_sqlite(plan_conn, statement, parameters)
+    assert sorted(found) == issues
+
+
+def test_accepted_by_case_name():
+    sql = "SELECT addresses.id FROM addresses WHERE addresses.id IN (SELECT rowid FROM addresses_fts) ORDER BY rank"
+    assert accepted_reason("sqlite", "list_search_relevance", "temp_btree:ORDER BY", sql)
+    assert accepted_reason("sqlite", "list_search_sort_name", "temp_btree:ORDER BY", sql) is None
@@ -0,0 +1,68 @@
+# tests/test_search.py
+
+"""
+`search` on the SQLite FTS5 index: every word is a token prefix and all
+words must match.
+"""
+
+import pytest
+
+
+ADDRESSES = [
+    ("Rahul Sharma", "Kolkata"),
+    ("New Town Office", "Kolkata"),
+    ("New Delhi Depot", "Delhi"),
+    ("Maria Lopez", "São Paulo"),
+    ("Kolhapur Store", "Pune"),
+]
+
+
+@pytest.fixture
+def names(client):
+    ids = client.post("/addresses/bulk", json=[
+        {"name": name, "street": "1 Park Street", "city": city, "latitude": 22.5, "longitude": 88.3}
+        for name, city in ADDRESSES
+    ]).json()["data"]["ids"]
+    return dict(zip(ids, (name for name, _ in ADDRESSES)))
+
+
+def search(client, term, **params):
+    response = client.get("/addresses/list/", params={"search": term, "page_size": 100, **params})
+    assert response.status_code == 200, response.json()
+    return [row["name"] for row in response.json()["data"]]
+
+
+@pytest.mark.parametrize("term, expected", [
+    ("kol", ["Rahul Sharma", "New Town Office", "Kolhapur Store"]),
+    ("KOLKATA", ["Rahul Sharma", "New Town Office"]),
+    ("new kol", ["New Town Office"]),
+    ("kol new", ["New Town Office"]),
+    ("new", ["New Town Office", "New Delhi Depot"]),
+    ("sao", ["Maria Lopez"]),
+    ("paulo maria", ["Maria Lopez"]),
+    ("olkata", []),
+    ("rahul mumbai", []),
+])
+def test_words_match_as_prefixes(client, names, term, expected):
+    assert search(client, term) == expected
+
+
+def test_count_matches_the_hits(client, names):
+    response = client.get("/addresses/list/", params={"search": "new kol", "include_total": "exact"})
+    assert response.json()["meta"]["total"] == 1
+
+
+def test_relevance_puts_better_matches_first(client, names):
+    client.post("/addresses/bulk", json=[
+        {"name": "Kolkata Kitchen", "street": "1 Park Street", "city": "Kolkata", "latitude": 22.5, "longitude": 88.3}
+    ])
+    # the term in both name and city outranks it in the city only
+    assert search(client, "kolkata", sort_by="relevance")[0] == "Kolkata Kitchen"
+    assert search(client, "kolkata", sort_by="name") == ["Kolkata Kitchen", "New Town Office", "Rahul Sharma"]
+
+
+def test_search_without_words_falls_back_to_substring(client, names):
+    client.post("/addresses/bulk", json=[
+        {"name": "Shop #12", "street": "1 Park Street", "city": "Pune", "latitude": 18.5, "longitude": 73.8}
+    ])
+    assert search(client, "#") == ["Shop #12"]